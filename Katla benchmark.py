@@ -0,0 +1,155 @@
+"""
+Katla benchmark - Plays every answer of a dictionary with KatlaSolver to compare solver strategies
+"""
+
+# importing modules need
+import importlib.util
+import os
+import numpy as np
+from argparse import ArgumentParser
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from random import Random
+from time import perf_counter
+# importing file components
+from components.katla_components.json_validator import WordsValidator
+from components.katla_components.constants import JsonData, Feedback, MAX_CHANGE_GUESS, MIN_CHANGE_GUESS
+from components.katla_components.patterns import PatternMatrix
+
+# importing KatlaSolver from "Katla solver.py" (the file name is not importable directly)
+_spec = importlib.util.spec_from_file_location('katla_solver', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Katla solver.py'))
+_katla_solver = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_katla_solver)
+
+KatlaSolver = _katla_solver.KatlaSolver
+
+STRATEGIES = ('entropy', 'expected', 'random')
+
+# worker state, set once per process by init_worker
+_worker: dict = {}
+
+# Attaching a worker process to the shared pattern matrix
+def init_worker(shm_name: str, shape: tuple[int, int], dtype: str, words: list[str], settings: dict, strategy: str, approximate: bool, opening: str) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    matrix = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    patterns = PatternMatrix(words, matrix)
+
+    _worker['shm'] = shm # keep the shared memory alive as long as the worker
+    _worker['solver'] = KatlaSolver('normal', settings=settings, patterns=patterns)
+    _worker['strategy'] = strategy
+    _worker['approximate'] = approximate
+    _worker['opening'] = opening
+    _worker['random'] = Random(os.getpid())
+    _worker['suggestions'] = {}
+
+# Playing one answer to completion, returns the number of guesses (0 if it's never found)
+def play(answer_id: int) -> int:
+    solver: KatlaSolver = _worker['solver']
+    patterns = solver.patterns
+    max_guesses = len(patterns.words)
+
+    path: tuple = ()
+
+    solver.reset(verbose=False)
+
+    for turn in range(1, max_guesses + 1):
+        if turn == 1 and _worker['strategy'] != 'random':
+            guess = _worker['opening']
+        elif _worker['strategy'] == 'random':
+            guess = patterns.words[_worker['random'].choice(solver.candidates)]
+        elif path in _worker['suggestions']:
+            guess = _worker['suggestions'][path]
+        else:
+            # the suggestion only depends on the feedbacks so far, early turns repeat a lot between answers
+            guess = _worker['suggestions'][path] = solver.suggest(_worker['strategy'], _worker['approximate'])
+
+        if guess == patterns.words[answer_id]:
+            return turn
+
+        code = int(patterns.row(guess)[answer_id])
+        path += ((guess, code),)
+        solver.add_feedback(Feedback(guess, code))
+
+        if len(solver.candidates) == 0:
+            return 0
+
+    return 0
+
+# Playing a chunk of answers
+def play_chunk(answer_ids: list[int]) -> list[int]:
+    return [play(answer_id) for answer_id in answer_ids]
+
+# Running the whole dictionary over a process pool
+def benchmark(lang_id: str, word_length: int, change_guess: int, strategy: str, approximate: bool, workers: int | None, limit: int | None, chunk_size: int) -> None:
+    words_list = WordsValidator(lang_id).get_words(word_length)
+    patterns = PatternMatrix.load(lang_id, words_list)
+
+    settings = JsonData.DEFAULT_SETTINGS | {'language-word': lang_id, 'word-length': word_length, 'change-guess': change_guess}
+    opening = patterns.best_guess(np.arange(len(words_list)), method='entropy' if strategy == 'random' else strategy, approximate=approximate)
+
+    answer_ids = list(range(len(words_list)))[:limit]
+    chunks = [answer_ids[i:i + chunk_size] for i in range(0, len(answer_ids), chunk_size)]
+
+    # sharing the pattern matrix with every worker without pickling it
+    shm = shared_memory.SharedMemory(create=True, size=max(patterns.matrix.nbytes, 1))
+
+    try:
+        np.ndarray(patterns.matrix.shape, dtype=patterns.matrix.dtype, buffer=shm.buf)[:] = patterns.matrix
+
+        print(f'KATLA BENCHMARK - {lang_id} length-{word_length}, change-guess {change_guess}, strategy {strategy}{" (approximate)" if approximate else ""}')
+        print(f'Answers: {len(answer_ids)}, opening: {opening}\n')
+
+        results: list[int] = []
+        start = perf_counter()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(shm.name, patterns.matrix.shape, patterns.matrix.dtype.str, words_list, settings, strategy, approximate, opening)
+        ) as executor:
+            futures = [executor.submit(play_chunk, chunk) for chunk in chunks]
+
+            for future in as_completed(futures):
+                results.extend(future.result())
+                print(f'\rPlayed {len(results)}/{len(answer_ids)}', end='', flush=True)
+
+        elapsed = perf_counter() - start
+
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Report
+    distribution = Counter(results)
+    solved = [guesses for guesses in results if 0 < guesses <= change_guess]
+    failed = len(results) - len(solved)
+
+    print('\n\nGuesses  Games')
+    for guesses in sorted(key for key in distribution if key > 0):
+        print(f'{guesses:>7}  {distribution[guesses]:>5}' + (' #' if guesses > change_guess else ''))
+    if distribution[0]:
+        print(f'{"never":>7}  {distribution[0]:>5}')
+
+    print()
+    print(f'Average guesses (solved) : {sum(solved) / len(solved) if solved else 0:.4f}')
+    print(f'Failure rate             : {failed / len(results) * 100 if results else 0:.2f}% ({failed} over {change_guess} guesses)')
+    print(f'Throughput               : {len(results) / elapsed if elapsed else 0:.2f} games/sec ({elapsed:.2f} sec)')
+
+# Run the benchmark if the script is executed directly
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Plays every answer of a Katla dictionary with KatlaSolver')
+    parser.add_argument('-l', '--lang', default=JsonData.DEFAULT_SETTINGS['language-word'], help='language word id (default: %(default)s)')
+    parser.add_argument('-n', '--length', type=int, default=JsonData.DEFAULT_SETTINGS['word-length'], help='word length (default: %(default)s)')
+    parser.add_argument('-g', '--change-guess', type=int, default=JsonData.DEFAULT_SETTINGS['change-guess'], help='guesses before a game is failed (default: %(default)s)')
+    parser.add_argument('-s', '--strategy', choices=STRATEGIES, default='entropy', help='next guess strategy (default: %(default)s)')
+    parser.add_argument('-a', '--approximate', action='store_true', help='use the approximate top-k ranking')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='worker processes (default: cpu count)')
+    parser.add_argument('--limit', type=int, default=None, help='only play the first LIMIT answers')
+    parser.add_argument('--chunk-size', type=int, default=64, help='answers per task (default: %(default)s)')
+    args = parser.parse_args()
+
+    if not MIN_CHANGE_GUESS <= args.change_guess <= MAX_CHANGE_GUESS(True):
+        parser.error(f'change-guess must be between {MIN_CHANGE_GUESS} and {MAX_CHANGE_GUESS(True)}')
+
+    benchmark(args.lang, args.length, args.change_guess, args.strategy, args.approximate, args.workers, args.limit, args.chunk_size)
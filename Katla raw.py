@@ -16,9 +16,8 @@ class Katla:
 
     def __init__(self, language: str = 'idn', word_length: int = 5, change_guess: int = 6) -> None:
 
-        # Initialize the WordsValidator to load and validate the dictionary
+        # Initialize the WordsValidator to load the compiled dictionary
         self.words_validator = WordsValidator(language)
-        self.dictionary = self.words_validator.load_and_validation()
 
         # Initialize game settings
         self.language = language
@@ -34,7 +33,8 @@ class Katla:
         }
 
         # Prepare the list of valid words from the dictionary
-        self.words_list = [word.upper() for word in self.dictionary[f'length-{self.word_length}']]
+        self.words_list = self.words_validator.get_words(self.word_length)
+        self.words_index = self.words_validator.get_index(self.word_length)
         self.keyboards_feedback_history = []
         self.guess_count = self.change_guess
         self.selected_word = random.choice(self.words_list)
@@ -57,49 +57,8 @@ class Katla:
         time.sleep(sleep)
 
     def get_feedback_colors(self, guess_word: str) -> const.Feedback:
-        feedback               = []
-        # Calculate the frequency of each character in the guess and the selected word
-        guess_char_frequency   = {char: guess_word.count(char) for char in set(guess_word)}
-        selected_char_frequecy = {char: self.selected_word.count(char) for char in set(self.selected_word)}
-
-        for i, char in enumerate(guess_word):
-
-            if char not in self.selected_word:
-                # Character is not in the selected word
-                feedback.append({char: "red"})
-
-            elif char == self.selected_word[i] and selected_char_frequecy[char] > 0:
-                # Character is in the correct position
-                feedback.append({char: "green"})
-                guess_char_frequency[char] -= 1
-                selected_char_frequecy[char] -= 1
-
-            elif char in self.selected_word and selected_char_frequecy[char] > 0 and guess_char_frequency[char] > 0:
-                # Character is in the word but in the wrong position
-                feedback.append({char: "yellow"})
-                selected_char_frequecy[char] -= 1
-
-            elif char == self.selected_word[i]:
-                # Character is in the correct position but already marked
-                for j, item in enumerate(feedback):
-                    if list(item.keys())[0] == char:
-                        if feedback[j][char] == "yellow":
-                            feedback.append({char: "green"})
-                            feedback[j][char] = "red"
-                            guess_char_frequency[char] -= 1
-                            selected_char_frequecy[char] -= 1
-                            break
-
-            elif char in self.selected_word:
-                # haracter is in the word but in the wrong position and already marked
-                for j, item in enumerate(feedback):
-                    if list(item.keys())[0] == char:
-                        if feedback[j][char] in ["green", "yellow"] and guess_char_frequency[char] > 0:
-                            feedback.append({char: "red"})
-                            guess_char_frequency[char] -= 1
-                            break
-
-        return feedback
+        # Score the guess against the selected word (greens first, then yellows)
+        return const.Feedback.from_guess(guess_word, self.selected_word)
 
     def showKeyboard(self) -> None:
         # Display the keyboard with color-coded feedback
@@ -109,12 +68,11 @@ class Katla:
 
         # Update keyboard feedback based on guess history
         for attempt_feedback in self.keyboards_feedback_history:
-            for item in attempt_feedback:
-                for char, color in item.items():
-                    if color in ['green', 'yellow', 'red']:
-                        if keyboard_feedback[char] == 'green' or (keyboard_feedback[char] == 'yellow' and color == 'red'):
-                            continue
-                        keyboard_feedback[char] = color
+            for char, color in attempt_feedback:
+                if color in ['green', 'yellow', 'red']:
+                    if keyboard_feedback[char] == 'green' or (keyboard_feedback[char] == 'yellow' and color == 'red'):
+                        continue
+                    keyboard_feedback[char] = color
 
         # Construct ASCII representation of the keyboard
         for ln, line in enumerate(layout_keyboard):
@@ -161,9 +119,8 @@ class Katla:
 
         # Display feedback for each guess
         for attempt_feedback in self.keyboards_feedback_history:
-            for char_feedback in attempt_feedback:
-                for char, color in char_feedback.items():
-                    word_ascii += f'{self.color_code[color]}{char}\033[0m'
+            for char, color in attempt_feedback:
+                word_ascii += f'{self.color_code[color]}{char}\033[0m'
             print(asciiTUI.justify(word_ascii, asciiTUI.terminal_size('x'), wrap=False))
             word_ascii = ''
 
@@ -209,7 +166,7 @@ class Katla:
                     continue
 
                 # Validate if guess is in dictionary
-                elif guess not in self.words_list:
+                elif guess not in self.words_index:
                     self.printinfo(f'\033[31m"{guess}" not found in dictionary\033[0m')
                     continue
 
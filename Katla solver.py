@@ -5,11 +5,12 @@ Katla solver - Logic concept of finding the right word in Kalta (support from ga
 # importing modules need
 from asciiTUI import justify
 from os import name, system
-from random import choice
 from time import sleep
+import numpy as np
 # importing file components
 from components.katla_components.json_validator import WordsValidator, SettingsValidator
 from components.katla_components.constants import Feedback
+from components.katla_components.patterns import PatternMatrix, RankMethod
 
 
 # help strings
@@ -59,8 +60,8 @@ else:
 # KatlaSolver class for solving the Katla game
 class KatlaSolver:
 
-    # Initializing the KatlaSolver class
-    def __init__(self, input_type: str = 'color') -> None:
+    # Initializing the KatlaSolver class, settings and patterns can be given directly (e.g. by the batch benchmark)
+    def __init__(self, input_type: str = 'color', settings: dict | None = None, patterns: PatternMatrix | None = None) -> None:
         # Setting the input type
         self.input_type = input_type
 
@@ -69,21 +70,44 @@ class KatlaSolver:
         self.upperfcolor = 'RYG'
 
         # Loading and validating settings
-        self.settings = SettingsValidator().load_and_validation()
+        self.settings = SettingsValidator().load_and_validation() if settings is None else settings
 
-        # Loading and validating word dictionary
-        self.validator_word_dictionary = WordsValidator(lang_id=self.settings['language-word'])
-        self.word_dictionary = self.validator_word_dictionary.load_and_validation(readonly=True)
-        self.words_list: list[str] = [word.upper() for word in self.word_dictionary[f"length-{self.settings['word-length']}"]]
+        if patterns is None:
+            # Loading and validating word dictionary
+            self.validator_word_dictionary = WordsValidator(lang_id=self.settings['language-word'])
+            self.words_list: list[str] = self.validator_word_dictionary.get_words(self.settings['word-length'])
+            self.words_index: frozenset[str] = self.validator_word_dictionary.get_index(self.settings['word-length'])
 
-        # Initializing feedback list and chosen word
+            # Loading (or building) the guess x answer pattern matrix
+            self.patterns = PatternMatrix.load(self.settings['language-word'], self.words_list)
+
+        else:
+            self.words_list: list[str] = patterns.words
+            self.words_index: frozenset[str] = frozenset(patterns.index)
+            self.patterns = patterns
+
+        # Initializing feedback list, surviving candidates (answer ids) with its undo stack and chosen word
         self.feedbacks: list[Feedback] = []
+        self.all_candidates = np.arange(len(self.words_list))
+        self.candidates = self.all_candidates
+        self.candidates_history: list[np.ndarray] = []
         self.choose_word = ''
 
     # Method to reset the feedbacks
-    def reset(self) -> None:
-        print('Feedback reseting...')
+    def reset(self, verbose: bool = True) -> None:
+        if verbose:
+            print('Feedback reseting...')
         self.feedbacks.clear()
+        self.candidates = self.all_candidates
+        self.candidates_history.clear()
+
+    # Method to remove the last feedback, the candidates before it are restored from the undo stack
+    def remove_last_feedback(self) -> list[str]:
+        if self.feedbacks:
+            self.feedbacks.pop()
+            self.candidates = self.candidates_history.pop()
+
+        return self.patterns.get_words(self.candidates)
 
     # Method to validate the format of the feedback string
     def validate_format(self, string: str) -> str | bool:
@@ -102,17 +126,18 @@ class KatlaSolver:
             word += item[0].upper()
 
         # Check if the word exists in the word list
-        if (word in self.words_list) or not self.settings['use-valid-word']:
+        if (word in self.words_index) or not self.settings['use-valid-word']:
             return True
 
         return f'The word "{word}" doesn\'t exist'
 
-    # Method to parse the feedback string into a list of dictionaries
+    # Method to parse the feedback string into a feedback
     def parse_format(self, vstring: str) -> Feedback:
         item_char = vstring.split(' ')
-        feedback = []
+        word = ''
+        colors = []
 
-        # Map each character and color to the feedback list
+        # Map each character and color to the feedback
         for item in item_char:
             splits = item.split('.')
             char = splits[0]
@@ -126,67 +151,29 @@ class KatlaSolver:
                 case 'G':
                     color = 'green'
 
-            feedback.append({char: color})
+            word += char
+            colors.append(color)
+
+        return Feedback.from_colors(word, colors)
 
-        return feedback
+    # Method to narrow the candidates by a feedback
+    def add_feedback(self, feedback: Feedback) -> None:
+        # The candidates only shrink, so narrow the surviving ones by the newest feedback only
+        self.feedbacks.append(feedback)
+        self.candidates_history.append(self.candidates)
+        self.candidates = self.patterns.filter(self.candidates, feedback)
 
     # Method to find possible words based on the feedback
     def find_possible_words(self, fstring: str) -> list[str]:
-        self.feedbacks.append(self.parse_format(fstring))
-        possible_words = self.words_list
-
-        # Filter words based on the feedback
-        for feedback in self.feedbacks:
-            possible_words = self.filter_words(possible_words, feedback)
-
-        return possible_words
-
-    # Method to filter words based on the feedback
-    def filter_words(self, words: list[str], feedback: Feedback) -> list[str]:
-        filtered_words = []
-
-        # Keep only valid words
-        for word in words:
-            if self.is_word_valid(word, feedback):
-                filtered_words.append(word)
-
-        return filtered_words
-
-    # Method to check if a word is valid based on the feedback
-    def is_word_valid(self, word: str, feedback: Feedback) -> bool:
-        word_char_frequency = {char: word.count(char) for char in set(word)}
-
-        # First pass to count how many greens and yellows per character
-        feedback_char_counts = {'green': {}, 'yellow': {}, 'red': {}}
-        for i, attempt_feedback in enumerate(feedback):
-            for char, color in attempt_feedback.items():
-                feedback_char_counts[color][char] = feedback_char_counts[color].get(char, 0) + 1
-
-        # Second pass to validate word
-        for i, attempt_feedback in enumerate(feedback):
-            for char, color in attempt_feedback.items():
-                if color == 'red':
-                    # Red: char should not be in the word, unless it's also yellow / green somewhere else
-                    if char == word[i] or (char in word and (feedback_char_counts['green'].get(char, 0) + feedback_char_counts['yellow'].get(char, 0) < word_char_frequency[char])):
-                        return False
-                elif color == 'green':
-                    # Green: char must be at the same position
-                    if word[i] != char:
-                        return False
-                    word_char_frequency[char] -= 1
-                elif color == 'yellow':
-                    # Yellow: char must be in the word but not at the same position
-                    if char not in word or word[i] == char:
-                        return False
-                    word_char_frequency[char] -= 1
-
-        # Third filter to ensure character frequencies match feedback
-        for char in feedback_char_counts['yellow'].keys():
-            if word_char_frequency.get(char, 0) < 0:
-                return False
-
-        # If it's safe, it means this word is passed
-        return True
+        self.add_feedback(self.parse_format(fstring))
+        return self.patterns.get_words(self.candidates)
+
+    # Method to suggest the next guess from the current candidates
+    def suggest(self, method: RankMethod = 'entropy', approximate: bool | None = None) -> str | None:
+        if approximate is None:
+            approximate = self.settings['word-length'] >= 8
+
+        return self.patterns.best_guess(self.candidates, method=method, approximate=approximate)
 
     # Method to display help information
     def help(self) -> None:
@@ -327,9 +314,13 @@ class KatlaSolver:
                 case '4':
                     self.settings = SettingsValidator().load_and_validation()
                     self.validator_word_dictionary = WordsValidator(lang_id=self.settings['language-word'])
-                    self.word_dictionary = self.validator_word_dictionary.load_and_validation(readonly=True)
-                    self.words_list: list[str] = [word.upper() for word in self.word_dictionary[f"length-{self.settings['word-length']}"]]
+                    self.words_list: list[str] = self.validator_word_dictionary.get_words(self.settings['word-length'])
+                    self.words_index: frozenset[str] = self.validator_word_dictionary.get_index(self.settings['word-length'])
+                    self.patterns = PatternMatrix.load(self.settings['language-word'], self.words_list)
                     self.feedbacks: list[Feedback] = []
+                    self.all_candidates = np.arange(len(self.words_list))
+                    self.candidates = self.all_candidates
+                    self.candidates_history: list[np.ndarray] = []
                     self.choose_word = ''
                     sleep(.5)
 
@@ -351,7 +342,7 @@ class KatlaSolver:
                             print('List possibilities: ', end='')
                             for word in possible_words:
                                 print(word, end=' ')
-                            self.choose_word = choice(possible_words)
+                            self.choose_word = self.suggest()
                             print('\nTry word:', self.choose_word)
 
                         elif len(possible_words) == 1:
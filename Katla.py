@@ -28,13 +28,19 @@ from pyuac import isUserAdmin, runAsAdmin
 from components.module.corrector import Correction
 from components.module.format_number import NumberFormat
 from components.module.pygameui.vgif import GIF
-from components.module.pygameui.scroller import ScrollerY
+from components.module.pygameui.scroller import ScrollerY, SCROLLER
 from components.module.pygameui.textwrap import wrap_text, render_wrap
+from components.module.pygameui.textcache import text_cache
 from components.module.pygameui.button import button_color, Button, Range, set_cursor_buttons
 from components.katla_components import constants as const
 from components.katla_components.logs import Logs
 from components.katla_components.popup import Popup, Notification
 from components.katla_components.json_validator import Languages, Themes, WordsValidator, SettingsValidator, GameDataValidator
+from components.katla_components.persistence import SaveWorker
+from components.katla_components.history import GameHistory
+from components.katla_components.profiler import FrameProfiler
+from components.katla_components.layout import Layout
+from components.katla_components.keyboard import VirtualKeyboard
 
 logs = Logs()
 
@@ -69,7 +75,10 @@ class Katla:
         self.validator_languages = Languages()
         self.validator_themes    = Themes()
         self.validator_settings  = SettingsValidator(logs)
-        self.validator_game_data = GameDataValidator(logs)
+        self.game_history        = GameHistory(logs)
+        self.validator_game_data = GameDataValidator(logs, self.game_history)
+        self.save_worker         = SaveWorker(logs, const.SAVE_DEBOUNCE)
+        self.profiler            = FrameProfiler(logs=logs)
 
         logs.log('Load and validation katla data')
         self.settings  = self.validator_settings .load_and_validation()
@@ -102,9 +111,8 @@ class Katla:
         logs.log(f'Initialization words, with id: {self.language_word}')
         self.validator_word_dictionary = WordsValidator(self.language_word)
 
-        logs.log('Load and validation words and load languages')
-        self.word_dictionary = self.validator_word_dictionary.load_and_validation()
-        self.languages       = self.validator_languages      .load(self.language)
+        logs.log('Load languages')
+        self.languages = self.validator_languages.load(self.language)
 
         logs.log('Load attributes')
         self.keyboards                : dict[str, const.KeyboardList] = {key: getattr(const.Keyboard, key) for key in const.Keyboard.__all__}
@@ -123,7 +131,13 @@ class Katla:
         self.play_lose_or_win         : int                           = 0
         self.last_win_line            : int                           = 0
         self.last_geomatry            : float                         = 0.0
-        self.words_list               : list[str]                     = [word.upper()  for word in self.word_dictionary[f'length-{self.word_length}']]
+        self.layout                   : Layout | None                 = None
+        self.full_redraw              : bool                          = True
+        self.dirty_rects              : list[pygame.Rect]             = []
+        self.round_start_time         : float                         = 0.0
+        self.round_hints              : int                           = 0
+        self.words_list               : list[str]                     = self.validator_word_dictionary.get_words(self.word_length)
+        self.words_index              : frozenset[str]                = self.validator_word_dictionary.get_index(self.word_length)
         self.correct_char_tile        : list[str]                     = ['not-inputed' for _ in range(self.word_length)]
         self.correct_char_keyboard    : list[str]                     = []
         self.notifications_layer      : list[str]                     = []
@@ -213,7 +227,14 @@ class Katla:
                 self.init_mixer = False
 
             logs.log('Load gif')
-            self.gif_win = GIF(gif_path=images.WIN_GIF, rect=self.confetti_rect, frame_delay=25)
+            self.gif_win = GIF(
+                gif_path    = images.WIN_GIF,
+                rect        = self.confetti_rect,
+                frame_delay = 25,
+                lazy        = True,
+                max_bytes   = const.GIF_CACHE_BYTES,
+                prefetch    = const.GIF_PREFETCH_FRAMES
+            )
 
             logs.log('Load images')
             self.image_close         = pygame.image.load(images.CLOSE)
@@ -252,18 +273,6 @@ class Katla:
             self.font_coins        = pygame.font.Font(self.file.FONT_ROBOTO_MEDIUM,     int(35 * self.geomatry))
 
             logs.log('Initialization Button')
-            self.buttonKeyboard = Button(
-                surface_screen = self.screen,
-                rect           = self.init_rect,
-                text_color     = self.single_color_button(self.themes['keyboard']['text']),
-                click_speed    = 0
-            )
-            self.buttonOutlineKeyboard = self.buttonKeyboard.copy(
-                color = button_color(
-                    self.themes['keyboard']['button']['outline']['inactive'],
-                    self.themes['keyboard']['button']['outline']['active']
-                )
-            )
             self.buttonHowToPlay = Button(
                 surface_screen = self.screen,
                 rect           = self.init_rect,
@@ -310,7 +319,8 @@ class Katla:
                 sizeload,
                 sizeload
             ),
-            frame_delay = 100
+            frame_delay = 100,
+            lazy        = True
         )
 
         self.clock = pygame.time.Clock()
@@ -368,8 +378,6 @@ class Katla:
             self.new_streak()
             self.set_volume()
 
-            self.threadgif = Thread(target=self.gif_win.convert_gif)
-
             self.last_time_save_game      = self.get_tick()
             self.last_time_reset          = self.get_tick()
             self.last_time_close_settings = self.get_tick()
@@ -393,13 +401,16 @@ class Katla:
         return self.__license__
 
     def reset(self) -> None:
+        self.full_redraw = True
+
         self.correct_char_keyboard    .clear()
         self.hint_keyboard            .clear()
         self.hint_tile                .clear()
         self.feedback_history         .clear()
         self.feedback_history_keyboard.clear()
 
-        self.words_list         = [word.upper()  for word in self.word_dictionary[f'length-{self.word_length}']]
+        self.words_list         = self.validator_word_dictionary.get_words(self.word_length)
+        self.words_index        = self.validator_word_dictionary.get_index(self.word_length)
         self.correct_char_tile  = ['not-inputed' for _ in range(self.word_length)]
         self.input_point        = [0, 0]
         self.input_history      = [[]]
@@ -407,6 +418,8 @@ class Katla:
         self.guess_count        = self.change_guess
         self.selected_word      = choice(self.words_list)
         self.corrector.database = self.words_list
+        self.round_start_time   = self.get_tick()
+        self.round_hints        = 0
 
         self.update_correct_tile()
         self.update_keyboard_feedback()
@@ -424,17 +437,16 @@ class Katla:
         self.keyboard_feedback = {char: 'not-inputed' for line in self.keyboards[self.keyboard_layout] for char in line}
 
         for attempt_feedback in self.feedback_history_keyboard:
-            for item in attempt_feedback:
-                for char, color in item.items():
-                    if self.keyboard_feedback[char] == 'green' or (self.keyboard_feedback[char] == 'yellow' and color == 'red') and char not in self.hint_keyboard:
-                        continue
-                    if char in self.hint_keyboard:
+            for char, color in attempt_feedback:
+                if self.keyboard_feedback[char] == 'green' or (self.keyboard_feedback[char] == 'yellow' and color == 'red') and char not in self.hint_keyboard:
+                    continue
+                if char in self.hint_keyboard:
+                    self.correct_char_keyboard.append(char)
+                    self.keyboard_feedback[char] = 'green'
+                else:
+                    if color == 'green':
                         self.correct_char_keyboard.append(char)
-                        self.keyboard_feedback[char] = 'green'
-                    else:
-                        if color == 'green':
-                            self.correct_char_keyboard.append(char)
-                        self.keyboard_feedback[char] = color
+                    self.keyboard_feedback[char] = color
 
         for char, color in self.keyboard_feedback.items():
             if color == 'not-inputed' and char in self.hint_keyboard:
@@ -443,52 +455,15 @@ class Katla:
                     self.correct_char_keyboard.append(char)
 
     def get_feedback_colors(self, guess_word: str) -> const.Feedback:
-        feedback               = []
-        guess_char_frequency   = {char: guess_word.count(char)         for char in set(guess_word)}
-        selected_char_frequecy = {char: self.selected_word.count(char) for char in set(self.selected_word)}
-
-        for i, char in enumerate(guess_word):
-
-            if char not in self.selected_word:
-                feedback.append({char: "red"})
-
-            elif char == self.selected_word[i] and selected_char_frequecy[char] > 0:
-                feedback.append({char: "green"})
-                guess_char_frequency[char]   -= 1
-                selected_char_frequecy[char] -= 1
-
-            elif char in self.selected_word and selected_char_frequecy[char] > 0 and guess_char_frequency[char] > 0:
-                feedback.append({char: "yellow"})
-                selected_char_frequecy[char] -= 1
-
-            elif char == self.selected_word[i]:
-                for j, item in enumerate(feedback):
-                    if list(item.keys())[0] == char:
-                        if feedback[j][char] == "yellow":
-                            feedback.append({char: "green"})
-                            feedback[j][char]             = "red"
-                            guess_char_frequency[char]   -= 1
-                            selected_char_frequecy[char] -= 1
-                            break
-
-            elif char in self.selected_word:
-                for j, item in enumerate(feedback):
-                    if list(item.keys())[0] == char:
-                        if feedback[j][char] in ("green", "yellow") and guess_char_frequency[char] > 0:
-                            feedback.append({char: "red"})
-                            guess_char_frequency[char] -= 1
-                            break
-
-        return feedback
+        return const.Feedback.from_guess(guess_word, self.selected_word)
 
     def get_correct_char(self) -> list[str | None]:
         correct_input = [self.hint_tile[i] if i < len(self.hint_tile) else None for i in range(self.word_length)]
 
         for attempt_feedback in self.feedback_history_keyboard:
-            for i, item in enumerate(attempt_feedback):
-                for char, color in item.items():
-                    if color == 'green':
-                        correct_input[i] = char
+            for i, (char, color) in enumerate(attempt_feedback):
+                if color == 'green':
+                    correct_input[i] = char
 
         return correct_input
 
@@ -577,6 +552,7 @@ class Katla:
         elif hint_coins_price:
             self.game_data['hint']['count'] += 1
             self.game_data['hint']['coins'] += hint_coins_price
+            self.round_hints                += 1
 
         if self.detect_time_manipulation():
             self.detected_time_cheat = True
@@ -584,10 +560,32 @@ class Katla:
         self.last_time_save_game = self.get_tick()
 
         if not self.detected_time_cheat:
-            self.validator_game_data.encrypt_data(self.game_data)
+            if win or lose:
+                self.game_history.add_game({
+                    'word':     self.selected_word,
+                    'length':   self.word_length,
+                    'language': self.language_word,
+                    'won':      bool(win),
+                    'guesses':  len(self.feedback_history),
+                    'codes':    [feedback.code for feedback in self.feedback_history],
+                    'hints':    self.round_hints,
+                    'duration': round(self.get_tick() - self.round_start_time, 2),
+                    'time':     self.get_datetime()
+                })
+
+            # appending to the journal is O(1), the game data snapshot is only rewritten when it's compacted
+            changed = self.game_history.add_state(self.game_data)
+
+            if self.game_history.needs_compaction(const.HISTORY_COMPACT):
+                self.save_worker.submit('game', self.compact_game_data, None)
+            elif changed or win or lose:
+                self.save_worker.submit('history', lambda _ : self.game_history.sync(), None)
         else:
             logs.log('Cannot save data. Please close the application and reopen it', 'warn')
 
+    def compact_game_data(self, _: None = None) -> None:
+        self.game_history.compact(self.validator_game_data.encrypt_data)
+
     def save_game_periodically(self) -> None:
         if self.last_time_save_game + const.AUTO_SAVE_INTERVAL < self.get_tick():
             self.save_game()
@@ -648,12 +646,14 @@ class Katla:
                 if self.fullscreen_attr['full']:
                     self.screen                  = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
                     self.settings['screen-size'] = 'FULL'
-                    self.validator_settings.encrypt_data(self.settings)
+                    self.save_worker.submit('settings', self.validator_settings.encrypt_data, self.settings)
+                    self.invalidate_layout()
 
                 else:
                     self.screen                  = pygame.display.set_mode(self.fullscreen_attr['last-size'], pygame.RESIZABLE)
                     self.settings['screen-size'] = self.fullscreen_attr['last-size']
-                    self.validator_settings.encrypt_data(self.settings)
+                    self.save_worker.submit('settings', self.validator_settings.encrypt_data, self.settings)
+                    self.invalidate_layout()
 
             elif key == pygame.K_TAB:
 
@@ -665,7 +665,8 @@ class Katla:
                     self.screen                       = pygame.display.set_mode(self.minsize_screen, pygame.RESIZABLE)
                     self.settings['screen-size']      = list(self.minsize_screen)
                     self.fullscreen_attr['last-size'] = self.settings['screen-size']
-                    self.validator_settings.encrypt_data(self.settings)
+                    self.save_worker.submit('settings', self.validator_settings.encrypt_data, self.settings)
+                    self.invalidate_layout()
 
         elif event.type == pygame.VIDEORESIZE and not self.fullscreen_attr['full']:
             x, y        = event.size
@@ -679,7 +680,8 @@ class Katla:
 
             self.settings['screen-size']      = screen_size
             self.fullscreen_attr['last-size'] = screen_size
-            self.validator_settings.encrypt_data(self.settings)
+            self.save_worker.submit('settings', self.validator_settings.encrypt_data, self.settings)
+            self.invalidate_layout()
 
     def handle_sound(self, stype: const.Literal['backsound', 'key', 'key-bn', 'click', 'win', 'lose'], do: const.Literal['play', 'stop']) -> None:
 
@@ -718,8 +720,12 @@ class Katla:
         ln     = self.input_point[1]
         len_ln = len(self.input_history[ln])
 
-        self.showKeyboard(char, True)
-        pygame.display.flip()
+        # the typed key is shown for a moment, only the keys that changed are drawn and updated
+        if self.show_keyboard:
+            keys = self.virtual_keyboard.update(self.keyboard_feedback, char, True)
+            self.showRegions(keys, char, True)
+            pygame.display.update(keys)
+
         pygame.time.delay(30)
 
         if char in const.ALL_KEY:
@@ -738,21 +744,21 @@ class Katla:
             if len_ln == self.word_length:
                 guess_word = ''.join(self.input_history[ln])
 
-                if guess_word in self.words_list or not self.use_valid_word:
+                if guess_word in self.words_index or not self.use_valid_word:
                     feedback = self.get_feedback_colors(guess_word)
 
                     self.input_history            .append([])
                     self.feedback_history         .append(feedback)
                     self.feedback_history_keyboard.append(feedback)
 
-                    for i, attempt_feedback in enumerate(feedback):
-                        if list(attempt_feedback.values())[0] == 'green' and i > len(self.hint_tile) - 1:
-                            self.hint_tile.append(list(attempt_feedback.keys())[0])
+                    for i, (char, color) in enumerate(feedback):
+                        if color == 'green' and i > len(self.hint_tile) - 1:
+                            self.hint_tile.append(char)
                         elif i > len(self.hint_tile) - 1:
                             break
 
-                    if guess_word in self.corrector.database:
-                        self.corrector.database.remove(guess_word)
+                    if guess_word in self.corrector:
+                        self.corrector.remove(guess_word)
 
                     self.input_point[0]  = 0
                     self.input_point[1] += 1
@@ -761,7 +767,7 @@ class Katla:
 
                 else:
                     if self.word_corrector:
-                        list_correct = self.corrector.get_list_correct(guess_word)
+                        list_correct = self.corrector.get_list_correct(guess_word, const.CORRECTOR_LIMIT)
                         self.search_correct = ''
                         if list_correct:
                             self.search_correct = choice(list_correct)
@@ -799,6 +805,11 @@ class Katla:
 
         self.update_correct_tile()
 
+        # the rows of the tiles the input changed, the keys are found by the keyboard itself
+        for row in {ln, self.input_point[1]}:
+            if row < self.change_guess:
+                self.dirty_rects.append(self.get_layout().row_rect(row, self.scroller_tile.offset_y))
+
     def handle_popup(self, shortcut_key: str | None, can_inputed: bool) -> None:
         if self.file_game_corrupt and not self.isshow_popup_warn[0]:
             WLANG = self.languages['popup']['errors']['data-game']
@@ -887,10 +898,9 @@ class Katla:
                         ln = self.input_point[1]
 
                         for attempt_feedback in self.feedback_history:
-                            for i, item in enumerate(attempt_feedback):
-                                for char, color in item.items():
-                                    if color == 'green' and i == len(self.hint_tile):
-                                        self.hint_tile.append(char)
+                            for i, (char, color) in enumerate(attempt_feedback):
+                                if color == 'green' and i == len(self.hint_tile):
+                                    self.hint_tile.append(char)
 
                         letter = self.selected_word[len(self.hint_tile) if len(self.hint_tile) < self.word_length - 1 else -1]
 
@@ -987,6 +997,12 @@ class Katla:
             self.showSettings()
             self.last_time_close_settings = self.get_tick()
 
+        else:
+            return
+
+        # the popups and the actions above change the whole screen
+        self.full_redraw = True
+
     def handle_notification(self) -> None:
         LANG = self.languages['notification']
 
@@ -1098,6 +1114,7 @@ class Katla:
             button_ok = button_ok
         )
         self.popup()
+        self.full_redraw = True
 
     def show_not_enough_coin_popup(self) -> None:
         LANG_NOT_ENOUGH_COIN = self.languages['popup']['not-enough-coin']
@@ -1126,98 +1143,42 @@ class Katla:
         ))
 
     def showKeyboard(self, letter_typing: const.Optional[str] = None, justshow: bool = False, letter_hovered: const.Optional[str] = None) -> tuple[bool, str | None, bool]:
-        sizescreen     = self.screen.get_size()
-        margin         = 10 * self.geomatry
-        marginlr       = 40 * self.geomatry
-        buttonSize     = (50 * self.geomatry, 70 * self.geomatry)
-        inputDetected  = (False, None, False)
-        max_buttonkey  = ((10 * buttonSize[0] + margin * 9), (3 * buttonSize[1] + margin * 2))
-        keyboards      = self.keyboards[self.keyboard_layout]
-
-        self.boardRect_keyboard = pygame.Rect(
-            (sizescreen[0] - marginlr - max_buttonkey[0]) / 2,
-            (sizescreen[1] - marginlr - max_buttonkey[1]) - 60 * self.geomatry,
-            marginlr + max_buttonkey[0],
-            marginlr + max_buttonkey[1]
-        )
+        layout        = self.get_layout()
+        inputDetected = (False, None, False)
 
         if self.show_keyboard:
-            img_backspace = pygame.transform.scale(self.image_backspace, ((buttonSize[0] + buttonSize[0] / 2) / 1.8, buttonSize[1] / 2))
-            img_enter     = pygame.transform.scale(self.image_enter,     img_backspace.get_size())
-            mousePos      = pygame.mouse.get_pos()
+            hovered = self.virtual_keyboard.draw(self.screen, self.keyboard_feedback, letter_typing, justshow)
 
-            backspace_and_enter_left_pos = {
-                const.BACKSPACE: marginlr / 2,
-                const.ENTER    : self.boardRect_keyboard.width - marginlr / 2 - (buttonSize[0] + buttonSize[0] / 2 + margin / 2)
-            }
-
-            pygame.draw.rect(self.screen, self.themes['keyboard']['background'], self.boardRect_keyboard)
-
-            for row, line in enumerate(keyboards):
-                for col, letter in enumerate(line):
-
-                    keyboards_row_length = len(keyboards[row])
-
-                    keyRect = pygame.Rect(
-                        self.boardRect_keyboard.left + (const.math.get_center(self.boardRect_keyboard.width,  (keyboards_row_length * buttonSize[0] + margin * (keyboards_row_length - 1))) + (col * (buttonSize[0] + margin)) if letter not in const.ALL_KEY else backspace_and_enter_left_pos[letter]),
-                        self.boardRect_keyboard.top  +  const.math.get_center(self.boardRect_keyboard.height, max_buttonkey[1]) + (row * (buttonSize[1] + margin)),
-                        buttonSize[0] + buttonSize[0] / 2 + margin / 2 if letter in const.ALL_KEY else buttonSize[0],
-                        buttonSize[1]
-                    )
-
-                    color       = self.keyboard_feedback[letter.upper()]
-                    isMouseOver = keyRect.collidepoint(mousePos)
-                    button_keyboard_color = button_color(
-                        inactive_color = self.themes['keyboard']['button'][color]['inactive'],
-                        active_color   = self.themes['keyboard']['button'][color]['active'],
-                        hover_color    = self.themes['keyboard']['button'][color]['hover']
-                    )
+            if hovered is not None:
+                letter = layout.keys[hovered][0]
 
-                    self.buttonOutlineKeyboard.rect = const.math.Rect_outline(keyRect, 4 * self.geomatry)
+                if letter == letter_hovered:
+                    inputDetected = (False, None, True)
 
-                    self.buttonKeyboard.rect  = keyRect
-                    self.buttonKeyboard.text  = letter if letter not in const.ALL_KEY else ''
-                    self.buttonKeyboard.font  = self.font_keyboard
-                    self.buttonKeyboard.color = button_keyboard_color
+                if pygame.mouse.get_pressed()[0]:
+                    inputDetected = (True, letter, inputDetected[2])
 
-                    if letter_typing == letter:
-                        self.buttonOutlineKeyboard.draw_active()
-
-                    if isMouseOver and not justshow:
-                        self.buttonOutlineKeyboard.draw_active()
-                        self.buttonKeyboard       .draw_and_update()
-
-                        if letter == letter_hovered:
-                            inputDetected = (False, None, self.buttonKeyboard.button_event.ismousehover)
-
-                        if self.buttonKeyboard.button_event.click:
-                            inputDetected = (True, letter, inputDetected[2])
+        return inputDetected
 
-                    else:
-                        if letter_typing != letter:
-                            self.buttonOutlineKeyboard.draw_inactive()
+    def showRegions(self, rects: list[pygame.Rect], letter_typing: const.Optional[str] = None, justshow: bool = False, letter_hovered: const.Optional[str] = None) -> None:
+        """ draw the main screen again inside of `rects` only, without the bar menu (its buttons are updated once a frame) """
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.screen.fill(self.themes['screen'])
+            self.showTile    ()
+            self.showKeyboard(letter_typing, justshow, letter_hovered)
+            self.showTextBar ()
 
-                        self.buttonKeyboard.draw_inactive()
+            self.handle_notification()
 
-                    if letter == const.BACKSPACE:
-                        self.screen.blit(img_backspace, img_backspace.get_rect(center=keyRect.center))
-                    elif letter == const.ENTER:
-                        self.screen.blit(img_enter,     img_enter    .get_rect(center=keyRect.center))
-
-        return inputDetected
+        self.screen.set_clip(None)
 
     def showTile(self, justshow: bool = False, tile_point_preview: bool = False) -> None:
-        wscreen = self.screen.get_width()
-
-        self.margin_tile = 10 * self.geomatry
-        self.size_tile   = 80 * self.geomatry
+        layout = self.get_layout()
+        origin = layout.tile_origin(self.scroller_tile.offset_y)
 
-        if self.word_length * self.size_tile + self.margin_tile * (self.word_length - 1) > wscreen - self.margin_tile * 2:
-            self.size_tile = (wscreen - self.margin_tile) / self.word_length - self.margin_tile
-
-        if self.last_size_tile != self.size_tile:
-            self.font_tile      = pygame.font.Font(self.file.FONT_BAKSOSAPI_REGULAR, int(self.size_tile))
-            self.last_size_tile = self.size_tile
+        # the empty tiles are on the board background, only the other tiles are drawn over it
+        self.screen.blit(self.board_surface, origin)
 
         for row in range(self.change_guess):
             for col in range(self.word_length):
@@ -1236,17 +1197,15 @@ class Katla:
                 if row <= len(self.feedback_history) - 1:
                     ln = self.feedback_history[row]
                     if col <= len(ln) - 1:
-                        color = list(ln[col].values())[0]
+                        color = ln.colors[col]
 
                 if row == self.input_point[1]:
                     color = self.correct_char_tile[col]
 
-                tile_rect = pygame.Rect(
-                    (wscreen - self.word_length * (self.size_tile + self.margin_tile) + self.margin_tile) / 2 + col * (self.size_tile + self.margin_tile),
-                    self.scroller_tile.offset_y + (row * (self.size_tile + self.margin_tile)),
-                    self.size_tile,
-                    self.size_tile
-                )
+                if letter is None and color == 'not-inputed' and not pointed:
+                    continue
+
+                tile_rect = layout.tiles[row][col].move(origin)
 
                 if tile_point_preview:
                     outline_color = self.themes['tile']['box']['outline']['point-active' if pointed else 'point-inactive']
@@ -1255,44 +1214,86 @@ class Katla:
                     outline_color = self.themes['tile']['box']['outline']['point-active' if pointed and tile_active and blinked else 'point-inactive']
                     tile_color    = self.themes['tile']['box']['pointed' if pointed and tile_active and color == 'not-inputed' else color]
 
-                pygame.draw.rect(self.screen, outline_color, const.math.Rect_outline(tile_rect, 4 * self.geomatry))
+                pygame.draw.rect(self.screen, outline_color, layout.outline_tiles[row][col].move(origin))
                 pygame.draw.rect(self.screen, tile_color,    tile_rect)
 
                 if letter is not None:
-                    showLetter = self.font_tile.render(letter, True, self.themes['tile']['text'])
+                    showLetter = text_cache.render(self.font_tile, letter, True, self.themes['tile']['text'])
                     self.screen.blit(showLetter, showLetter.get_rect(center=tile_rect.center))
 
+    def get_tile_rect(self, col: int, row: int) -> pygame.Rect:
+        return self.get_layout().tile_rect(col, row, self.scroller_tile.offset_y)
+
+    def get_layout(self) -> Layout:
+        """ layout of the main screen, it's built again with the board background when the screen, settings or theme change """
+        sizescreen = self.screen.get_size()
+        key        = (sizescreen, self.geomatry, self.word_length, self.change_guess, self.keyboard_layout, self.show_keyboard, self.theme)
+
+        if self.layout is not None and self.layout.key == key:
+            return self.layout
+
+        layout = self.layout = Layout(key, sizescreen, self.geomatry, self.word_length, self.change_guess, self.keyboards[self.keyboard_layout], self.show_keyboard)
+
+        self.margin_tile        = layout.margin_tile
+        self.size_tile          = layout.size_tile
+        self.boardRect_keyboard = layout.board_keyboard
+        self.full_redraw        = True
+
+        if self.last_size_tile != self.size_tile:
+            text_cache.clear(self.font_tile)
+            self.font_tile      = pygame.font.Font(self.file.FONT_BAKSOSAPI_REGULAR, int(self.size_tile))
+            self.last_size_tile = self.size_tile
+
+        self.board_surface = pygame.Surface(layout.board_size, pygame.SRCALPHA)
+
+        for outline_rows, tile_rows in zip(layout.outline_tiles, layout.tiles):
+            for outline_rect, tile_rect in zip(outline_rows, tile_rows):
+                pygame.draw.rect(self.board_surface, self.themes['tile']['box']['outline']['point-inactive'], outline_rect)
+                pygame.draw.rect(self.board_surface, self.themes['tile']['box']['not-inputed'],               tile_rect)
+
+        self.image_key_backspace = pygame.transform.scale(self.image_backspace, layout.image_key)
+        self.image_key_enter     = pygame.transform.scale(self.image_enter,     self.image_key_backspace.get_size())
+        self.virtual_keyboard    = VirtualKeyboard(layout, self.themes['keyboard'], self.font_keyboard, self.image_key_backspace, self.image_key_enter)
+
+        return layout
+
+    def invalidate_layout(self) -> None:
+        self.layout = None
+
+    def get_render_state(self) -> tuple:
+        """ what the main loop draws that can change without an event, a different state redraws the whole screen """
+        return (
+            self.screen.get_size(),
+            self.scroller_tile.offset_y,
+            self.coins,
+            self.get_daily_countdown() is True
+        )
+
+    def get_notification_rect(self) -> pygame.Rect | None:
+        """ the band of the screen the sliding notifications move in, None if none of them slides """
+        bottom = max((
+            notification.target_pos_y + notification.notif_rect.height + 6 * self.geomatry
+            for notification in self.notifications.values()
+            if notification.notif_rect is not None and notification.is_sliding()
+        ), default=None)
+
+        if bottom is None:
+            return None
+
+        return pygame.Rect(0, 0, self.screen.get_width(), bottom + 1)
+
     def showBarMenu(self, justshow: bool = False) -> None:
-        wscreen = self.screen.get_width()
-
-        barTop_rect    = pygame.Rect(const.math.get_center(wscreen, (wscreen - 10 * self.geomatry)), 5 * self.geomatry,                      wscreen - 10 * self.geomatry, 60 * self.geomatry)
-        barBottom_rect = pygame.Rect(barTop_rect.left,                                               barTop_rect.bottom + 5 * self.geomatry, barTop_rect.width,            50 * self.geomatry)
-
-        size_button_and_icon_top    = barTop_rect.height    - 10 * self.geomatry
-        size_button_and_icon_bottom = barBottom_rect.height - 10 * self.geomatry
-
-        button_howToPlay_rect       = pygame.Rect(barTop_rect.left           + 10 * self.geomatry,                               barTop_rect.top + const.math.get_center(barTop_rect.height, size_button_and_icon_top),          size_button_and_icon_top,    size_button_and_icon_top)
-        button_stats_rect           = pygame.Rect(button_howToPlay_rect.left + size_button_and_icon_top + 10 * self.geomatry,    barTop_rect.top + const.math.get_center(barTop_rect.height, size_button_and_icon_top),          size_button_and_icon_top,    size_button_and_icon_top)
-        button_settings_rect        = pygame.Rect(barTop_rect.right          - size_button_and_icon_top - 10 * self.geomatry,    barTop_rect.top + const.math.get_center(barTop_rect.height, size_button_and_icon_top),          size_button_and_icon_top,    size_button_and_icon_top)
-        button_reset_rect           = pygame.Rect(button_settings_rect.left  - size_button_and_icon_top - 10 * self.geomatry,    barTop_rect.top + const.math.get_center(barTop_rect.height, size_button_and_icon_top),          size_button_and_icon_top,    size_button_and_icon_top)
-        button_auto_write_rect      = pygame.Rect(button_reset_rect.left     - size_button_and_icon_top - 10 * self.geomatry,    barTop_rect.top + const.math.get_center(barTop_rect.height, size_button_and_icon_top),          size_button_and_icon_top,    size_button_and_icon_top)
-        button_bag_coin_rect        = pygame.Rect(barBottom_rect.left        + 10 * self.geomatry,                               barBottom_rect.top + const.math.get_center(barBottom_rect.height, size_button_and_icon_bottom), size_button_and_icon_bottom, size_button_and_icon_bottom)
-        button_hammer_rect          = pygame.Rect(barTop_rect.right          - size_button_and_icon_bottom - 10 * self.geomatry, barBottom_rect.top + const.math.get_center(barBottom_rect.height, size_button_and_icon_bottom), size_button_and_icon_bottom, size_button_and_icon_bottom)
-        button_keyboard_rect        = pygame.Rect(button_hammer_rect.left    - size_button_and_icon_bottom - 20 * self.geomatry, barBottom_rect.top + const.math.get_center(barBottom_rect.height, size_button_and_icon_bottom), size_button_and_icon_bottom, size_button_and_icon_bottom)
-        button_lamp_rect            = pygame.Rect(button_keyboard_rect.left  - size_button_and_icon_bottom - 20 * self.geomatry, barBottom_rect.top + const.math.get_center(barBottom_rect.height, size_button_and_icon_bottom), size_button_and_icon_bottom, size_button_and_icon_bottom)
-
-        if not self.show_keyboard:
-            button_lamp_rect = button_keyboard_rect
-
-        self.buttonHowToPlay   .rect = button_howToPlay_rect
-        self.buttonDailyCoins  .rect = button_bag_coin_rect
-        self.buttonStats       .rect = button_stats_rect
-        self.buttonAutoWrite   .rect = button_auto_write_rect
-        self.buttonReset       .rect = button_reset_rect
-        self.buttonSettings    .rect = button_settings_rect
-        self.buttonLetterHint  .rect = button_lamp_rect
-        self.buttonKeyboardHint.rect = button_keyboard_rect
-        self.buttonDeletedEntry.rect = button_hammer_rect
+        layout = self.get_layout()
+
+        self.buttonHowToPlay   .rect = layout.bar['how-to-play']
+        self.buttonDailyCoins  .rect = layout.bar['bag-coin']
+        self.buttonStats       .rect = layout.bar['stats']
+        self.buttonAutoWrite   .rect = layout.bar['auto-write']
+        self.buttonReset       .rect = layout.bar['reset']
+        self.buttonSettings    .rect = layout.bar['settings']
+        self.buttonLetterHint  .rect = layout.bar['lamp']
+        self.buttonKeyboardHint.rect = layout.bar['keyboard']
+        self.buttonDeletedEntry.rect = layout.bar['hammer']
 
         if self.last_geomatry != self.geomatry:
             self.buttonHowToPlay   .image_scale = 2.5 * self.geomatry
@@ -1307,8 +1308,8 @@ class Katla:
             if self.show_keyboard:
                 self.buttonKeyboardHint.image_scale = self.buttonHowToPlay.image_scale
 
-        pygame.draw.rect(self.screen, self.themes['bar-menu']['background'], barTop_rect)
-        pygame.draw.rect(self.screen, self.themes['bar-menu']['background'], barBottom_rect)
+        pygame.draw.rect(self.screen, self.themes['bar-menu']['background'], layout.bar_top)
+        pygame.draw.rect(self.screen, self.themes['bar-menu']['background'], layout.bar_bottom)
 
         if not justshow:
             self.buttonHowToPlay   .draw_and_update()
@@ -1337,19 +1338,22 @@ class Katla:
                 self.buttonKeyboardHint.draw_inactive()
 
         if self.get_daily_countdown() is True:
-            pygame.draw.circle(self.screen, self.themes['bar-menu']['indicator'], (button_bag_coin_rect.right, button_bag_coin_rect.top), radius=7 * self.geomatry)
+            pygame.draw.circle(self.screen, self.themes['bar-menu']['indicator'], (layout.bar['bag-coin'].right, layout.bar['bag-coin'].top), radius=7 * self.geomatry)
 
-        showKatla = self.font_katla.render(f'KATLA #{self.word_length}',      True, self.themes['bar-menu']['text'])
-        showCoins = self.font_coins.render(self.num_format.parse(self.coins), True, self.themes['bar-menu']['text'])
+        showKatla = text_cache.render(self.font_katla, f'KATLA #{self.word_length}',      True, self.themes['bar-menu']['text'])
+        showCoins = text_cache.render(self.font_coins, self.num_format.parse(self.coins), True, self.themes['bar-menu']['text'])
 
-        showKatla_rect = showKatla.get_rect(center=barTop_rect.center)
+        showKatla_rect = showKatla.get_rect(center=layout.bar_top.center)
+        bag_coin_rect  = layout.bar['bag-coin']
 
-        if button_stats_rect.right < showKatla_rect.left and button_auto_write_rect.left > showKatla_rect.right:
+        if layout.bar['stats'].right < showKatla_rect.left and layout.bar['auto-write'].left > showKatla_rect.right:
             self.screen.blit(showKatla, showKatla_rect)
 
-        self.screen.blit(showCoins, (button_bag_coin_rect.right + 20 * self.geomatry, button_bag_coin_rect.top + const.math.get_center(button_bag_coin_rect.height, showCoins.get_height())))
+        self.screen.blit(showCoins, (bag_coin_rect.right + 20 * self.geomatry, bag_coin_rect.top + const.math.get_center(bag_coin_rect.height, showCoins.get_height())))
 
     def showFreezeKatla(self, tile_point_preview: bool = False) -> None:
+        self.get_layout()
+
         self.scroller_tile.min_max_scrolled = (-((self.size_tile + self.margin_tile) * (self.change_guess - 1) - self.margin_tile / 2), self.screen.get_height() - (self.size_tile + self.margin_tile / 2))
 
         self.scroller_tile.update(anchor=True)
@@ -2108,6 +2112,9 @@ class Katla:
                     self.num_format = NumberFormat(self.languages['exponents-number'], decimal_places=2, rounded=False, reach=(3, 'thousand'))
                     nfgeomatry      = NumberFormat(self.languages['exponents-number'], decimal_places=1, rounded=False, anchor_decimal_places=True, reach=(3, 'thousand'))
 
+                    # the cached text surfaces belong to the old fonts and theme colors
+                    text_cache.clear()
+
                     self.font_textbar      = pygame.font.Font(self.file.FONT_ROBOTO_MEDIUM,     int(20 * self.geomatry))
                     self.font_keyboard     = pygame.font.Font(self.file.FONT_BAKSOSAPI_REGULAR, int(35 * self.geomatry))
                     self.font_katla        = pygame.font.Font(self.file.FONT_ROBOTO_BOLD,       int(40 * self.geomatry))
@@ -2136,6 +2143,9 @@ class Katla:
                     self.image_right_arrow   = pygame.image.load(images.RIGHT_ARROW)
                     self.image_check         = pygame.image.load(images.CHECK)
 
+                    # the board background and the keyboard images are built again with the new theme
+                    self.invalidate_layout()
+
                     buttonClose.edit_param(image=self.image_close)
                     buttonLang .edit_param(
                         font          = label_font,
@@ -2180,19 +2190,6 @@ class Katla:
                     update_wrap_license()
 
                     surface_title = font_title.render(LANG['title'], True, self.themes['settings']['text'])
-                    self.buttonKeyboard = Button(
-                        surface_screen = self.screen,
-                        rect           = self.buttonKeyboard.rect,
-                        text_color     = self.single_color_button(self.themes['keyboard']['text']),
-                        click_speed    = 0,
-                    )
-                    self.buttonOutlineKeyboard = self.buttonKeyboard.copy(
-                        color = button_color(
-                            self.themes['keyboard']['button']['outline']['inactive'],
-                            self.themes['keyboard']['button']['outline']['active'],
-                            'black'
-                        )
-                    )
                     self.buttonHowToPlay = Button(
                         surface_screen = self.screen,
                         rect           = self.buttonHowToPlay.rect,
@@ -2262,7 +2259,6 @@ class Katla:
 
                 if last_configuration[9] != index_lang_word:
                     self.validator_word_dictionary = WordsValidator(language_word)
-                    self.word_dictionary           = self.validator_word_dictionary.load_and_validation()
 
                 if [change_guess, word_length, index_lang_word, use_valid_word, word_corrector] != [last_configuration[4], last_configuration[5], last_configuration[9], last_configuration[10], last_configuration[12]]:
                     self.reset()
@@ -2275,7 +2271,7 @@ class Katla:
             self.clock.tick(self.fps)
 
         if first_configuration != last_configuration:
-            self.validator_settings.encrypt_data(self.settings)
+            self.save_worker.submit('settings', self.validator_settings.encrypt_data, self.settings)
 
     def Appmainloop(self) -> None:
         last_time_backspace = self.get_tick()
@@ -2286,11 +2282,22 @@ class Katla:
         mouse_up          = False
         in_keyboard_rect  = True
         last_letter       = None
+        last_render_state = None
+        last_tile_blink   = None
+        last_time_event   = self.get_tick()
+
+        last_mouse_pos         = pygame.mouse.get_pos()
+        last_mouse_pressed     = False
+        last_notification_rect = None
+
+        self.full_redraw = True
 
         self.handle_sound('backsound', 'play')
 
         while self.running:
 
+            self.profiler.frame()
+
             keyboard_letter = None
             shortcut_key    = None
             can_inputed     = not (
@@ -2302,9 +2309,14 @@ class Katla:
             sizescreen = self.screen.get_size  ()
             mouse_pos  = pygame.mouse.get_pos  ()
             getkeys    = pygame.key.get_pressed()
+            events     = False
 
             for event in pygame.event.get():
 
+                # the scroller sends its event every update, a scroll is seen by the render state
+                if event.type != SCROLLER:
+                    events = True
+
                 if event.type == pygame.QUIT:
                     self.running = False
 
@@ -2316,6 +2328,12 @@ class Katla:
                     if event.button == 1:
                         mouse_up = True
 
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_F3:
+                        self.profiler.toggle()
+                    elif event.key == pygame.K_F4:
+                        self.profiler.dump()
+
                 self.handle_screen_resize(event)
 
                 self.scroller_tile.handle_event(event)
@@ -2337,16 +2355,11 @@ class Katla:
                 elif getinput and typeinput == 'shortcut':
                     shortcut_key = getinput
 
-            barTop_rect = pygame.Rect(
-                const.math.get_center(sizescreen[0], sizescreen[0] - 10 * self.geomatry),
-                5 * self.geomatry,
-                sizescreen[0] - 10 * self.geomatry,
-                115 * self.geomatry
-            )
+            layout = self.get_layout()
 
             self.scroller_tile.min_max_scrolled = (-((self.size_tile + self.margin_tile) * (self.change_guess - 1) - self.margin_tile / 2), sizescreen[1] - (self.size_tile + self.margin_tile / 2))
 
-            self.scroller_tile.update(anchor_drag=(self.boardRect_keyboard.collidepoint(mouse_pos) if self.show_keyboard else False) or barTop_rect.collidepoint(mouse_pos))
+            self.scroller_tile.update(anchor_drag=(self.boardRect_keyboard.collidepoint(mouse_pos) if self.show_keyboard else False) or layout.bar_drag.collidepoint(mouse_pos))
 
             set_cursor_buttons(
                 self.buttonHowToPlay,
@@ -2362,30 +2375,139 @@ class Katla:
                 inactive_cursor = pygame.SYSTEM_CURSOR_ARROW
             )
 
-            self.screen.fill(self.themes['screen'])
+            if events:
+                last_time_event = self.get_tick()
 
-            self.showTile   ()
-            self.showBarMenu()
-            click_detected, keyboard_visual_letter, letter_hovered = self.showKeyboard(letter_hovered=last_letter)
-            self.showTextBar()
+            render_state      = self.get_render_state()
+            tile_blink        = int(self.get_tick() * 2) % 2
+            mouse_pressed     = any(pygame.mouse.get_pressed())
+            notification_rect = self.get_notification_rect()
 
-            self.handle_notification()
-            self.handle_popup       (shortcut_key, can_inputed)
+            # the whole screen is drawn when all of it may have changed (and while the profiler measures it), otherwise
+            # only the dirty regions are drawn
+            if (
+                not const.IDLE_RENDER or
+                self.full_redraw or
+                render_state != last_render_state or
+                self.notifications['Win'].is_visible or
+                self.notifications['Lose'].is_visible or
+                self.profiler.enabled
+            ):
+                self.full_redraw  = False
+                last_render_state = render_state
+                last_tile_blink   = tile_blink
 
-            self.save_game_periodically()
+                self.dirty_rects.clear()
 
-            if self.last_geomatry != self.geomatry and not self.threadgif.is_alive():
-                size                      = 500 * self.geomatry
-                self.last_geomatry        = self.geomatry
-                self.confetti_rect.width  = size
-                self.confetti_rect.height = size
+                self.screen.fill(self.themes['screen'])
 
-                self.threadgif = Thread(target=self.gif_win.convert_gif)
-                self.threadgif.start()
+                self.profiler.lap('events')
 
-            pygame.display.flip()
+                self.showTile   ()
+                self.profiler.lap('tile')
+                self.showBarMenu()
+                self.profiler.lap('bar-menu')
+                click_detected, keyboard_visual_letter, letter_hovered = self.showKeyboard(letter_hovered=last_letter)
+                self.profiler.lap('keyboard')
+                self.showTextBar()
+                self.profiler.lap('text-bar')
 
-            self.clock.tick(self.fps)
+                self.handle_notification()
+                self.profiler.lap('notification')
+                self.handle_popup       (shortcut_key, can_inputed)
+                self.profiler.lap('popup')
+
+                self.save_game_periodically()
+                self.profiler.lap('save')
+
+                # the win gif decodes its frames in the new size when they're shown
+                if self.last_geomatry != self.geomatry:
+                    size                      = 500 * self.geomatry
+                    self.last_geomatry        = self.geomatry
+                    self.confetti_rect.width  = size
+                    self.confetti_rect.height = size
+
+                self.profiler.draw(self.screen, self.fps)
+
+                pygame.display.flip()
+                self.profiler.lap('flip')
+
+                self.clock.tick(self.fps)
+                self.profiler.lap('tick')
+
+            else:
+                dirty            = self.dirty_rects
+                self.dirty_rects = []
+
+                # the keys whose feedback, hover or press changed
+                if self.show_keyboard:
+                    dirty += self.virtual_keyboard.update(self.keyboard_feedback)
+
+                # the blinking tile and the FPS of the text bar
+                if tile_blink != last_tile_blink:
+                    last_tile_blink = tile_blink
+
+                    if self.input_point[1] < self.change_guess:
+                        dirty.append(const.math.Rect_outline(self.get_tile_rect(*self.input_point), 4 * self.geomatry))
+
+                    dirty.append(pygame.Rect(0, layout.board_keyboard.bottom, sizescreen[0], sizescreen[1] - layout.board_keyboard.bottom))
+
+                # the sliding notifications, and where they were the last frame
+                dirty += [rect for rect in (notification_rect, last_notification_rect) if rect is not None]
+
+                # the buttons of the bar menu while the mouse is on them
+                if (
+                    (layout.bar_area.collidepoint(mouse_pos) or layout.bar_area.collidepoint(last_mouse_pos)) and
+                    (mouse_pos != last_mouse_pos or mouse_pressed or last_mouse_pressed)
+                ):
+                    dirty.append(layout.bar_area)
+
+                # a region over the bar menu takes all of it, the bar menu is only drawn once a frame
+                if layout.bar_area.collidelist(dirty) != -1:
+                    dirty.append(layout.bar_area)
+
+                regions    = const.math.merge_rects(dirty)
+                index      = layout.bar_area.collidelist(regions)
+                bar_region = regions.pop(index) if index != -1 else None
+
+                if regions or bar_region is not None or events or mouse_pressed:
+                    # the first pass updates the buttons, the keyboard and the notifications even without a region to draw
+                    self.screen.set_clip(self.init_rect if bar_region is None else bar_region)
+                    self.screen.fill(self.themes['screen'])
+                    self.showTile   ()
+                    self.showBarMenu()
+                    click_detected, keyboard_visual_letter, letter_hovered = self.showKeyboard(letter_hovered=last_letter)
+                    self.showTextBar()
+                    self.handle_notification()
+                    self.screen.set_clip(None)
+
+                    self.showRegions(regions, letter_hovered=last_letter)
+
+                    self.handle_popup(shortcut_key, can_inputed)
+
+                else:
+                    click_detected, keyboard_visual_letter, letter_hovered = False, None, False
+
+                self.save_game_periodically()
+
+                if bar_region is not None:
+                    regions.append(bar_region)
+
+                if regions:
+                    pygame.display.update(regions)
+
+                self.clock.tick(self.fps if (
+                    regions or
+                    last_time_event + const.IDLE_DELAY > self.get_tick() or
+                    getkeys[pygame.K_BACKSPACE] or
+                    mouse_pressed or
+                    pressed_backspace or
+                    pressed_key
+                ) else const.IDLE_FPS)
+
+            last_mouse_pos         = mouse_pos
+            last_mouse_pressed     = mouse_pressed
+            last_notification_rect = notification_rect
 
             get_k_backspace = getkeys[pygame.K_BACKSPACE]
 
@@ -2432,6 +2554,8 @@ class Katla:
                 mouse_up         = False
 
         self.save_game()
+        self.save_worker.submit('game', self.compact_game_data, None)
+        self.save_worker.close()
         pygame.quit()
 
 MAIN_RETURNS = const.Literal[-2, -1, 0, 1]
@@ -2456,6 +2580,7 @@ def main() -> MAIN_RETURNS:
             katla.Appmainloop()
             return 0
 
+        katla.save_worker.close()
         return 1
 
     except PermissionError:
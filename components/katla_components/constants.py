@@ -5,6 +5,7 @@ Katla constants
 from time import sleep
 from typing import Any, Literal, Optional
 from .logs import Logs
+from .feedback import Feedback
 from ..module.resource_path import resource_path, os
 
 # versions
@@ -58,6 +59,15 @@ PRICE_KEYBOARD_HINT = lambda WORD_LENGTH : 20 if WORD_LENGTH >= 8 else 25
 PRICE_DEL_ENTRY     = lambda WORD_LENGTH : 15 if WORD_LENGTH >= 8 else 10
 
 AUTO_SAVE_INTERVAL  = 15
+SAVE_DEBOUNCE       = 0.25
+HISTORY_COMPACT     = 32 # state records before the game data snapshot is rewritten
+CORRECTOR_LIMIT     = 5 # most similar words the word corrector picks a suggestion from
+PROFILER_FRAMES     = 600 # frames kept by the profiler
+IDLE_RENDER         = True # only redraw the dirty regions of the screen
+IDLE_FPS            = 20 # loop rate while nothing changes
+IDLE_DELAY          = 1 # seconds at the full loop rate after the last event
+GIF_CACHE_BYTES     = 64 * 1024 * 1024 # frames of the win gif kept in memory (bytes)
+GIF_PREFETCH_FRAMES = 4 # frames of the win gif decoded ahead on a worker thread
 POST_SETTINGS_DELAY = 0.5
 RESET_DELAY         = 0.5
 
@@ -68,7 +78,6 @@ ALL_KEY   = (BACKSPACE, ENTER)
 HELLO = "Hello World!"
 
 Number       = int | float
-Feedback     = list[dict[str, Literal['red', 'yellow', 'green']]]
 KeyboardList = list[list[str]]
 Path         = os.PathLike[str]
 inf          = float('inf')
@@ -84,6 +93,23 @@ def mkdir_data(message: str, logs: Optional[Logs] = None) -> None:
 
         os.mkdir(f.DIR_DATA)
 
+def backup_path(path: str) -> str:
+    return path + '.bak'
+
+def write_atomic(path: str, data: bytes, backup: bool = False) -> None:
+    """ write `data` to a temporary file, fsync it, then replace `path`. With `backup` the replaced file is kept as the last good backup """
+    temppath = path + '.tmp'
+
+    with open(temppath, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    if backup and os.path.exists(path):
+        os.replace(path, backup_path(path))
+
+    os.replace(temppath, path)
+
 def test_permissions(logs: Logs) -> tuple[dict[str, bool | None], Exception | None]:
     mkdir_data('katla-data not found when testing permissions', logs)
 
@@ -245,6 +271,10 @@ class File:
         self.DIR_DATA                  = 'katla-data'
         self.SETTINGS: Path            = self.DIR_DATA + '/settings.katla'
         self.GAME: Path                = self.DIR_DATA + '/game.katla'
+        self.HISTORY: Path             = self.DIR_DATA + '/history.katla'
+        self.DIR_CACHE                 = self.DIR_DATA + '/cache'
+        self.CACHE                     = lambda file : self.DIR_CACHE + '/' + file
+        self.STATE: Path               = self.DIR_DATA + '/state.katla'
         self.FONT_BAKSOSAPI_REGULAR    = resource_path('assets/fonts/bakso_sapi/regular.otf')
         self.FONT_ROBOTO_MEDIUM        = resource_path('assets/fonts/roboto/medium.ttf')
         self.FONT_ROBOTO_BOLD          = resource_path('assets/fonts/roboto/bold.ttf')
@@ -310,6 +340,22 @@ class _Math:
 
         return self.Rect(rect.left - size_outline, rect.top - size_outline, rect.width + size_outline * 2, rect.height + size_outline * 2)
 
+    def merge_rects(self, rects: list) -> list:
+        """ merge the overlapping rects (pygame.Rect) into their union until none of them overlap """
+        merged = []
+
+        for rect in rects:
+            rect  = rect.copy()
+            index = rect.collidelist(merged)
+
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        return merged
+
     def get_center(self, width_surface: Number, width_object: Number) -> Number:
         """ Formula : (width_surface - width_object) / 2 """
         return (width_surface - width_object) / 2
@@ -321,4 +367,24 @@ class _Math:
 
 math = _Math()
 
-del _Math
\ No newline at end of file
+del _Math
+
+__all__ = [
+    # re-exported
+    'Any', 'Literal', 'Optional', 'Logs', 'Feedback', 'os',
+    # versions
+    'MAJOR', 'MINOR', 'PATCH', 'LABEL', 'VERSION', 'LICENSE', 'RUNSYS',
+    # limits
+    'MAX_SCREEN_X', 'MAX_SCREEN_Y', 'MAX_SOUND', 'MAX_MUSIC', 'MAX_WORD_LENGTH', 'MAX_CHANGE_GUESS', 'MAX_GEOMATRY', 'MAX_FPS',
+    'MIN_SCREEN_X', 'MIN_SCREEN_Y', 'MIN_SOUND', 'MIN_MUSIC', 'MIN_WORD_LENGTH', 'MIN_CHANGE_GUESS', 'MIN_GEOMATRY', 'MIN_FPS',
+    'STEP_SOUND', 'STEP_MUSIC', 'STEP_FPS',
+    # game
+    'DAILY_COINS', 'WIN_COINS_REWAND', 'PRICE_LETTER_HINT', 'PRICE_KEYBOARD_HINT', 'PRICE_DEL_ENTRY',
+    'AUTO_SAVE_INTERVAL', 'SAVE_DEBOUNCE', 'HISTORY_COMPACT', 'CORRECTOR_LIMIT', 'PROFILER_FRAMES', 'IDLE_RENDER', 'IDLE_FPS',
+    'IDLE_DELAY', 'GIF_CACHE_BYTES', 'GIF_PREFETCH_FRAMES', 'POST_SETTINGS_DELAY', 'RESET_DELAY',
+    'BACKSPACE', 'ENTER', 'ALL_KEY', 'HELLO',
+    # types and values
+    'Number', 'KeyboardList', 'Path', 'inf', 'nan',
+    # functions and classes
+    'mkdir_data', 'backup_path', 'write_atomic', 'test_permissions', 'Keyboard', 'JsonData', 'File', 'math'
+]
\ No newline at end of file
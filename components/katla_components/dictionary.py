@@ -0,0 +1,232 @@
+"""
+Katla compiled dictionary.
+
+A words JSON file (`{"length-N": [...], ...}`) compiled to a binary file next to it. Every `length-N` is one block
+of fixed width uppercase ASCII records, the header holds the word length, count, offset and crc32 of every block
+plus the size and modification time of the source JSON. The file is opened with `mmap` so only the blocks of the
+selected lengths are read, and a block is checked with its crc32 instead of parsing the JSON again.
+
+The words lists and indexes are shared by every dictionary of the process with `dictionaries` (LRU cache).
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from string import ascii_letters
+from threading import Lock
+from typing import Callable
+from .constants import Logs
+
+_logs = Logs()
+
+MAGIC   = b'KTLW'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHQQ') # magic, version, blocks, source size, source mtime (ns)
+BLOCK  = struct.Struct('<HHIQI')  # word length, reserved, words, offset, crc32
+
+_LETTERS = frozenset(ascii_letters)
+
+def compile_words(datajson: dict[str, list[str]], source_size: int = 0, source_mtime: int = 0) -> bytes:
+    """ compile a words JSON object to the binary dictionary format, words of the wrong length or with non ASCII letters are skipped """
+    blocks  = []
+    records = []
+    offset  = HEADER.size
+
+    for length_word, words_list in datajson.items():
+        if not length_word.startswith('length-') or not length_word[7:].isdigit():
+            continue
+
+        length = int(length_word[7:])
+        blocks.append(length)
+        records.append(''.join(word.upper() for word in words_list if len(word) == length and _LETTERS.issuperset(word)).encode('ascii'))
+
+    offset += BLOCK.size * len(blocks)
+    table   = b''
+
+    for length, data in zip(blocks, records):
+        table  += BLOCK.pack(length, 0, len(data) // length, offset, zlib.crc32(data))
+        offset += len(data)
+
+    return HEADER.pack(MAGIC, VERSION, len(blocks), source_size, source_mtime) + table + b''.join(records)
+
+class CompiledDictionary:
+
+    """
+    CompiledDictionary
+    ------------------
+    Memory mapped words dictionary, compiled from `source_path` (the words JSON) when the binary file is missing,
+    outdated or broken. When the binary file cannot be written the compiled dictionary is only kept in memory.
+    """
+
+    def __init__(self, source_path: str, load_source: Callable[[], dict[str, list[str]]], logs: Logs | None = None) -> None:
+        """
+        `source_path`: Words JSON file path.
+        `load_source`: Returns the parsed words JSON, only called when the dictionary must be compiled.
+        """
+        self.source_path = source_path
+        self.path        = os.path.splitext(source_path)[0] + '.bin'
+        self.load_source = load_source
+        self.logs        = _logs if logs is None else logs
+        self.file        = None
+        self.buffer      = None
+        self.blocks      = {}
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        if self.file is not None:
+            self.file.close()
+
+        self.file   = None
+        self.buffer = None
+        self.blocks = {}
+
+    def source_stat(self) -> tuple[int, int]:
+        try:
+            stat = os.stat(self.source_path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return 0, 0
+
+    def read_header(self, buffer: mmap.mmap | bytes) -> dict[int, tuple[int, int, int]] | None:
+        """ blocks of a compiled dictionary, None if the header is invalid or the source JSON changed """
+        if len(buffer) < HEADER.size:
+            return None
+
+        magic, version, count, source_size, source_mtime = HEADER.unpack_from(buffer, 0)
+
+        if magic != MAGIC or version != VERSION or (source_size, source_mtime) != self.source_stat():
+            return None
+
+        if len(buffer) < HEADER.size + count * BLOCK.size:
+            return None
+
+        blocks = {}
+
+        for i in range(count):
+            length, _, words, offset, crc = BLOCK.unpack_from(buffer, HEADER.size + i * BLOCK.size)
+            if offset + words * length > len(buffer):
+                return None
+            blocks[length] = (offset, words, crc)
+
+        return blocks
+
+    def open(self) -> None:
+        self.close()
+
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+                self.file   = open(self.path, 'rb')
+                self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.blocks = self.read_header(self.buffer)
+
+                if self.blocks is not None:
+                    return
+
+        except (OSError, ValueError) as e:
+            self.logs.log(f'compiled dictionary: {type(e).__name__}: {e}', 'error')
+
+        self.build()
+
+    def build(self) -> None:
+        self.close()
+        self.logs.log(f'Compiling dictionary "{os.path.basename(self.source_path)}"')
+
+        data = compile_words(self.load_source(), *self.source_stat())
+
+        try:
+            with open(self.path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(self.path + '.tmp', self.path)
+
+        except OSError as e:
+            self.logs.log(f'compiled dictionary - write: Cannot save dictionary: {type(e).__name__}: {e}', 'warn')
+
+        self.buffer = data
+        self.blocks = self.read_header(data) or {}
+
+    def lengths(self) -> list[int]:
+        if self.buffer is None:
+            self.open()
+        return sorted(self.blocks)
+
+    def get_words(self, length: int) -> list[str]:
+        """ uppercase words of `length` (the `length-N` of the JSON), read from the block every call (`dictionaries` keeps them) """
+        if self.buffer is None:
+            self.open()
+
+        if length not in self.blocks:
+            raise KeyError(f'length-{length}')
+
+        offset, words, crc = self.blocks[length]
+        data               = self.buffer[offset:offset + words * length]
+
+        if zlib.crc32(data) != crc:
+            self.logs.log(f'compiled dictionary: length-{length}: Checksum mismatch', 'warn')
+            self.build()
+            offset, words, _ = self.blocks[length]
+            data             = self.buffer[offset:offset + words * length]
+
+        text = data.decode('ascii')
+
+        return [text[i:i + length] for i in range(0, len(text), length)]
+
+class DictionaryCache:
+
+    """
+    DictionaryCache
+    ---------------
+    Process wide LRU cache of the words lists and indexes keyed by (lang_id, length). An entry is dropped when the
+    source JSON changed (size and modification time), the least recently used entries are dropped over `maxwords`.
+    """
+
+    def __init__(self, maxwords: int = 200_000) -> None:
+        self.maxwords = maxwords
+        self.words    = 0
+        self.entries  : OrderedDict[tuple[str, int], tuple[tuple[int, int], list[str], frozenset[str]]] = OrderedDict()
+        self.lock     = Lock()
+
+    def get(self, lang_id: str, length: int, dictionary: CompiledDictionary) -> tuple[list[str], frozenset[str]]:
+        """ words list and index of `length`, loaded from `dictionary` when they are not cached """
+        key   = (lang_id, length)
+        stamp = dictionary.source_stat()
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and entry[0] == stamp:
+                self.entries.move_to_end(key)
+                return entry[1], entry[2]
+
+            if entry is not None:
+                # the source changed, the compiled dictionary is checked again
+                self.pop(key)
+                dictionary.open()
+
+            words = dictionary.get_words(length)
+            index = frozenset(words)
+
+            self.entries[key] = (stamp, words, index)
+            self.words       += len(words)
+
+            while self.words > self.maxwords and len(self.entries) > 1:
+                self.pop(next(iter(self.entries)))
+
+        return words, index
+
+    def pop(self, key: tuple[str, int]) -> None:
+        _, words, _ = self.entries.pop(key)
+        self.words -= len(words)
+
+    def invalidate(self, lang_id: str | None = None) -> None:
+        with self.lock:
+            for key in [key for key in self.entries if lang_id is None or key[0] == lang_id]:
+                self.pop(key)
+
+dictionaries = DictionaryCache()
@@ -0,0 +1,102 @@
+"""
+Katla feedback.
+
+A feedback is the guess word plus its colors packed as a base-3 integer code
+(red = 0, yellow = 1, green = 2, position `i` weighted by `3 ** i`).
+"""
+
+from functools import lru_cache
+from typing import Iterable, Iterator, Literal
+
+Color = Literal['red', 'yellow', 'green']
+
+RED    = 0
+YELLOW = 1
+GREEN  = 2
+
+COLORS: tuple[Color, Color, Color] = ('red', 'yellow', 'green')
+CODES:  dict[Color, int]           = {color: code for code, color in enumerate(COLORS)}
+
+def encode_colors(colors: Iterable[Color]) -> int:
+    """ encode colors ('red', 'yellow', 'green') per position into a pattern code """
+    code = 0
+    for i, color in enumerate(colors):
+        code += CODES[color] * 3 ** i
+    return code
+
+def decode_colors(code: int, word_length: int) -> tuple[Color, ...]:
+    """ decode a pattern code into colors per position """
+    colors = []
+    for _ in range(word_length):
+        code, digit = divmod(code, 3)
+        colors.append(COLORS[digit])
+    return tuple(colors)
+
+@lru_cache(maxsize=4096)
+def score(guess: str, answer: str) -> int:
+    """ pattern code of `guess` against `answer`, greens first then yellows against the remaining letters """
+    remaining: dict[str, int] = {}
+    code  = 0
+    power = 1
+
+    for guess_char, answer_char in zip(guess, answer):
+        if guess_char == answer_char:
+            code += GREEN * power
+        else:
+            remaining[answer_char] = remaining.get(answer_char, 0) + 1
+        power *= 3
+
+    power = 1
+
+    for guess_char, answer_char in zip(guess, answer):
+        if guess_char != answer_char and remaining.get(guess_char, 0) > 0:
+            remaining[guess_char] -= 1
+            code += YELLOW * power
+        power *= 3
+
+    return code
+
+class Feedback:
+
+    """
+    Feedback
+    --------
+    Compact feedback of a guess word. `word` and `code` identify it (hash and equality),
+    `colors` is decoded once so every position is an O(1) lookup.
+    """
+
+    __slots__ = ('word', 'code', 'colors')
+
+    def __init__(self, word: str, code: int) -> None:
+        self.word   = word
+        self.code   = code
+        self.colors = decode_colors(code, len(word))
+
+    @classmethod
+    def from_guess(cls, guess: str, answer: str) -> 'Feedback':
+        return cls(guess, score(guess, answer))
+
+    @classmethod
+    def from_colors(cls, word: str, colors: Iterable[Color]) -> 'Feedback':
+        return cls(word, encode_colors(colors))
+
+    def __repr__(self) -> str:
+        return f'Feedback(word={self.word!r}, code={self.code!r})'
+
+    def __len__(self) -> int:
+        return len(self.word)
+
+    def __getitem__(self, index: int) -> tuple[str, Color]:
+        return self.word[index], self.colors[index]
+
+    def __iter__(self) -> Iterator[tuple[str, Color]]:
+        return zip(self.word, self.colors)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Feedback):
+            return NotImplemented
+        return self.word == other.word and self.code == other.code
+
+    def __hash__(self) -> int:
+        return hash((self.word, self.code))
+
@@ -0,0 +1,179 @@
+"""
+Katla game history.
+
+Two append-only journals of length-prefixed (uint32 little endian), Fernet encrypted JSON records:
+- `katla-data/history.katla`: `game` records, one finished game (word, length, language, won, guesses, feedback
+  codes, hints, duration, time). It is never rewritten.
+- `katla-data/state.katla`: `state` records, snapshots of the game data, the last one is newer than `game.katla`.
+
+A save appends a state record only when the game data changed. Compaction writes the latest state to `game.katla`
+(the snapshot) and truncates the state journal, the games are left where they are.
+"""
+
+import os
+import struct
+from copy import deepcopy
+from threading import RLock
+from typing import Any, Callable
+from ..module.jsonfl import json, _fernet
+from .constants import File, Logs, mkdir_data
+
+_file = File()
+_logs = Logs()
+
+LENGTH = struct.Struct('<I')
+
+GameRecord = dict[str, Any]
+
+class GameHistory:
+
+    """
+    GameHistory
+    -----------
+    Append-only encrypted journals of the finished games and the game data state
+    """
+
+    def __init__(self, logs: Logs | None = None) -> None:
+        self.key           = b'r9cXd-NfeJCx3ypRjwaFr6H8ldPNne7lx5839PhNvKY='
+        self.fernet        = _fernet.Fernet(self.key)
+        self.logs          = _logs if logs is None else logs
+        self.lock          = RLock()
+        self.games         = 0 # the games are only kept as the totals of the summary
+        self.won           = 0
+        self.won_guesses   = 0
+        self.duration      = 0.0
+        self.state         : dict[str, Any] | None = None
+        self.pending       : list[dict[str, Any]]  = [] # the newest state record, encoded when it's appended
+        self.pending_games : list[bytes]           = []
+        self.appended      = 0 # state records appended since the last compaction
+        self.md            = lambda : mkdir_data(f'directory "{_file.DIR_DATA}" doesn\'t exists', self.logs)
+        self.load(_file.HISTORY)
+        self.load(_file.STATE)
+
+    def encode(self, record: dict[str, Any]) -> bytes:
+        token = self.fernet.encrypt(json.dumps(record).encode())
+        return LENGTH.pack(len(token)) + token
+
+    def load(self, path: str) -> None:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.logs.log(f'history data: {type(e).__name__}: {e}', 'error')
+            return
+
+        offset = 0
+
+        while offset < len(data):
+            try:
+                size, = LENGTH.unpack_from(data, offset)
+                if offset + LENGTH.size + size > len(data):
+                    raise ValueError('Truncated record')
+                record = json.loads(self.fernet.decrypt(data[offset + LENGTH.size:offset + LENGTH.size + size]).decode())
+            except Exception as e:
+                self.logs.log(f'history data: {type(e).__name__}: {e}. The broken records are dropped', 'warn')
+                break
+
+            self.read_record(record)
+            offset += LENGTH.size + size
+
+        # a crash in the middle of an append leaves a broken tail, the next appends go after the last good record
+        if offset < len(data):
+            try:
+                os.truncate(path, offset)
+            except OSError as e:
+                self.logs.log(f'history data - write: Cannot truncate: {type(e).__name__}: {e}', 'error')
+
+    def read_record(self, record: dict[str, Any]) -> None:
+        match record.get('type'):
+
+            case 'game':
+                self.count_game(record)
+
+            case 'state':
+                self.state     = record['data']
+                self.appended += 1
+
+    def count_game(self, record: GameRecord) -> None:
+        self.games    += 1
+        self.duration += record['duration']
+        if record['won']:
+            self.won         += 1
+            self.won_guesses += record['guesses']
+
+    def add_game(self, record: GameRecord) -> None:
+        with self.lock:
+            record = {'type': 'game'} | record
+            self.count_game(record)
+            self.pending_games.append(self.encode(record))
+
+    def add_state(self, data: dict[str, Any]) -> bool:
+        """ the latest state is kept in memory now, the pending older state is replaced. Returns False when `data` didn't change """
+        with self.lock:
+            if data == self.state:
+                return False
+
+            self.state   = deepcopy(data)
+            self.pending = [{'type': 'state', 'data': self.state}]
+            return True
+
+    def needs_compaction(self, interval: int) -> bool:
+        return self.appended + len(self.pending) >= interval
+
+    def sync(self) -> None:
+        """ append the pending records to the journals """
+        with self.lock:
+            if not self.pending and not self.pending_games:
+                return
+
+            self.md()
+
+            try:
+                if self.pending_games:
+                    with open(_file.HISTORY, 'ab') as f:
+                        f.write(b''.join(self.pending_games))
+                    self.pending_games.clear()
+
+                if self.pending:
+                    with open(_file.STATE, 'ab') as f:
+                        f.write(b''.join(self.encode(record) for record in self.pending))
+                    self.appended += len(self.pending)
+                    self.pending.clear()
+
+            except Exception as e:
+                self.logs.log(f'history data - write: Cannot append: {type(e).__name__}: {e}', 'error')
+
+    def compact(self, write_snapshot: Callable[[dict[str, Any]], bool]) -> None:
+        """
+        write the latest state as the game data snapshot with `write_snapshot`, then truncate the state journal.
+        The journal keeps the state when `write_snapshot` returns False.
+        """
+        with self.lock:
+            if self.state is not None and not write_snapshot(deepcopy(self.state)):
+                self.sync()
+                return
+
+            self.md()
+
+            try:
+                with open(_file.STATE, 'wb'):
+                    pass
+            except Exception as e:
+                self.logs.log(f'history data - write: Cannot compact: {type(e).__name__}: {e}', 'error')
+                self.sync()
+                return
+
+            self.appended = 0
+            self.pending.clear()
+            self.sync()
+
+    def summary(self) -> dict[str, float]:
+        """ average guesses of the won games and average duration (seconds) of every game """
+        with self.lock:
+            return {
+                'games':            self.games,
+                'average-guesses':  self.won_guesses / self.won   if self.won   else 0,
+                'average-duration': self.duration    / self.games if self.games else 0
+            }
@@ -2,98 +2,162 @@
 Katla JSON Validator.
 
 classes:
+- AssetRegistry
 - Languages
+- Themes
 - WordsValidator
 - SettingsValidator
 - GameDataValidator
+
+The settings and the game data are checked by the compiled schemas `SETTINGS_SCHEMA` and `GAME_DATA_SCHEMA`.
 """
 
+import os
 from string import ascii_lowercase, ascii_uppercase
 from random import shuffle
+from copy import deepcopy
 from ..module.jsonfl import Json, json, _fernet, JsonObj
 from .katla_crypt import KatlaEncryptor
+from .dictionary import CompiledDictionary, dictionaries
+from .normalizer import normalize_words
+from .history import GameHistory
+from .schema import Schema, Choice, Range, Date, Size, Repair
 from .constants import (
     MIN_SCREEN_X, MIN_SCREEN_Y, MIN_SOUND, MIN_MUSIC, MIN_CHANGE_GUESS, MIN_WORD_LENGTH, MIN_FPS, MIN_GEOMATRY,
     MAX_SCREEN_X, MAX_SCREEN_Y, MAX_SOUND, MAX_MUSIC, MAX_CHANGE_GUESS, MAX_WORD_LENGTH, MAX_FPS, MAX_GEOMATRY,
     STEP_FPS,
-    Keyboard, File, Logs, JsonData, mkdir_data
+    Keyboard, File, Logs, JsonData, mkdir_data, backup_path, write_atomic
 )
 
 _file = File()
 _logs = Logs()
 
+class AssetRegistry:
+
+    """
+    AssetRegistry
+    -------------
+    Process wide cache of the JSON assets (languages, themes and the words index), every file is parsed at most once.
+    The id and name queries only read the small index files, never the words payloads.
+    """
+
+    def __init__(self) -> None:
+        self.cache: dict[str, JsonObj] = {}
+
+    def load(self, path: str) -> JsonObj:
+        if path not in self.cache:
+            self.cache[path] = Json(path, JsonData.DATA_LOST).load_write()
+        return self.cache[path]
+
+    def invalidate(self, path: str | None = None) -> None:
+        if path is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(path, None)
+
+    def get_ids(self, path: str) -> list[str]:
+        return [item['id'] for item in self.load(path)]
+
+    def get_names(self, path: str) -> list[str]:
+        return [item['name'] for item in self.load(path)]
+
+    def find(self, path: str, item_id: str) -> dict[str, JsonObj] | None:
+        for item in self.load(path):
+            if item['id'] == item_id:
+                return item
+
+assets = AssetRegistry()
+
+# compiled once, the choices of the assets are read when the data is checked
+SETTINGS_SCHEMA = Schema(JsonData.DEFAULT_SETTINGS, {
+    'theme':           Choice(lambda : assets.get_ids(_file.THEMES)),
+    'keyboard-layout': Choice(lambda : Keyboard.__all__),
+    'language-word':   Choice(lambda : assets.get_ids(_file.WORDS_LIST)),
+    'language':        Choice(lambda : assets.get_ids(_file.LANGUAGES)),
+    'sound-volume':    Range(MIN_SOUND, MAX_SOUND),
+    'music-volume':    Range(MIN_MUSIC, MAX_MUSIC),
+    'change-guess':    Range(MIN_CHANGE_GUESS, MAX_CHANGE_GUESS(True)),
+    'word-length':     Range(MIN_WORD_LENGTH, MAX_WORD_LENGTH),
+    'fps':             Range(MIN_FPS, MAX_FPS, step=STEP_FPS),
+    'geomatry':        Range(MIN_GEOMATRY, MAX_GEOMATRY, number=True),
+    'screen-size':     Size(Range(MIN_SCREEN_X, MAX_SCREEN_X), Range(MIN_SCREEN_Y, MAX_SCREEN_Y))
+})
+
+GAME_DATA_SCHEMA = Schema(JsonData.DEFAULT_DATA_GAME, {
+    'joined-date':      {'date': Date()},
+    'prize-claim-time': Date(),
+    'played-time':      Date()
+})
+
 class Languages:
 
     def __init__(self) -> None:
         self.json = Json(_file.LANGUAGES, JsonData.DATA_LOST)
-        self.datajson = self.json.load_write()
+
+    @property
+    def datajson(self) -> list[dict[str, JsonObj]]:
+        return assets.load(_file.LANGUAGES)
 
     def get_lang_id(self) -> list[str]:
-        result = []
-        for item_spec in self.datajson:
-            result.append(item_spec['id'])
-        return result
+        return assets.get_ids(_file.LANGUAGES)
 
     def get_lang_name(self) -> list[str]:
-        result = []
-        for item_spec in self.datajson:
-            result.append(item_spec['name'])
-        return result
+        return assets.get_names(_file.LANGUAGES)
 
     def load(self, lang_id: str) -> dict[str, JsonObj]:
         if lang_id not in self.get_lang_id():
             raise IndexError('lang_id not found:', lang_id)
 
-        for item_spec in self.datajson:
-            if item_spec['id'] == lang_id:
-                return item_spec
+        return assets.find(_file.LANGUAGES, lang_id)
 
 class Themes:
 
     def __init__(self) -> None:
         self.json = Json(_file.THEMES, JsonData.DATA_LOST)
-        self.datajson = self.json.load_write()
+
+    @property
+    def datajson(self) -> list[dict[str, JsonObj]]:
+        return assets.load(_file.THEMES)
 
     def get_theme_id(self) -> list[str]:
-        result = []
-        for item_theme in self.datajson:
-            result.append(item_theme['id'])
-        return result
+        return assets.get_ids(_file.THEMES)
 
     def load(self, theme_id: str) -> dict[str, JsonObj]:
         if theme_id not in self.get_theme_id():
             raise IndexError('theme_id not found:', theme_id)
 
-        for item_theme in self.datajson:
-            if item_theme['id'] == theme_id:
-                return item_theme
+        return assets.find(_file.THEMES, theme_id)
 
 class WordsValidator:
 
     def __init__(self, lang_id: str) -> None:
-        self.spec_langs = Json(_file.WORDS_LIST, JsonData.DATA_LOST).load_write()
+        self.spec_langs = assets.load(_file.WORDS_LIST)
 
         if lang_id not in self.get_lang_id():
             raise IndexError('lang_id not found:', lang_id)
 
-        for item_spec in self.spec_langs:
-            if item_spec['id'] == lang_id:
-                self.spec = item_spec
+        self.spec = assets.find(_file.WORDS_LIST, lang_id)
 
         self.json = Json(_file.WORDS(self.spec['path']), JsonData.DATA_LOST, indent=None)
-        self.datajson = self.json.load_write()
+        self.dictionary = CompiledDictionary(_file.WORDS(self.spec['path']), lambda : self.datajson, _logs)
+        self._datajson = None
+
+    @property
+    def datajson(self) -> dict[str, list[str]]:
+        # the JSON is only parsed when it's edited or the compiled dictionary must be built
+        if self._datajson is None:
+            self._datajson = self.json.load_write()
+        return self._datajson
+
+    @datajson.setter
+    def datajson(self, value: dict[str, list[str]]) -> None:
+        self._datajson = value
 
     def get_lang_id(self) -> list[str]:
-        result = []
-        for item_spec in self.spec_langs:
-            result.append(item_spec['id'])
-        return result
+        return assets.get_ids(_file.WORDS_LIST)
 
     def get_lang_name(self) -> list[str]:
-        result = []
-        for item_spec in self.spec_langs:
-            result.append(item_spec['name'])
-        return result
+        return assets.get_names(_file.WORDS_LIST)
 
     def make_lower(self) -> None:
         for length_word, words_list in self.datajson.items():
@@ -108,17 +172,12 @@ class WordsValidator:
     def words_according_to_length(self) -> None:
         for length_word, words_list in self.datajson.items():
             length = int(length_word[7:])
-            for i, word in enumerate(words_list):
-                if len(word) != length:
-                    del self.datajson[length_word][i]
+            self.datajson[length_word] = [word for word in words_list if len(word) == length]
 
     def words_according_to_letters(self) -> None:
+        letters = frozenset(ascii_lowercase + ascii_uppercase)
         for length_word, words_list in self.datajson.items():
-            for i, word in enumerate(words_list):
-                for char in word:
-                    if char not in ascii_lowercase+ascii_uppercase:
-                        del self.datajson[length_word][i]
-                        break
+            self.datajson[length_word] = [word for word in words_list if letters.issuperset(word)]
 
     def set_words(self) -> None:
         for length_word, words_list in self.datajson.items():
@@ -137,15 +196,21 @@ class WordsValidator:
         for length_word, words_list in self.datajson.items():
             self.datajson[length_word] = sorted(words_list)
 
+    def get_words(self, length: int) -> list[str]:
+        """ uppercase words of `length-N` from the compiled dictionary (shared by the process, don't edit it) """
+        return dictionaries.get(self.spec['id'], length, self.dictionary)[0]
+
+    def get_index(self, length: int) -> frozenset[str]:
+        """ uppercase words of `length-N` as a hashed membership index """
+        return dictionaries.get(self.spec['id'], length, self.dictionary)[1]
+
     def load_and_validation(self, readonly: bool = True) -> dict[str, list[str]]:
         if not bool(readonly):
-            self.strip_words()
-            self.make_lower()
-            self.words_according_to_length()
-            self.words_according_to_letters()
-            self.set_words()
-            self.sorted_words()
-            return self.json.load_write(self.datajson)
+            # one streaming pass over the words file instead of a pass per step
+            self.datajson = normalize_words(self.json.file_path)
+            self.dictionary.close()
+            dictionaries.invalidate(self.spec['id'])
+            return self.datajson
         else:
             return self.datajson
 
@@ -154,9 +219,7 @@ class SettingsValidator:
     def __init__(self, logs: Logs | None = None) -> None:
         self.key = b'OMv5ELkug3vciuGQwnk-GuQEabAx47DVeWWeIBQPqus='
         self.file_corrupt = False
-        self.words_validator = WordsValidator('idn')
-        self.languages_validator = Languages()
-        self.themes_validator = Themes()
+        self.file_good = False
         self.katla_crypt = KatlaEncryptor(self.key)
         if logs is None:
             self.logs = _logs
@@ -165,29 +228,43 @@ class SettingsValidator:
         self.md = lambda : mkdir_data(f'file "{_file.DIR_DATA}/settings.katla" doesn\'t exists', self.logs)
         self.md()
 
-    def encrypt_data(self, data) -> None:
+    def encrypt_data(self, data) -> bool:
+        """ returns False when the data cannot be written (the error is logged) """
         self.md()
         fernet = _fernet.Fernet(self.key)
         json_string = json.dumps(data)
         encrypted_data = fernet.encrypt(json_string.encode())
         try:
-            with open(_file.SETTINGS, 'wb') as f:
-                f.write(self.katla_crypt.encrypt(encrypted_data.decode()))
+            # the current file only becomes the backup when it's known to be good
+            write_atomic(_file.SETTINGS, self.katla_crypt.encrypt(encrypted_data.decode()), backup=self.file_good)
+            self.file_good = True
+            saved = True
         except Exception as e:
             self.logs.log(f'settings data - write: Cannot save data: {type(e).__name__}: {e}', 'error')
+            saved = False
         self.file_corrupt = False
+        return saved
 
     def decrypt_data(self) -> dict[str, JsonObj]:
-        try:
-            with open(_file.SETTINGS, 'rb') as f:
-                decrypted_data = self.katla_crypt.decrypt(f.read())
-            fernet = _fernet.Fernet(self.key)
-            decrypted_json = fernet.decrypt(decrypted_data.encode())
-            return json.loads(decrypted_json.decode())
-        except Exception as e:
-            self.logs.log(f'settings data: {type(e).__name__}: {e}', 'error')
-            self.set_default()
-            return self.file_data
+        for path in (_file.SETTINGS, backup_path(_file.SETTINGS)):
+            if path != _file.SETTINGS and not os.path.exists(path):
+                break
+            try:
+                with open(path, 'rb') as f:
+                    decrypted_data = self.katla_crypt.decrypt(f.read())
+                fernet = _fernet.Fernet(self.key)
+                decrypted_json = fernet.decrypt(decrypted_data.encode())
+                data = json.loads(decrypted_json.decode())
+            except Exception as e:
+                self.logs.log(f'settings data{" - backup" if path != _file.SETTINGS else ""}: {type(e).__name__}: {e}', 'error')
+                continue
+            self.file_good = path == _file.SETTINGS
+            if not self.file_good:
+                self.logs.log('settings data: Restored from the backup', 'warn')
+            return data
+
+        self.set_default()
+        return self.file_data
 
     def set_default(self, reason: str | None = None) -> None:
         self.encrypt_data(JsonData.DEFAULT_SETTINGS)
@@ -195,110 +272,36 @@ class SettingsValidator:
         self.file_data = JsonData.DEFAULT_SETTINGS
         self.file_corrupt = True
 
+    def repair(self, repairs: list[Repair]) -> None:
+        for key, reason in repairs:
+            self.logs.log(f'settings data: {key}: {reason}', 'warn')
+        self.logs.log(f'Repaired settings: {len(repairs)} field(s)', 'warn')
+        self.encrypt_data(self.file_data)
+
     def load_and_validation(self) -> dict[str, JsonObj]:
-        use_valid_word = None
         self.file_data = self.decrypt_data()
-        list_req_settings = {
-            "theme": self.themes_validator.get_theme_id(),
-            "keyboard-layout": Keyboard.__all__,
-            "language-word": self.words_validator.get_lang_id(),
-            "language": self.languages_validator.get_lang_id(),
-            "sound-volume": [MIN_SOUND, MAX_SOUND],
-            "music-volume": [MIN_MUSIC, MAX_MUSIC],
-            "change-guess": [MIN_CHANGE_GUESS, MAX_CHANGE_GUESS(True)],
-            "word-length": [MIN_WORD_LENGTH, MAX_WORD_LENGTH],
-            "fps": [MIN_FPS, MAX_FPS],
-            "geomatry": [MIN_GEOMATRY, MAX_GEOMATRY],
-            "use-valid-word": bool,
-            "show-keyboard": bool,
-            "word-correction": bool,
-            "screen-size": [[MIN_SCREEN_X, MAX_SCREEN_X], [MIN_SCREEN_Y, MAX_SCREEN_Y]]
-        }
 
         if not isinstance(self.file_data, dict):
             self.set_default('Not dictionary or object')
 
-        elif JsonData.DEFAULT_SETTINGS.keys() - self.file_data.keys():
-            self.set_default('Unbalanced key')
-
         else:
-            for key, value in self.file_data.items():
-
-                if key in ['theme', 'keyboard-layout', 'language-word', 'language']:
-                    if value not in list_req_settings[key]:
-                        self.set_default(f'{key}: Invalid value')
-                        break
-
-                elif key in ['sound-volume', 'music-volume', 'change-guess', 'word-length', 'fps', 'geomatry']:
-                    if not isinstance(value, int):
-                        if not (key == 'geomatry' and isinstance(value, float)):
-                            if key == 'geomatry':
-                                self.set_default('geomatry: Not float')
-                            else:
-                                self.set_default(f'{key}: Not int')
-                            break
-
-                    elif value < list_req_settings[key][0]:
-                        self.set_default(f'{key}: Value is smaller than standard')
-                        break
-
-                    elif value > list_req_settings[key][1]:
-                        self.set_default(f'{key}: Value is greater than standard')
-                        break
-
-                    elif key == 'fps' and value % STEP_FPS != 0:
-                        self.set_default('fps: Value is not a multiple of 5')
-                        break
-
-                elif key in ['use-valid-word', 'show-keyboard', 'word-correction']:
-                    if not isinstance(value, bool):
-                        self.set_default('use-valid-word: Not bool')
-                        break
-                    else:
-                        use_valid_word = value
-
-                elif key == 'screen-size':
-                    if not isinstance(value, list):
-                        if value != 'FULL':
-                            self.set_default('screen-size: Not list or str Literal["FULL"]')
-                        break
-
-                    elif len(value) != 2:
-                        self.set_default('screen-size: List length is not appropriate')
-                        break
-
-                    for size in value:
-                        if not isinstance(size, int):
-                            self.set_default('screen-size: Not int')
-                            break
-
-                    if value[0] < list_req_settings[key][0][0]:
-                        self.set_default('screen-size index: [0]: Value is smaller than standard')
-                        break
-
-                    elif value[0] > list_req_settings[key][0][1]:
-                        self.set_default('screen-size index: [0]: Value is greater than standard')
-                        break
-
-                    elif value[1] < list_req_settings[key][1][0]:
-                        self.set_default('screen-size index: [1]: Value is smaller than standard')
-                        break
-
-                    elif value[1] > list_req_settings[key][1][1]:
-                        self.set_default('screen-size index: [1]: Value is greater than standard')
-                        break
-
-        if isinstance(use_valid_word, bool) and self.file_data['change-guess'] > ( cg := MAX_CHANGE_GUESS(use_valid_word)):
-            self.file_data['change-guess'] = cg
+            self.file_data, repairs = SETTINGS_SCHEMA(self.file_data)
+            if repairs:
+                self.repair(repairs)
+
+        if self.file_data['change-guess'] > (cg := MAX_CHANGE_GUESS(self.file_data['use-valid-word'])):
+            self.file_data = self.file_data | {'change-guess': cg}
 
         return self.file_data
 
 class GameDataValidator:
 
-    def __init__(self, logs: Logs | None = None) -> None:
+    def __init__(self, logs: Logs | None = None, history: GameHistory | None = None) -> None:
         self.key = b'6B4qF6oZ64V4_Z7sdCNKErkF_eT1A_qTP8HQMAbu2Uw='
         self.file_corrupt = False
+        self.file_good = False
         self.katla_crypt = KatlaEncryptor(self.key)
+        self.history = history
         if logs is None:
             self.logs = _logs
         else:
@@ -306,107 +309,87 @@ class GameDataValidator:
         self.md = lambda : mkdir_data(f'file "{_file.DIR_DATA}/game.katla" doesn\'t exists', logs)
         self.md()
 
-    def encrypt_data(self, data) -> None:
+    def encrypt_data(self, data) -> bool:
+        """ returns False when the data cannot be written (the error is logged) """
         self.md()
         fernet = _fernet.Fernet(self.key)
         json_string = json.dumps(data)
         encrypted_data = fernet.encrypt(json_string.encode())
         try:
-            with open(_file.GAME, 'wb') as f:
-                f.write(self.katla_crypt.encrypt(encrypted_data.decode()))
+            # the current file only becomes the backup when it's known to be good
+            write_atomic(_file.GAME, self.katla_crypt.encrypt(encrypted_data.decode()), backup=self.file_good)
+            self.file_good = True
+            saved = True
         except Exception as e:
             self.logs.log(f'game data - write: Cannot save data: {type(e).__name__}: {e}', 'error')
+            saved = False
         self.file_corrupt = False
+        return saved
+
+    def read_file(self, path: str) -> JsonObj:
+        with open(path, 'rb') as f:
+            decrypted_data = self.katla_crypt.decrypt(f.read())
+        fernet = _fernet.Fernet(self.key)
+        decrypted_json = fernet.decrypt(decrypted_data.encode())
+        return json.loads(decrypted_json.decode())
 
     def decrypt_data(self) -> dict[str, JsonObj]:
-        try:
-            with open(_file.GAME, 'rb') as f:
-                decrypted_data = self.katla_crypt.decrypt(f.read())
-            fernet = _fernet.Fernet(self.key)
-            decrypted_json = fernet.decrypt(decrypted_data.encode())
-            return json.loads(decrypted_json.decode())
-        except Exception as e:
-            self.logs.log(f'game data: {type(e).__name__}: {e}', 'error')
-            self.set_default()
-            return self.file_data
+        for path in (_file.GAME, backup_path(_file.GAME)):
+            if path != _file.GAME and not os.path.exists(path):
+                break
+            try:
+                data = self.read_file(path)
+            except Exception as e:
+                self.logs.log(f'game data{" - backup" if path != _file.GAME else ""}: {type(e).__name__}: {e}', 'error')
+                continue
+            self.file_good = path == _file.GAME
+            if not self.file_good:
+                self.logs.log('game data: Restored from the backup', 'warn')
+            return data
+
+        self.set_default()
+        return self.file_data
 
     def set_default(self, reason: str | None = None) -> None:
         self.encrypt_data(JsonData.DEFAULT_DATA_GAME)
         self.logs.log(f"Set game data as default{'. Reason: {}'.format(reason) if reason is not None else ''}", 'warn')
         self.file_data = JsonData.DEFAULT_DATA_GAME
         self.file_corrupt = True
+        if self.history is not None:
+            # the journal state is newer than the snapshot, it must not bring the invalid data back
+            self.history.add_state(self.file_data)
+            self.history.sync()
+
+    def repair(self, repairs: list[Repair]) -> None:
+        for key, reason in repairs:
+            self.logs.log(f'game data: {key}: {reason}', 'warn')
+        self.logs.log(f'Repaired game data: {len(repairs)} field(s)', 'warn')
+        self.encrypt_data(self.file_data)
+        if self.history is not None:
+            self.history.add_state(self.file_data)
+            self.history.sync()
 
     def load_and_validation(self) -> dict[str, JsonObj]:
-        self.file_data = self.decrypt_data()
+        if self.history is not None and self.history.state is not None:
+            # the last state of the journal is newer than the game.katla snapshot
+            self.file_data = deepcopy(self.history.state)
+        else:
+            self.file_data = self.decrypt_data()
 
         if not isinstance(self.file_data, dict):
             self.set_default('Not dictionary or object')
 
-        elif JsonData.DEFAULT_DATA_GAME.keys() - self.file_data.keys():
-            self.set_default('Unbalanced key')
-
         else:
-            for key, value in self.file_data.items():
-
-                if key == 'coins':
-                    if not isinstance(value, int):
-                        self.set_default('coins: Not an int value')
-                        break
-
-                elif key in ['prize-claim-time', 'played-time']:
-                    if not isinstance(value, str):
-                        self.set_default(f'{key}: Not str')
-                        break
-
-                    date_split = value.split('/')
-
-                    if len(date_split) != 6:
-                        self.set_default(f"{key}: Time format doesn't match")
-                        break
-                    else:
-                        for date in date_split:
-                            if not date.isdigit():
-                                self.set_default(f'{key}: One of them is not a number')
-                                break
-
-                elif key in ['joined-date', 'hint', 'wins']:
-                    if not isinstance(value, dict):
-                        self.set_default(f'{key}: Not dictionary or object')
-                        break
-
-                    elif self.file_data[key].keys() - JsonData.DEFAULT_DATA_GAME[key].keys():
-                        self.set_default(f'{key}: Unbalanced key')
-                        break
-
-                    if key == 'joined-date':
-                        if not isinstance(self.file_data['joined-date']['date'], str):
-                            self.set_default(f'{key}: Not str')
-                            break
-                        if not isinstance(self.file_data['joined-date']['edit-date'], bool):
-                            self.set_default(f'{key}: Not bool')
-                            break
-
-                        date_split = self.file_data['joined-date']['date'].split('/')
-
-                        if len(date_split) != 6:
-                            self.set_default(f"{key}: Time format doesn't match")
-                            break
-                        else:
-                            for date in date_split:
-                                if not date.isdigit():
-                                    self.set_default(f'{key}: One of them is not a number')
-                                    break
-
-                    else:
-                        for value_hint in self.file_data[key].values():
-
-                            if not isinstance(value_hint, int):
-                                self.set_default(f'{key}: Not int')
-                                break
-
-                elif key in ('prize-taken', 'have-played', 'losses', 'play-time-seconds'):
-                    if not isinstance(value, int):
-                        self.set_default(f'{key}: Not int')
-                        break
-
-        return self.file_data
\ No newline at end of file
+            self.file_data, repairs = GAME_DATA_SCHEMA(self.file_data)
+            if repairs:
+                self.repair(repairs)
+
+        if self.history is not None and self.history.state is not None and not self.file_good:
+            # the snapshot wasn't read, it only becomes the backup of the next write when it's readable
+            try:
+                self.read_file(_file.GAME)
+                self.file_good = True
+            except Exception:
+                pass
+
+        return self.file_data
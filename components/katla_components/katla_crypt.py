@@ -1,4 +1,5 @@
 import random
+from threading import Lock
 
 _Key = int | float | str | bytes | bytearray
 class DecoderError(Exception): ...
@@ -11,14 +12,23 @@ class DenXOR:
         if not isinstance(key, _Key):
             raise TypeError('The only supported key types are: int, float, str, bytes, and bytearray.')
 
+        # private generator seeded like `random.seed(key)`, the global `random` state is never touched.
+        # The keystream is only extended, the first N bytes are always the same
+        self.__random = random.Random(key)
+        self.__keystream = bytearray()
+        # the save worker and the main thread share the keystream, an extension draws from the generator in order
+        self.__lock = Lock()
+
     def generate_key(self, data_length: int) -> bytes:
         if not isinstance(data_length, int):
             raise TypeError('The only supported data_length type are int')
 
-        random.seed(self.key)
-        key = bytes([random.randint(0, 255) for _ in range(data_length)])
-        random.seed(None)
-        return key
+        with self.__lock:
+            if data_length > len(self.__keystream):
+                randint = self.__random.randint
+                self.__keystream += bytes([randint(0, 255) for _ in range(data_length - len(self.__keystream))])
+
+            return bytes(self.__keystream[:max(data_length, 0)])
 
     def xor_bytes(self, key: bytes, data: bytes | str) -> bytes:
         if not isinstance(data, str | bytes):
@@ -28,7 +38,9 @@ class DenXOR:
         if isinstance(data, str):
             data = data.encode()
 
-        return bytes(a ^ b for a, b in zip(data, key))
+        # xor the whole buffers as big integers, the result is as long as the shortest one (like zip)
+        length = min(len(data), len(key))
+        return (int.from_bytes(data[:length], 'little') ^ int.from_bytes(key[:length], 'little')).to_bytes(length, 'little')
 
     def dencrypt(self, data: bytes | str) -> bytes:
         key = self.generate_key(len(data))
@@ -45,29 +57,36 @@ class KatlaEncryptor:
             '~': b'\xc0', '`': b'\x05', '!': b'\x44', '@': b'\x70', '#': b'\x97', '$': b'\x10', '%': b'\xf1', '^': b'\xb4', '&': b'\x83', '*': b'\xb2', '(': b'\xd5', ')': b'\x9e', '-': b'2', '_': b'\x9a', '=': b'\x2b', '+': b'\x57', '[': b'\x63', '{': b'\a', ']': b'\x43', '}': b'\x86', '\\': b'!', '|': b'\x13', ';': b'\x5c', ':': b'\x08', "'": b'\x25', '"': b'\x15', ',': b'\13', '<': b'\f', '.': b'\x0d', '>': b'\x5b', '/': b'\x2f', '?': b'\x6a', ' ': b'\x39', '\t': b'\x91', '\n': b'\x94'
         }
 
+        # translation tables, built once. Every supported char is ASCII and every mapped value is a single byte,
+        # unmapped bytes decode to the NUL sentinel (NUL is not a supported char)
+        reversed_char_map = {value: key for key, value in self.__char.items()}
+        decode_table = bytearray(256)
+
+        for value, char in reversed_char_map.items():
+            decode_table[value[0]] = ord(char)
+
+        self.__supported = frozenset(self.__char)
+        self.__encode_table = str.maketrans({char: chr(value[0]) for char, value in self.__char.items()})
+        self.__decode_table = bytes(decode_table)
+
     def encrypt(self, source_string: str) -> bytes:
         if not isinstance(source_string, str):
             raise TypeError('source_string must be str')
 
-        encrypted_bytes = b''
+        if not self.__supported.issuperset(source_string):
+            for char in source_string:
+                if char not in self.__supported:
+                    raise DecoderError(f"{repr(char)} character is not supported")
 
-        for char in source_string:
-            try:
-                encrypted_bytes += self.__char[char]
-            except KeyError:
-                raise DecoderError(f"{repr(char)} character is not supported")
+        encrypted_bytes = source_string.translate(self.__encode_table).encode('latin-1')
         return self.__den.dencrypt(encrypted_bytes)
 
     def decrypt(self, source_bytes: bytes) -> str:
         if not isinstance(source_bytes, bytes):
             raise TypeError('source_bytes must be bytes')
 
-        decrypted_string = ''
-        reversed_char_map = {value: key for key, value in self.__char.items()}
+        decrypted_bytes = self.__den.dencrypt(source_bytes).translate(self.__decode_table)
 
-        for byte in self.__den.dencrypt(source_bytes):
-            try:
-                decrypted_string += reversed_char_map[bytes([byte])]
-            except KeyError:
-                raise DecoderError("Corrupted bytes")
-        return decrypted_string
\ No newline at end of file
+        if 0 in decrypted_bytes:
+            raise DecoderError("Corrupted bytes")
+        return decrypted_bytes.decode('ascii')
\ No newline at end of file
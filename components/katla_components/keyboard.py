@@ -0,0 +1,116 @@
+"""
+Katla on-screen keyboard.
+
+The keys are drawn from sprites (outline, body and letter or icon) built the first time a key is shown in a state, a
+state is the feedback color of the key, the state of its body (inactive, hover or active) and whether its outline is
+active. The whole keyboard is kept on one surface, a frame only blits the keys whose state changed on it (`update`
+returns their screen rects, the dirty regions of the keyboard) and blits the surface on the screen. The key under the
+mouse is found from the row under it and the left edges of the row.
+"""
+
+import pygame
+from bisect import bisect_right
+from typing import Any, Literal
+from .constants import BACKSPACE, ENTER
+from .layout import Layout
+from ..module.pygameui.textcache import text_cache
+
+KeyState = tuple[str, Literal['inactive', 'hover', 'active'], bool] # (feedback color, body, outline active)
+
+class VirtualKeyboard:
+
+    """
+    VirtualKeyboard
+    ---------------
+    On-screen keyboard of one layout and theme, a new layout or theme needs a new keyboard
+    """
+
+    def __init__(self, layout: Layout, theme: dict[str, Any], font: pygame.font.Font, image_backspace: pygame.Surface, image_enter: pygame.Surface) -> None:
+        """
+        `theme`: Keyboard theme (`themes['keyboard']`).
+        `image_backspace`, `image_enter`: Icons of the backspace and enter keys, already scaled.
+        """
+        self.layout  = layout
+        self.theme   = theme
+        self.font    = font
+        self.images  = {BACKSPACE: image_backspace, ENTER: image_enter}
+        self.board   = layout.board_keyboard
+        self.surface = pygame.Surface(self.board.size)
+        self.sprites : dict[tuple[int, KeyState], pygame.Surface] = {}
+        self.states  : list[KeyState | None]                      = [None] * len(layout.keys)
+        self.hovered : int | None                                 = None
+
+        self.rows_top  = [layout.keys[row[0]][1].top                    for row in layout.key_rows if row]
+        self.rows_left = [[layout.keys[index][1].left for index in row] for row in layout.key_rows if row]
+        self.rows      = [row                                           for row in layout.key_rows if row]
+
+        pygame.draw.rect(self.surface, theme['background'], (0, 0, *self.board.size))
+
+    def key_at(self, pos: tuple[int, int]) -> int | None:
+        """ index of the key at `pos`, None if there isn't a key """
+        row = bisect_right(self.rows_top, pos[1]) - 1
+        if row < 0:
+            return None
+
+        col = bisect_right(self.rows_left[row], pos[0]) - 1
+        if col < 0:
+            return None
+
+        index = self.rows[row][col]
+
+        return index if self.layout.keys[index][1].collidepoint(pos) else None
+
+    def sprite(self, index: int, state: KeyState) -> pygame.Surface:
+        sprite = self.sprites.get((index, state))
+
+        if sprite is not None:
+            return sprite
+
+        letter, rect, outline_rect = self.layout.keys[index]
+        color, body, outline       = state
+        colors                     = self.theme['button'][color]
+        rect                       = rect.move(-outline_rect.left, -outline_rect.top)
+
+        sprite = self.sprites[(index, state)] = pygame.Surface(outline_rect.size)
+
+        pygame.draw.rect(sprite, self.theme['button']['outline']['active' if outline else 'inactive'], (0, 0, *outline_rect.size))
+        pygame.draw.rect(sprite, colors[body] if colors.get(body) is not None else colors['inactive'], rect)
+
+        if letter in self.images:
+            image = self.images[letter]
+        else:
+            image = text_cache.render(self.font, letter, True, self.theme['text'])
+
+        sprite.blit(image, image.get_rect(center=rect.center))
+
+        return sprite
+
+    def update(self, feedback: dict[str, str], letter_typing: str | None = None, justshow: bool = False) -> list[pygame.Rect]:
+        """ blit the keys whose state changed on the keyboard surface, returns their rects on the screen """
+        hovered = None if justshow else self.key_at(pygame.mouse.get_pos())
+        pressed = pygame.mouse.get_pressed()[0]
+        board   = self.board
+        changed = []
+
+        for index, (letter, _, outline_rect) in enumerate(self.layout.keys):
+            if index == hovered:
+                state = (feedback[letter.upper()], 'active' if pressed else 'hover', True)
+            else:
+                state = (feedback[letter.upper()], 'inactive', letter == letter_typing)
+
+            if state != self.states[index]:
+                self.states[index] = state
+                self.surface.blit(self.sprite(index, state), (outline_rect.left - board.left, outline_rect.top - board.top))
+                changed.append(outline_rect)
+
+        self.hovered = hovered
+
+        return changed
+
+    def draw(self, surface: pygame.Surface, feedback: dict[str, str], letter_typing: str | None = None, justshow: bool = False) -> int | None:
+        """ draw the keyboard on `surface`, returns the index of the key under the mouse (None while `justshow`) """
+        self.update(feedback, letter_typing, justshow)
+
+        surface.blit(self.surface, self.board)
+
+        return self.hovered
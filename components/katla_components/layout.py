@@ -0,0 +1,126 @@
+"""
+Katla screen layout.
+
+The rects of the tiles, the bar menu and the keyboard only depend on the screen size, the geomatry, the word length,
+the change guess, the keyboard layout and whether the keyboard is shown. They are computed once for those inputs
+(`Layout.key`) instead of every frame, a different key builds a new layout.
+"""
+
+import pygame
+from typing import Hashable
+from .constants import KeyboardList, ALL_KEY, math
+
+class Layout:
+
+    """
+    Layout
+    ------
+    Rects of the main screen for one key, the tile rects are relative to the board (`tile_origin` puts them on the screen)
+    """
+
+    def __init__(self, key: Hashable, size: tuple[int, int], geomatry: float, word_length: int, change_guess: int, keyboard: KeyboardList, show_keyboard: bool) -> None:
+        """
+        `key`: Inputs of the layout, compared with the key of the next frame.
+        `keyboard`: Rows of the keyboard layout.
+        """
+        self.key = key
+
+        self.build_tile    (size, geomatry, word_length, change_guess)
+        self.build_bar_menu(size, geomatry, show_keyboard)
+        self.build_keyboard(size, geomatry, keyboard)
+
+    def build_tile(self, size: tuple[int, int], geomatry: float, word_length: int, change_guess: int) -> None:
+        self.margin_tile  = 10 * geomatry
+        self.size_tile    = 80 * geomatry
+        self.outline_tile = 4 * geomatry
+
+        if word_length * self.size_tile + self.margin_tile * (word_length - 1) > size[0] - self.margin_tile * 2:
+            self.size_tile = (size[0] - self.margin_tile) / word_length - self.margin_tile
+
+        step = self.size_tile + self.margin_tile
+
+        self.left_tile = (size[0] - word_length * step + self.margin_tile) / 2
+
+        # the tiles are drawn on the board from the top left corner of the first outline
+        self.tiles = [
+            [pygame.Rect(self.outline_tile + col * step, self.outline_tile + row * step, self.size_tile, self.size_tile) for col in range(word_length)]
+            for row in range(change_guess)
+        ]
+        self.outline_tiles = [[math.Rect_outline(rect, self.outline_tile) for rect in row] for row in self.tiles]
+        self.board_size    = (
+            int(word_length  * step - self.margin_tile + self.outline_tile * 2) + 1,
+            int(change_guess * step - self.margin_tile + self.outline_tile * 2) + 1
+        )
+
+    def build_bar_menu(self, size: tuple[int, int], geomatry: float, show_keyboard: bool) -> None:
+        top    = pygame.Rect(math.get_center(size[0], (size[0] - 10 * geomatry)), 5 * geomatry,         size[0] - 10 * geomatry, 60 * geomatry)
+        bottom = pygame.Rect(top.left,                                           top.bottom + 5 * geomatry, top.width,               50 * geomatry)
+
+        size_top    = top.height    - 10 * geomatry
+        size_bottom = bottom.height - 10 * geomatry
+        y_top       = top.top    + math.get_center(top.height,    size_top)
+        y_bottom    = bottom.top + math.get_center(bottom.height, size_bottom)
+
+        self.bar_top    = top
+        self.bar_bottom = bottom
+        self.bar_drag   = pygame.Rect(top.left, top.top, top.width, 115 * geomatry) # dragging the tiles is anchored here
+        self.bar_area   = top.union(bottom)
+        self.bar        = {}
+
+        self.bar['how-to-play'] = pygame.Rect(top.left                     + 10 * geomatry,               y_top,    size_top,    size_top)
+        self.bar['stats']       = pygame.Rect(self.bar['how-to-play'].left + size_top + 10 * geomatry,    y_top,    size_top,    size_top)
+        self.bar['settings']    = pygame.Rect(top.right                    - size_top - 10 * geomatry,    y_top,    size_top,    size_top)
+        self.bar['reset']       = pygame.Rect(self.bar['settings'].left    - size_top - 10 * geomatry,    y_top,    size_top,    size_top)
+        self.bar['auto-write']  = pygame.Rect(self.bar['reset'].left       - size_top - 10 * geomatry,    y_top,    size_top,    size_top)
+        self.bar['bag-coin']    = pygame.Rect(bottom.left                  + 10 * geomatry,               y_bottom, size_bottom, size_bottom)
+        self.bar['hammer']      = pygame.Rect(top.right                    - size_bottom - 10 * geomatry, y_bottom, size_bottom, size_bottom)
+        self.bar['keyboard']    = pygame.Rect(self.bar['hammer'].left      - size_bottom - 20 * geomatry, y_bottom, size_bottom, size_bottom)
+        self.bar['lamp']        = pygame.Rect(self.bar['keyboard'].left    - size_bottom - 20 * geomatry, y_bottom, size_bottom, size_bottom)
+
+        if not show_keyboard:
+            self.bar['lamp'] = self.bar['keyboard']
+
+    def build_keyboard(self, size: tuple[int, int], geomatry: float, keyboard: KeyboardList) -> None:
+        margin     = 10 * geomatry
+        marginlr   = 40 * geomatry
+        buttonSize = (50 * geomatry, 70 * geomatry)
+        max_keys   = ((10 * buttonSize[0] + margin * 9), (3 * buttonSize[1] + margin * 2))
+        wide_key   = buttonSize[0] + buttonSize[0] / 2 + margin / 2
+
+        self.board_keyboard = pygame.Rect(
+            (size[0] - marginlr - max_keys[0]) / 2,
+            (size[1] - marginlr - max_keys[1]) - 60 * geomatry,
+            marginlr + max_keys[0],
+            marginlr + max_keys[1]
+        )
+
+        board          = self.board_keyboard
+        wide_left      = {ALL_KEY[0]: marginlr / 2, ALL_KEY[1]: board.width - marginlr / 2 - wide_key}
+        self.image_key = ((buttonSize[0] + buttonSize[0] / 2) / 1.8, buttonSize[1] / 2) # size of the backspace and enter images
+        self.keys      : list[tuple[str, pygame.Rect, pygame.Rect]] = [] # (letter, rect, outline rect)
+        self.key_rows  : list[list[int]]                            = [] # indexes of the keys of every row
+
+        for row, line in enumerate(keyboard):
+            left_row = math.get_center(board.width, (len(line) * buttonSize[0] + margin * (len(line) - 1)))
+            top      = board.top + math.get_center(board.height, max_keys[1]) + (row * (buttonSize[1] + margin))
+
+            self.key_rows.append(list(range(len(self.keys), len(self.keys) + len(line))))
+
+            for col, letter in enumerate(line):
+                if letter in ALL_KEY:
+                    rect = pygame.Rect(board.left + wide_left[letter], top, wide_key, buttonSize[1])
+                else:
+                    rect = pygame.Rect(board.left + left_row + col * (buttonSize[0] + margin), top, buttonSize[0], buttonSize[1])
+
+                self.keys.append((letter, rect, math.Rect_outline(rect, 4 * geomatry)))
+
+    def tile_origin(self, offset_y: float) -> tuple[int, int]:
+        """ screen position of the board (the top left corner of the first outline) """
+        return (int(self.left_tile - self.outline_tile), int(offset_y - self.outline_tile))
+
+    def tile_rect(self, col: int, row: int, offset_y: float) -> pygame.Rect:
+        return self.tiles[row][col].move(self.tile_origin(offset_y))
+
+    def row_rect(self, row: int, offset_y: float) -> pygame.Rect:
+        """ screen rect of a row of tiles with their outlines """
+        return self.outline_tiles[row][0].union(self.outline_tiles[row][-1]).move(self.tile_origin(offset_y))
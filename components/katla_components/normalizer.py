@@ -0,0 +1,170 @@
+"""
+Katla words normalizer.
+
+Single pass normalization of a word list to the words JSON format (`{"length-N": [...], ...}`). The source (a words
+JSON or a plain text list, one word per line) is read in chunks, every word is stripped, lowered, filtered by its
+length and letters and deduplicated as it's read, the lists are only sorted when they are written. Only the unique
+valid words are kept in memory, never the source.
+"""
+
+import json
+import os
+import re
+from string import ascii_lowercase
+from typing import IO, Iterable, Iterator
+from .constants import MIN_WORD_LENGTH, MAX_WORD_LENGTH
+
+CHUNK_SIZE = 1 << 16
+
+_LETTERS = frozenset(ascii_lowercase)
+_STRING  = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_SPACE   = re.compile(r'\s*')
+
+def iter_json_words(file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str | None, str]]:
+    """ (`length-N` key, word) pairs of a words JSON, the strings are read in chunks without parsing the whole file """
+    buffer = ''
+    offset = 0
+    key    = None
+    eof    = False
+
+    while True:
+        start = buffer.find('"', offset)
+
+        if start == -1:
+            buffer, offset = '', 0
+        else:
+            match = _STRING.match(buffer, start)
+
+            if match is not None:
+                # a string followed by ":" is a key, the next character may be in the next chunk
+                end = _SPACE.match(buffer, match.end()).end()
+
+                if end < len(buffer) or eof:
+                    string = json.loads(match.group())
+
+                    if buffer.startswith(':', end):
+                        key = string
+                    else:
+                        yield key, string
+
+                    offset = end
+                    continue
+
+            buffer, offset = buffer[start:], 0
+
+        if eof:
+            return
+
+        chunk  = file.read(chunk_size)
+        eof    = not chunk
+        buffer = buffer[offset:] + chunk
+        offset = 0
+
+def iter_lines_words(file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str | None, str]]:
+    """ (None, word) pairs of a plain text list, one word per line """
+    rest = ''
+
+    while chunk := file.read(chunk_size):
+        lines = (rest + chunk).split('\n')
+        rest  = lines.pop()
+
+        for line in lines:
+            yield None, line
+
+    if rest:
+        yield None, rest
+
+class _Rest:
+
+    """ a file with the already read `head` put back in front """
+
+    def __init__(self, head: str, file: IO[str]) -> None:
+        self.head = head
+        self.file = file
+
+    def read(self, size: int) -> str:
+        if self.head:
+            head, self.head = self.head, ''
+            return head
+        return self.file.read(size)
+
+def iter_words(file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str | None, str]]:
+    """ words of a words JSON or a plain text list, detected by the first character """
+    head = file.read(chunk_size)
+    body = head.lstrip()
+    rest = _Rest(head, file)
+
+    if body.startswith(('{', '[')):
+        return iter_json_words(rest, chunk_size)
+
+    return iter_lines_words(rest, chunk_size)
+
+class WordsNormalizer:
+
+    """
+    WordsNormalizer
+    ---------------
+    Streaming words normalizer: strip -> lower -> length and alphabet filter -> deduplicate -> sort (when written)
+    """
+
+    def __init__(self, lengths: Iterable[int] | None = None) -> None:
+        """
+        `lengths`: Word lengths of a plain text list, the `length-N` keys of a words JSON are kept as they are.
+        """
+        self.lengths = range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1) if lengths is None else lengths
+        self.words   : dict[str, set[str]] = {f'length-{length}': set() for length in self.lengths}
+        self.keys    : dict[str, int]      = {f'length-{length}': length for length in self.lengths}
+
+    def add(self, word: str, key: str | None = None) -> bool:
+        """ add a word (to the `key` list of a words JSON, otherwise to the list of its length), False if it's invalid """
+        word = word.strip().lower()
+
+        if key is None:
+            key = f'length-{len(word)}'
+        elif key not in self.keys:
+            if not (key.startswith('length-') and key[7:].isdigit()):
+                return False
+            self.keys [key] = int(key[7:])
+            self.words[key] = set()
+
+        if self.keys.get(key) != len(word) or not _LETTERS.issuperset(word):
+            return False
+
+        self.words[key].add(word)
+        return True
+
+    def feed(self, pairs: Iterable[tuple[str | None, str]]) -> None:
+        add = self.add
+        for key, word in pairs:
+            add(word, key)
+
+    def read(self, path: str, chunk_size: int = CHUNK_SIZE, encoding: str = 'utf-8') -> None:
+        """ normalize the words of a words JSON or a plain text list """
+        with open(path, encoding=encoding) as f:
+            self.feed(iter_words(f, chunk_size))
+
+    def get(self) -> dict[str, list[str]]:
+        return {key: sorted(words) for key, words in self.words.items()}
+
+    def write(self, path: str, encoding: str = 'utf-8') -> dict[str, list[str]]:
+        """ write the words JSON one sorted list at a time (a temporary file replaces `path`), returns the written lists """
+        datajson = {}
+
+        with open(path + '.tmp', 'w', encoding=encoding) as f:
+            f.write('{')
+
+            for i, (key, words) in enumerate(self.words.items()):
+                datajson[key] = sorted(words)
+                f.write(f'{", " if i else ""}{json.dumps(key)}: {json.dumps(datajson[key])}')
+
+            f.write('}')
+
+        os.replace(path + '.tmp', path)
+
+        return datajson
+
+def normalize_words(source: str, destination: str | None = None, lengths: Iterable[int] | None = None, chunk_size: int = CHUNK_SIZE) -> dict[str, list[str]]:
+    """ normalize a words JSON or a plain text list `source` to the words JSON `destination` (`source` itself by default) """
+    normalizer = WordsNormalizer(lengths)
+    normalizer.read(source, chunk_size)
+    return normalizer.write(source if destination is None else destination)
@@ -0,0 +1,294 @@
+"""
+Katla feedback patterns.
+
+Requirements module:
+```
+numpy
+```
+
+Every feedback of a guess against an answer is encoded as a base-3 integer (red = 0, yellow = 1, green = 2,
+position `i` weighted by `3 ** i`). `PatternMatrix` holds the code of every guess x answer pair of one
+`length-N` dictionary so the solver can filter candidates with a single row lookup.
+"""
+
+import os
+import zlib
+from typing import Literal
+from warnings import warn as _warn
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    _warn('The `numpy` module is not installed. please install with the command `pip install numpy`')
+    exit(-1)
+from .constants import File, Logs
+from .feedback import GREEN, Feedback
+
+_file = File()
+_logs = Logs()
+
+BLOCK_SIZE       = 256
+RANK_BLOCK_SIZE  = 32 # most guesses of one block
+RANK_BLOCK_ITEMS = 1 << 17 # guess x answer codes (or histogram bins) of one block, the buffers stay in the cache
+
+RankMethod = Literal['entropy', 'expected']
+
+def pattern_dtype(word_length: int) -> np.dtype:
+    """ 3 ** 5 = 243 still fits in uint8, longer words need uint16 (3 ** 9 = 19683) """
+    return np.dtype(np.uint8 if 3 ** word_length <= 256 else np.uint16)
+
+def words_to_array(words: list[str], word_length: int) -> np.ndarray:
+    """ uppercase words to a (n, word_length) uint8 array of ASCII codes """
+    return np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(len(words), word_length)
+
+def score_block(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """ vectorized feedback codes of every guess (g, L) against every answer (a, L), shape (g, a) """
+    word_length = guesses.shape[1]
+    letters     = guesses - ord('A')
+    same        = letters[:, :, None] == letters[:, None, :]
+    green       = [guesses[:, i, None] == answers[None, :, i] for i in range(word_length)]
+    counts      = np.zeros((26, answers.shape[0]), dtype=np.int8)
+    codes       = np.zeros((guesses.shape[0], answers.shape[0]), dtype=np.uint16)
+
+    for j in range(word_length):
+        np.add.at(counts, (answers[:, j] - ord('A'), np.arange(answers.shape[0])), 1)
+
+    for i in range(word_length):
+        # letters of the answer equal to this guess letter minus the ones already taken by a green
+        available = counts[letters[:, i]] - green[i]
+
+        # earlier letters equal to this one take one of the available letters (as a green or a yellow),
+        # later ones only when they are green. Only guesses with double letters need it
+        for k in range(word_length):
+            if k == i or not same[:, i, k].any():
+                continue
+
+            rows = np.flatnonzero(same[:, i, k])
+            if k < i:
+                available[rows] -= 1
+            else:
+                available[rows] -= green[k][rows]
+
+        digit = np.where(green[i], GREEN, available > 0).astype(np.uint16)
+        digit *= 3 ** i
+        codes += digit
+
+    return codes
+
+class PatternMatrix:
+
+    """
+    PatternMatrix
+    -------------
+    Guess x answer feedback pattern matrix of one language and one word length
+    """
+
+    def __init__(self, words: list[str], matrix: np.ndarray | None = None) -> None:
+        """
+        `words`: Uppercase words list, used both as guesses and answers.
+        `matrix`: Prebuilt matrix (shape `(len(words), len(words))`), built when None.
+        """
+        self.words       = words
+        self.word_length = len(words[0]) if words else 0
+        self.index       = {word: i for i, word in enumerate(words)}
+        self.letters     = words_to_array(words, self.word_length)
+        self.matrix      = self.build() if matrix is None else matrix
+        self.presence    = None
+        self.opening     = {}
+        self.rng         = np.random.default_rng(0)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @staticmethod
+    def checksum(words: list[str]) -> int:
+        return zlib.crc32('\n'.join(words).encode('ascii'))
+
+    @staticmethod
+    def cache_filename(lang_id: str, word_length: int, checksum: int) -> str:
+        return f'{lang_id}.length-{word_length}.{checksum:08x}.pattern.npy'
+
+    @classmethod
+    def cache_paths(cls, lang_id: str, word_length: int, checksum: int) -> tuple[str, str]:
+        """ the per-user cache next to the save data, then the words assets (read-only in a frozen or installed build) """
+        filename = cls.cache_filename(lang_id, word_length, checksum)
+        return _file.CACHE(filename), _file.WORDS(filename)
+
+    @classmethod
+    def load(cls, lang_id: str, words: list[str], logs: Logs | None = None) -> 'PatternMatrix':
+        """ load the matrix from the disk cache, build and write it when it doesn't exists or the words changed """
+        logs        = _logs if logs is None else logs
+        word_length = len(words[0]) if words else 0
+        paths       = cls.cache_paths(lang_id, word_length, cls.checksum(words))
+
+        for path in paths:
+            if os.path.exists(path):
+                try:
+                    matrix = np.load(path, mmap_mode='r')
+                    if matrix.shape == (len(words), len(words)) and matrix.dtype == pattern_dtype(word_length):
+                        return cls(words, matrix)
+                except (OSError, ValueError) as e:
+                    logs.log(f'pattern matrix: {type(e).__name__}: {e}', 'error')
+
+        logs.log(f'Building pattern matrix {lang_id} length-{word_length} ({len(words)} words)')
+        patterns = cls(words)
+        prefix   = cls.cache_filename(lang_id, word_length, 0)[:-len('00000000.pattern.npy')]
+
+        # the words assets first, the per-user cache when they cannot be written
+        for path in reversed(paths):
+            folder = os.path.dirname(path)
+
+            try:
+                os.makedirs(folder, exist_ok=True)
+
+                # stale caches from an older words list
+                for filename in os.listdir(folder):
+                    if filename.startswith(prefix) and filename.endswith('.pattern.npy'):
+                        os.remove(os.path.join(folder, filename))
+
+                np.save(path, patterns.matrix)
+                break
+
+            except OSError as e:
+                logs.log(f'pattern matrix - write: Cannot save cache to "{folder}": {type(e).__name__}: {e}', 'warn')
+
+        return patterns
+
+    def build(self) -> np.ndarray:
+        size   = len(self.words)
+        matrix = np.empty((size, size), dtype=pattern_dtype(self.word_length))
+
+        for start in range(0, size, BLOCK_SIZE):
+            matrix[start:start + BLOCK_SIZE] = score_block(self.letters[start:start + BLOCK_SIZE], self.letters)
+
+        return matrix
+
+    def row(self, guess: str) -> np.ndarray:
+        """ codes of `guess` against every answer, guesses outside the words list are scored on the fly """
+        if guess in self.index:
+            return self.matrix[self.index[guess]]
+
+        return score_block(words_to_array([guess], self.word_length), self.letters)[0]
+
+    def filter(self, candidates: np.ndarray, feedback: Feedback) -> np.ndarray:
+        """ keep the candidates (answer ids) which give the same code for the feedback word """
+        return candidates[self.row(feedback.word)[candidates] == feedback.code]
+
+    def get_words(self, candidates: np.ndarray) -> list[str]:
+        return [self.words[i] for i in candidates]
+
+    def score_guesses(self, guesses: np.ndarray, answers: np.ndarray, method: RankMethod = 'entropy') -> np.ndarray:
+        """ score every guess id over the answer ids, expected information (bits) or minus the expected remaining answers """
+        if method not in ('entropy', 'expected'):
+            raise TypeError(f'invalid rank method: {method}')
+
+        size       = len(answers)
+        patterns   = 3 ** self.word_length
+        block      = min(RANK_BLOCK_SIZE, max(1, RANK_BLOCK_ITEMS // max(size, patterns)))
+        scores     = np.empty(len(guesses), dtype=np.float64)
+        offsets    = (np.arange(block, dtype=np.intp) * patterns)[:, None]
+        index      = np.empty((block, size), dtype=np.intp)
+        weights    = np.empty(block * patterns, dtype=np.float64)
+        all_answer = size == len(self.words)
+        all_guess  = np.array_equal(guesses, np.arange(len(self.words))) # the rows are read as slices, not copied
+        nlog       = np.zeros(size + 1, dtype=np.float64)
+        nlog[1:]   = np.arange(1, size + 1) * np.log2(np.arange(1, size + 1))
+
+        if method == 'expected':
+            nlog[:] = np.arange(size + 1, dtype=np.float64) ** 2
+
+        for start in range(0, len(guesses), block):
+            rows  = self.matrix[start:start + block] if all_guess else self.matrix[guesses[start:start + block]]
+            rows  = rows if all_answer else rows[:, answers]
+            count = rows.shape[0]
+
+            np.add(rows, offsets[:count], out=index[:count])
+            histogram = np.bincount(index[:count].ravel(), minlength=count * patterns)
+
+            # n log n (or n ** 2) of every pattern count, summed per guess
+            np.take(nlog, histogram, out=weights[:count * patterns], mode='clip')
+            scores[start:start + count] = weights[:count * patterns].reshape(count, patterns).sum(axis=1)
+
+        if method == 'entropy':
+            return np.log2(size) - scores / size
+
+        return -scores / size
+
+    def prefilter_guesses(self, candidates: np.ndarray, top_k: int) -> np.ndarray:
+        """ cheap letter frequency score over the candidates, keeps the best `top_k` guess ids """
+        if self.presence is None:
+            self.presence = np.zeros((len(self.words), 26), dtype=np.float32)
+            for i in range(self.word_length):
+                self.presence[np.arange(len(self.words)), self.letters[:, i] - ord('A')] = 1
+
+        letters  = self.letters[candidates] - ord('A')
+        position = np.zeros((self.word_length, 26), dtype=np.float32)
+        for i in range(self.word_length):
+            position[i] = np.bincount(letters[:, i], minlength=26)
+
+        scores = self.presence @ self.presence[candidates].sum(axis=0)
+        for i in range(self.word_length):
+            scores += position[i][self.letters[:, i] - ord('A')]
+
+        if top_k >= len(scores):
+            return np.arange(len(scores))
+
+        return np.argpartition(-scores, top_k)[:top_k]
+
+    def rank_guesses(
+            self,
+            candidates: np.ndarray,
+            method: RankMethod = 'entropy',
+            approximate: bool = False,
+            top_k: int = 500,
+            sample_size: int = 2000,
+            limit: int = 10
+        ) -> list[tuple[str, float]]:
+        """
+        rank the guesses by the expected information gain (`'entropy'`) or the expected remaining candidates
+        (`'expected'`) over the current `candidates`. The `approximate` mode only scores the `top_k` guesses of a
+        letter frequency prefilter against at most `sample_size` sampled candidates, for the 8 - 9 letters dictionaries
+        """
+        opening = len(candidates) == len(self.words)
+        key     = (method, approximate, top_k, sample_size)
+
+        if len(candidates) <= 2:
+            return [(self.words[i], 0.0) for i in candidates][:limit]
+
+        if opening and key in self.opening:
+            # the scores of every guess are kept, any `limit` is picked from them
+            guesses, scores, is_candidate = self.opening[key]
+            return self.select_guesses(guesses, scores, is_candidate, limit)
+
+        answers = candidates
+        guesses = np.arange(len(self.words))
+
+        if approximate:
+            guesses = np.union1d(self.prefilter_guesses(candidates, top_k), candidates[:top_k])
+            if len(candidates) > sample_size:
+                answers = np.sort(self.rng.choice(candidates, sample_size, replace=False))
+
+        scores       = self.score_guesses(guesses, answers, method)
+        is_candidate = np.isin(guesses, candidates)
+
+        if opening:
+            self.opening[key] = (guesses, scores, is_candidate)
+
+        return self.select_guesses(guesses, scores, is_candidate, limit)
+
+    def select_guesses(self, guesses: np.ndarray, scores: np.ndarray, is_candidate: np.ndarray, limit: int) -> list[tuple[str, float]]:
+        """ the best `limit` guesses, on equal scores a guess which can be the answer itself first, then the lowest id """
+        rounded = -np.round(scores, 9)
+
+        # only the guesses scoring at least as well as the `limit`-th one are sorted
+        if 0 < limit < len(rounded):
+            kth    = np.partition(rounded, limit - 1)[limit - 1]
+            select = np.flatnonzero(rounded <= kth)
+        else:
+            select = np.arange(len(rounded))
+
+        order = select[np.lexsort((~is_candidate[select], rounded[select]))][:max(limit, 0)]
+        return [(self.words[guesses[i]], float(scores[i])) for i in order]
+
+    def best_guess(self, candidates: np.ndarray, **kwargs) -> str | None:
+        ranking = self.rank_guesses(candidates, limit=1, **kwargs)
+        return ranking[0][0] if ranking else None
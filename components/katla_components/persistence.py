@@ -0,0 +1,105 @@
+"""
+Katla persistence worker.
+
+Saves (settings, game data) are handed to a background thread instead of encrypting and writing on the render thread.
+Pending snapshots are kept per file, a newer snapshot replaces the pending one (last write wins), and a file is only
+written once no newer snapshot came for `debounce` seconds.
+"""
+
+from copy import deepcopy
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Any, Callable
+from .constants import Logs
+
+_logs = Logs()
+
+Writer = Callable[[Any], None]
+
+class SaveWorker:
+
+    """
+    SaveWorker
+    ----------
+    Background writer with a bounded, per file coalescing queue
+    """
+
+    def __init__(self, logs: Logs | None = None, debounce: float = 0.25, maxsize: int = 8) -> None:
+        """
+        `debounce`: Seconds without a newer snapshot before a file is written.
+        `maxsize`: Maximum pending files, a new file over the limit is written synchronously by the caller.
+        """
+        self.logs      = _logs if logs is None else logs
+        self.debounce  = debounce
+        self.maxsize   = maxsize
+        self.pending   : dict[str, tuple[Writer, Any, float]] = {}
+        self.condition = Condition()
+        self.writing   = Lock()
+        self.running   = True
+        self.thread    = Thread(target=self.run, name='katla-save-worker', daemon=True)
+        self.thread.start()
+
+    def submit(self, key: str, write: Writer, data: Any) -> None:
+        """ queue a snapshot of `data` to be written by `write` (`key` identifies the file) """
+        snapshot = deepcopy(data)
+
+        with self.condition:
+            if self.running and (key in self.pending or len(self.pending) < self.maxsize):
+                self.pending[key] = (write, snapshot, monotonic())
+                self.condition.notify()
+                return
+
+        self.write(key, write, snapshot)
+
+    def write(self, key: str, write: Writer, snapshot: Any, locked: bool = False) -> None:
+        # one write at a time, the encryptors are not shared between threads
+        if not locked:
+            self.writing.acquire()
+
+        try:
+            write(snapshot)
+        except Exception as e:
+            self.logs.log(f'save worker - {key}: {type(e).__name__}: {e}', 'error')
+        finally:
+            self.writing.release()
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while self.running and not self.pending:
+                    self.condition.wait()
+
+                if not self.running:
+                    return
+
+                # the oldest snapshot is written once it has not been replaced for `debounce` seconds
+                key, (write, snapshot, submitted) = min(self.pending.items(), key=lambda item : item[1][2])
+                delay = submitted + self.debounce - monotonic()
+
+                if delay > 0:
+                    self.condition.wait(delay)
+                    continue
+
+                # taken before the snapshot leaves the queue, so a flush can't be overwritten by this older one
+                del self.pending[key]
+                self.writing.acquire()
+
+            self.write(key, write, snapshot, locked=True)
+
+    def flush(self) -> None:
+        """ write every pending snapshot now, on the calling thread """
+        with self.condition:
+            pending = list(self.pending.items())
+            self.pending.clear()
+
+        for key, (write, snapshot, _) in pending:
+            self.write(key, write, snapshot)
+
+    def close(self) -> None:
+        """ stop the worker and flush synchronously, later submits are written directly """
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+        self.thread.join()
+        self.flush()
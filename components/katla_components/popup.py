@@ -251,22 +251,21 @@ class Popup:
             self.animation_start_time = self.app.get_tick()
             self.slide_out_time       = self.animation_start_time + self.slide_out_duration
 
-    def showTile(self, pos: tuple[const.Number, const.Number], font: pygame.font.Font, feedback: const.Feedback, size_gap_outline: tuple[const.Number, const.Number, const.Number] = (60, 8, 3)) -> None:
-        for x, attempt_feedback in enumerate(feedback):
-            for char, color in attempt_feedback.items():
-
-                tile_rect = pygame.Rect(
-                    pos[0] + x * (size_gap_outline[0] + size_gap_outline[1]) * self.app.geomatry,
-                    pos[1],
-                    size_gap_outline[0] * self.app.geomatry,
-                    size_gap_outline[0] * self.app.geomatry
-                )
+    def showTile(self, pos: tuple[const.Number, const.Number], font: pygame.font.Font, feedback: const.Feedback | list[tuple[str, str]], size_gap_outline: tuple[const.Number, const.Number, const.Number] = (60, 8, 3)) -> None:
+        for x, (char, color) in enumerate(feedback):
+
+            tile_rect = pygame.Rect(
+                pos[0] + x * (size_gap_outline[0] + size_gap_outline[1]) * self.app.geomatry,
+                pos[1],
+                size_gap_outline[0] * self.app.geomatry,
+                size_gap_outline[0] * self.app.geomatry
+            )
 
-                pygame.draw.rect(self.app.screen, self.app.themes['tile']['box']['outline']['point-inactive'], const.math.Rect_outline(tile_rect, size_gap_outline[2] * self.app.geomatry))
-                pygame.draw.rect(self.app.screen, self.app.themes['tile']['box'][color],                       tile_rect)
+            pygame.draw.rect(self.app.screen, self.app.themes['tile']['box']['outline']['point-inactive'], const.math.Rect_outline(tile_rect, size_gap_outline[2] * self.app.geomatry))
+            pygame.draw.rect(self.app.screen, self.app.themes['tile']['box'][color],                       tile_rect)
 
-                letter = font.render(char, True, self.app.themes['tile']['text'])
-                self.app.screen.blit(letter, letter.get_rect(center=tile_rect.center))
+            letter = font.render(char, True, self.app.themes['tile']['text'])
+            self.app.screen.blit(letter, letter.get_rect(center=tile_rect.center))
 
     def show_according_type(self) -> None:
         match self.type:
@@ -352,9 +351,9 @@ class Popup:
                 surface_text = self.font_how_to_play_text.render(ln, True, self.app.themes['popup']['text'])
                 self.app.screen.blit(surface_text, (popup_rect.left + 5 * self.app.geomatry, top))
 
-        self.showTile((popup_rect.left + 5 * self.app.geomatry, tiles_pos_y[0]), self.font_how_to_play_tile, [{char: 'green'  if i == 0 else 'not-inputed'} for i, char in enumerate(LANG['tiles']['example-1'])])
-        self.showTile((popup_rect.left + 5 * self.app.geomatry, tiles_pos_y[1]), self.font_how_to_play_tile, [{char: 'yellow' if i == 1 else 'not-inputed'} for i, char in enumerate(LANG['tiles']['example-2'])])
-        self.showTile((popup_rect.left + 5 * self.app.geomatry, tiles_pos_y[2]), self.font_how_to_play_tile, [{char: 'red'    if i == 4 else 'not-inputed'} for i, char in enumerate(LANG['tiles']['example-3'])])
+        self.showTile((popup_rect.left + 5 * self.app.geomatry, tiles_pos_y[0]), self.font_how_to_play_tile, [(char, 'green'  if i == 0 else 'not-inputed') for i, char in enumerate(LANG['tiles']['example-1'])])
+        self.showTile((popup_rect.left + 5 * self.app.geomatry, tiles_pos_y[1]), self.font_how_to_play_tile, [(char, 'yellow' if i == 1 else 'not-inputed') for i, char in enumerate(LANG['tiles']['example-2'])])
+        self.showTile((popup_rect.left + 5 * self.app.geomatry, tiles_pos_y[2]), self.font_how_to_play_tile, [(char, 'red'    if i == 4 else 'not-inputed') for i, char in enumerate(LANG['tiles']['example-3'])])
 
         self.buttonClose.rect = close_rect
 
@@ -363,7 +362,9 @@ class Popup:
     def show_stats(self) -> None:
         LANG = self.app.languages['popup']['stats']
 
-        popup_rect         = pygame.Rect(const.math.get_center(self.app.screen.get_width(), 500 * self.app.geomatry), self.y_pos,                              500 * self.app.geomatry, (407 + (38 * self.app.change_guess)) * self.app.geomatry)
+        # the history lines are added below the game data lines, everything under them moves down
+        history_y_pos      = 2 * self.font_stats_stat_text.get_height()
+        popup_rect         = pygame.Rect(const.math.get_center(self.app.screen.get_width(), 500 * self.app.geomatry), self.y_pos,                              500 * self.app.geomatry, (407 + (38 * self.app.change_guess)) * self.app.geomatry + history_y_pos)
         popup_rect_outline = const.math.Rect_outline(popup_rect, 6 * self.app.geomatry)
         close_rect         = pygame.Rect(popup_rect.right - 40 * self.app.geomatry - 10 * self.app.geomatry,          popup_rect.top + 10 * self.app.geomatry, 40 * self.app.geomatry,  40 * self.app.geomatry)
         shadow_surface     = pygame.Surface((popup_rect_outline.width, popup_rect_outline.height))
@@ -371,6 +372,8 @@ class Popup:
         if not self.list_wrapped_text or self.last_game_data != self.app.game_data:
             self.last_game_data = self.app.game_data.copy()
             date_split          = self.app.game_data['joined-date']['date'].split('/')
+            history             = self.app.game_history.summary()
+            average_duration    = round(history['average-duration'])
             stats_label         = {
                 LANG['label']['joined-date']:     f'{date_split[3]}/{date_split[4]}/{date_split[5]} {date_split[0]}:{date_split[1]}',
                 LANG['label']['play-time-hours']: f"{self.hours_format.parse(self.app.game_data['play-time-seconds'] / 3600)} {LANG['label']['hours']}",
@@ -380,7 +383,9 @@ class Popup:
                 LANG['label']['losses']:          self.app.num_format.parse(self.app.game_data['losses'])        + f" ({self.percent_format.parse(((self.app.game_data['losses']        / self.app.game_data['have-played']) * 100) if self.app.game_data['have-played'] > 0 else 0)}%)",
                 LANG['label']['wins']:            self.app.num_format.parse(self.app.game_data['wins']['total']) + f" ({self.percent_format.parse(((self.app.game_data['wins']['total'] / self.app.game_data['have-played']) * 100) if self.app.game_data['have-played'] > 0 else 0)}%)",
                 LANG['label']['wins-streak']:     self.app.num_format.parse(self.app.game_data['wins']['streak']),
-                LANG['label']['max-wins-streak']: self.app.num_format.parse(self.app.game_data['wins']['max-streak'])
+                LANG['label']['max-wins-streak']: self.app.num_format.parse(self.app.game_data['wins']['max-streak']),
+                LANG['label']['average-guesses']: self.app.num_format.parse(history['average-guesses']),
+                LANG['label']['average-time']:    f'{average_duration // 60}:{average_duration % 60:02d}'
             }
             self.list_wrapped_text = [
                 render_wrap(font=self.font_title,           text=LANG['title'],                   wraplength=popup_rect.width - 100 * self.app.geomatry, antialias=True, color=self.app.themes['popup']['text'], wrap_type='center'),
@@ -419,19 +424,19 @@ class Popup:
         self.app.screen.blit(stat_values_surf, (popup_rect.right - 5 * self.app.geomatry - stat_values_surf.get_width(), stat_info_y_pos))
         self.app.screen.blit(distribution_surf, (
             popup_rect.left + const.math.get_center(popup_rect.width, distribution_surf.get_width()),
-            self.y_pos + 330 * self.app.geomatry + distribution_surf.get_height()
+            self.y_pos + 330 * self.app.geomatry + distribution_surf.get_height() + history_y_pos
         ))
 
         for i in range(1, self.app.change_guess + 1):
             max_win = max(max_win, self.app.game_data['wins'][str(i)])
 
         for i in range(self.app.change_guess):
-            top                    = self.y_pos + 410 * self.app.geomatry + i * (38 * self.app.geomatry)
+            top                    = self.y_pos + 410 * self.app.geomatry + i * (38 * self.app.geomatry) + history_y_pos
             bar_distribution_width = (self.app.game_data['wins'][str(i + 1)] / max_win if max_win > 0 else 0) * (popup_rect.width - 45 * self.app.geomatry) if self.app.game_data['wins']['total'] != 0 else 0
 
             bar_distribution_rect = pygame.Rect(popup_rect.left + 5 * self.app.geomatry + 35 * self.app.geomatry, top + 2.5 * self.app.geomatry, bar_distribution_width, 25 * self.app.geomatry)
 
-            self.showTile((popup_rect.left + 5 * self.app.geomatry, top), self.font_stats_distribution, [{str(i+1): 'not-inputed'}], size_gap_outline=(30, 8, 3))
+            self.showTile((popup_rect.left + 5 * self.app.geomatry, top), self.font_stats_distribution, [(str(i+1), 'not-inputed')], size_gap_outline=(30, 8, 3))
 
             pygame.draw.rect(self.app.screen, self.app.themes['popup']['outline' if (i + 1) != self.app.last_win_line else 'win-bar'], bar_distribution_rect)
 
@@ -739,6 +744,13 @@ class Notification:
             else:
                 self.app.notifications_layer.remove(self.notif_kind)
 
+    def is_sliding(self) -> bool:
+        """ the notification slides in or out, it only has to be drawn again while it moves """
+        current_time = self.app.get_tick()
+        display_time = self.animation_start_time + self.slide_in_duration + self.display_duration
+
+        return self.is_visible and (current_time < self.animation_start_time + self.slide_in_duration or current_time >= display_time)
+
     def refresh(self) -> None:
         self.is_visible         = False
         self.position_finalized = False
@@ -757,6 +769,7 @@ class Notification:
 
         self.is_visible           = True
         self.animation_start_time = self.app.get_tick()
+        self.app.full_redraw      = True # the size of the notification is only known after it's drawn
 
         if not is_win_or_lose:
             if self.notif_kind in self.app.notifications_layer:
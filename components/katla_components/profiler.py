@@ -0,0 +1,195 @@
+"""
+Katla frame profiler.
+
+Times the phases of every frame of the main loop with `perf_counter_ns` into ring buffers. The overlay shows the
+p50/p95/p99 frame times and a stacked bar of the average time of every phase, the histogram of the frame and phase
+times can be dumped to a CSV file in `katla-data`.
+"""
+
+import csv
+import pygame
+from datetime import datetime
+from time import perf_counter_ns
+from .constants import PROFILER_FRAMES, File, Logs, mkdir_data
+
+_file = File()
+_logs = Logs()
+
+PHASES = ('events', 'tile', 'bar-menu', 'keyboard', 'text-bar', 'notification', 'popup', 'save', 'profiler', 'flip', 'tick', 'input')
+COLORS = {
+    'events':       (120, 120, 120),
+    'tile':         (230,  80,  80),
+    'bar-menu':     (230, 160,  60),
+    'keyboard':     (230, 220,  70),
+    'text-bar':     (140, 200,  80),
+    'notification': ( 70, 190, 150),
+    'popup':        ( 70, 160, 230),
+    'save':         (120, 100, 230),
+    'profiler':     (255, 255, 255),
+    'flip':         (200,  90, 220),
+    'tick':         ( 60,  60,  60),
+    'input':        (180, 120,  90)
+}
+
+REDRAW_FRAMES = 10 # the overlay is rendered again every 10 frames
+
+def percentile(values: list[int], p: float) -> int:
+    """ `p` percentile (0 - 100) of the sorted `values` """
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+class FrameProfiler:
+
+    """
+    FrameProfiler
+    -------------
+    Lightweight profiler of the main loop phases, it does nothing while it's disabled
+    """
+
+    def __init__(self, size: int = PROFILER_FRAMES, logs: Logs | None = None) -> None:
+        """
+        `size`: Frames kept in the ring buffers.
+        """
+        self.size    = size
+        self.logs    = _logs if logs is None else logs
+        self.enabled = False
+        self.font    = None
+        self.overlay = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.frames  = [0] * self.size
+        self.phases  = {phase: [0] * self.size for phase in PHASES}
+        self.count   = 0 # frames recorded
+        self.current = None
+        self.last    = 0
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.reset()
+        self.overlay = None
+        self.logs.log(f'Profiler {"enabled" if self.enabled else "disabled"}')
+
+    def frame(self) -> None:
+        """ start a frame, the previous one is recorded (the rest of it is the `input` phase) """
+        if not self.enabled:
+            return
+
+        now = perf_counter_ns()
+
+        if self.current is not None:
+            self.current['input'] = self.current.get('input', 0) + now - self.last
+
+            i = self.count % self.size
+
+            for phase in PHASES:
+                self.phases[phase][i] = self.current.get(phase, 0)
+
+            self.frames[i]  = sum(self.current.values())
+            self.count     += 1
+
+        self.current = {}
+        self.last    = now
+
+    def lap(self, phase: str) -> None:
+        """ time since the previous lap is added to `phase` """
+        if not self.enabled or self.current is None:
+            return
+
+        now                 = perf_counter_ns()
+        self.current[phase] = self.current.get(phase, 0) + now - self.last
+        self.last           = now
+
+    def recorded(self) -> int:
+        return min(self.count, self.size)
+
+    def stats(self) -> dict[str, float]:
+        """ p50/p95/p99 frame times and the average time of every phase (milliseconds) """
+        n      = self.recorded()
+        frames = sorted(self.frames[:n])
+        result = {f'p{p}': percentile(frames, p) / 1e6 for p in (50, 95, 99)}
+
+        for phase in PHASES:
+            result[phase] = sum(self.phases[phase][:n]) / n / 1e6 if n else 0
+
+        return result
+
+    def draw(self, surface: pygame.Surface, fps: int) -> None:
+        if not self.enabled:
+            return
+
+        if self.overlay is None or self.count % REDRAW_FRAMES == 0:
+            self.overlay = self.render(fps)
+
+        surface.blit(self.overlay, (5, 5))
+
+        self.lap('profiler')
+
+    def render(self, fps: int) -> pygame.Surface:
+        if self.font is None:
+            self.font = pygame.font.Font(_file.FONT_ROBOTO_MEDIUM, 14)
+
+        stats   = self.stats()
+        budget  = 1000 / fps if fps else 1000 / 60
+        width   = 300
+        line    = self.font.get_linesize()
+        legend  = (len(PHASES) + 1) // 2
+        overlay = pygame.Surface((width, line * (2 + legend) + 20), pygame.SRCALPHA)
+
+        overlay.fill((0, 0, 0, 170))
+        overlay.blit(self.font.render(
+            'frame p50 {:.2f} | p95 {:.2f} | p99 {:.2f} ms'.format(stats['p50'], stats['p95'], stats['p99']), True, (255, 255, 255)
+        ), (5, 2))
+
+        # stacked average time of the phases, the full width is the frame budget of the fps
+        x = 5.0
+
+        for phase in PHASES:
+            w = stats[phase] / budget * (width - 10)
+            pygame.draw.rect(overlay, COLORS[phase], (x, line + 6, max(w, 0), 12))
+            x += w
+
+        pygame.draw.line(overlay, (255, 255, 255), (width - 5, line + 4), (width - 5, line + 19))
+
+        for i, phase in enumerate(PHASES):
+            pos = (5 + (i % 2) * (width // 2), line + 24 + (i // 2) * line)
+            pygame.draw.rect(overlay, COLORS[phase], (pos[0], pos[1] + line // 4, 8, 8))
+            overlay.blit(self.font.render(f'{phase} {stats[phase]:.2f}', True, (230, 230, 230)), (pos[0] + 12, pos[1]))
+
+        return overlay
+
+    def dump(self) -> str | None:
+        """ write the histogram (1 ms buckets) of the frame and phase times to a CSV file, returns the path """
+        n = self.recorded()
+
+        if not self.enabled or n == 0:
+            return None
+
+        mkdir_data(f'file "{_file.DIR_DATA}" doesn\'t exists', self.logs)
+
+        path    = f'{_file.DIR_DATA}/profile-{datetime.now().strftime(r"%Y%m%d-%H%M%S")}.csv'
+        columns = {'frame': self.frames[:n]} | {phase: self.phases[phase][:n] for phase in PHASES}
+        buckets = {name: {} for name in columns}
+
+        for name, values in columns.items():
+            for ns in values:
+                bucket                = ns // 1_000_000
+                buckets[name][bucket] = buckets[name].get(bucket, 0) + 1
+
+        last = max(max(bucket, default=0) for bucket in buckets.values())
+
+        try:
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['ms'] + list(columns))
+                for bucket in range(last + 1):
+                    writer.writerow([bucket] + [buckets[name].get(bucket, 0) for name in columns])
+
+        except Exception as e:
+            self.logs.log(f'profiler - write: Cannot save data: {type(e).__name__}: {e}', 'error')
+            return None
+
+        self.logs.log(f'Profiler histogram of {n} frames saved to "{path}"')
+
+        return path
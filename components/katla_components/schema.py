@@ -0,0 +1,229 @@
+"""
+Katla data schema.
+
+The settings and the game data are checked by a schema compiled once from the default data (`JsonData.DEFAULT_SETTINGS`,
+`JsonData.DEFAULT_DATA_GAME`) and the rules of the fields (the `MIN_*`/`MAX_*` constants). A compiled schema is one
+check function per field, an invalid field is repaired (clamped or set to its default value) instead of resetting the
+whole data.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from typing import Any, Callable, Iterable
+
+# check of a field: returns the (repaired) value and the reason of the repair, None if the value is valid
+Check  = Callable[[Any], tuple[Any, str | None]]
+Repair = tuple[str, str]
+
+_DATE = re.compile(r'[0-9]+(?:/[0-9]+){5}')
+
+def is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+class Rule(ABC):
+
+    """
+    Rule
+    ----
+    Constraint of a field, compiled to a check with the default value of the field
+    """
+
+    @abstractmethod
+    def compile(self, default: Any) -> Check: ...
+
+class Choice(Rule):
+
+    """
+    Choice
+    ------
+    The value must be one of `choices()`, the choices are read when the data is checked (the assets ids)
+    """
+
+    def __init__(self, choices: Callable[[], Iterable[Any]]) -> None:
+        self.choices = choices
+
+    def compile(self, default: Any) -> Check:
+        choices = self.choices
+
+        def check(value: Any) -> tuple[Any, str | None]:
+            if value in choices():
+                return value, None
+            return default, 'Invalid value'
+
+        return check
+
+class Range(Rule):
+
+    """
+    Range
+    -----
+    Number between `minimum` and `maximum`, a value out of the range is clamped
+    """
+
+    def __init__(self, minimum: int | float, maximum: int | float, number: bool = False, step: int | None = None) -> None:
+        """
+        `number`: Floats are allowed, otherwise only int.
+        `step`: The value must be a multiple of `step`, rounded to the nearest one.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.number  = number
+        self.step    = step
+
+    def compile(self, default: Any) -> Check:
+        minimum, maximum, step = self.minimum, self.maximum, self.step
+        is_type                = is_number if self.number else is_int
+        reason_type            = 'Not float' if self.number else 'Not int'
+
+        def check(value: Any) -> tuple[Any, str | None]:
+            if not is_type(value):
+                return default, reason_type
+            if value < minimum:
+                return minimum, 'Value is smaller than standard'
+            if value > maximum:
+                return maximum, 'Value is greater than standard'
+            if step is not None and value % step != 0:
+                return min(max(round(value / step) * step, minimum), maximum), f'Value is not a multiple of {step}'
+            return value, None
+
+        return check
+
+class Date(Rule):
+
+    """
+    Date
+    ----
+    Date string of 6 numbers separated by "/" (`Katla.get_datetime`)
+    """
+
+    def compile(self, default: Any) -> Check:
+        match = _DATE.fullmatch
+
+        def check(value: Any) -> tuple[Any, str | None]:
+            if not isinstance(value, str):
+                return default, 'Not str'
+            if match(value) is None:
+                return default, "Time format doesn't match"
+            return value, None
+
+        return check
+
+class Size(Rule):
+
+    """
+    Size
+    ----
+    Screen size, a list of [width, height] in the ranges or `full`
+    """
+
+    def __init__(self, width: Range, height: Range, full: str = 'FULL') -> None:
+        self.width  = width
+        self.height = height
+        self.full   = full
+
+    def compile(self, default: Any) -> Check:
+        full   = self.full
+        checks = (self.width.compile(default[0]), self.height.compile(default[1]))
+
+        def check(value: Any) -> tuple[Any, str | None]:
+            if value == full:
+                return value, None
+            if not isinstance(value, list):
+                return deepcopy(default), f'Not list or str Literal["{full}"]'
+            if len(value) != 2:
+                return deepcopy(default), 'List length is not appropriate'
+
+            size    = []
+            reasons = []
+
+            for i, (item, check_item) in enumerate(zip(value, checks)):
+                item, reason = check_item(item)
+                size.append(item)
+                if reason is not None:
+                    reasons.append(f'index: [{i}]: {reason}')
+
+            return size, ', '.join(reasons) or None
+
+        return check
+
+class Schema:
+
+    """
+    Schema
+    ------
+    Compiled schema of a JSON object. The fields are the keys of `default`, a field without a rule must have the type of its
+    default value, a nested object is compiled to a nested schema. Missing or invalid fields are repaired, unknown
+    fields are dropped.
+    """
+
+    def __init__(self, default: dict[str, Any], rules: dict[str, Any] | None = None) -> None:
+        """
+        `default`: Default data, every field of the data.
+        `rules`: `Rule` of the fields (a dict of rules for a nested object).
+        """
+        rules        = {} if rules is None else rules
+        self.default = default
+        self.checks  = {key: self.compile_field(value, rules.get(key)) for key, value in default.items()}
+
+    def __call__(self, data: Any) -> tuple[dict[str, Any], list[Repair]]:
+        return self.validate(data)
+
+    @staticmethod
+    def compile_field(default: Any, rule: Any) -> Check:
+        if isinstance(rule, Rule):
+            return rule.compile(default)
+
+        if isinstance(default, dict):
+            schema = Schema(default, rule)
+
+            def check_object(value: Any) -> tuple[Any, str | None]:
+                if not isinstance(value, dict):
+                    return deepcopy(default), 'Not dictionary or object'
+                value, repairs = schema.validate(value)
+                return value, ', '.join(f'{key}: {reason}' for key, reason in repairs) or None
+
+            return check_object
+
+        if isinstance(default, bool):
+            is_type, reason_type = (lambda value : isinstance(value, bool)), 'Not bool'
+        elif isinstance(default, int):
+            is_type, reason_type = is_int, 'Not int'
+        elif isinstance(default, float):
+            is_type, reason_type = is_number, 'Not float'
+        else:
+            is_type, reason_type = (lambda value, cls=type(default) : isinstance(value, cls)), f'Not {type(default).__name__}'
+
+        def check(value: Any) -> tuple[Any, str | None]:
+            if is_type(value):
+                return value, None
+            return deepcopy(default), reason_type
+
+        return check
+
+    def validate(self, data: Any) -> tuple[dict[str, Any], list[Repair]]:
+        """ the repaired data and the repairs ((field, reason) pairs) """
+        if not isinstance(data, dict):
+            return deepcopy(self.default), [('', 'Not dictionary or object')]
+
+        result  = {}
+        repairs = []
+
+        for key, check in self.checks.items():
+            if key not in data:
+                result[key] = deepcopy(self.default[key])
+                repairs.append((key, 'Missing key'))
+                continue
+
+            result[key], reason = check(data[key])
+
+            if reason is not None:
+                repairs.append((key, reason))
+
+        for key in sorted(data.keys() - self.checks.keys()):
+            repairs.append((key, 'Unknown key'))
+
+        return result, repairs
@@ -1,11 +1,13 @@
-from typing import Literal as _lt
+from heapq import nlargest as _nlargest
+from typing import Iterator as _it, Literal as _lt
 
 class Correction:
 
     """
     Correction
     ----------
-    Correction of errors/typos with ratio
+    Correction of errors/typos with ratio. The database is indexed by bigram (bigram -> word ids) so a lookup only
+    scores the words sharing enough bigrams with the string to reach the threshold, removed words are tombstoned.
     """
 
     def __init__(self, database: list[str], similarity_threshold: float = 0.5, similarity_ratio_method: _lt['set', 'manual'] = 'manual') -> None:
@@ -13,28 +15,90 @@ class Correction:
         `database`: Available dictionary database.
         `similarity_threshold`: Looking for a similarity threshold with minimum conditions. The lowest is 0 and the highest is 1.
         """
-        self.__database = database.copy()
-        self.__validation_database()
+        self.__source = None
+        self.__database: list[str] | None = None # the live words, built again after a removal
+        self.database = database
         self.similarity_threshold = similarity_threshold
         self.similarity_ratio_method = similarity_ratio_method
 
+    def __contains__(self, string: str) -> bool:
+        return bool(self.__ids.get(string))
+
+    def __len__(self) -> int:
+        return self.__alive_count
+
+    def __iter__(self) -> _it[str]:
+        return (data for i, data in enumerate(self.__words) if self.__alive[i])
+
     @property
     def database(self) -> list[str]:
+        if self.__database is None:
+            self.__database = list(self)
         return self.__database
 
     @database.setter
     def database(self, newdatabase: list[str]) -> None:
-        self.__database = newdatabase.copy()
+        # the same database again (a new round) only revives the removed words, the index doesn't change
+        if newdatabase is self.__source and len(newdatabase) == len(self.__words):
+            self.__alive = [True] * len(self.__words)
+            self.__alive_count = len(self.__words)
+            self.__database = None
+            self.__ids = {}
+            for i, data in enumerate(self.__words):
+                self.__ids.setdefault(data, []).append(i)
+            return
+
+        self.__source = newdatabase
+        self.__database = None
+        self.__words = newdatabase.copy()
         self.__validation_database()
+        self.__build_index()
 
     def __validation_database(self) -> None:
-        for item in self.__database:
+        for item in self.__words:
             assert isinstance(item, str), 'can only database a str'
 
+    def __build_index(self) -> None:
+        self.__index: dict[str, list[int]] = {}
+        self.__ids: dict[str, list[int]] = {}
+        self.__bits: dict[str, int] = {} # bigram -> bit of the masks
+        self.__masks: list[int] = [] # unique bigrams of every word
+        self.__sizes: list[int] = []
+        self.__set_sizes: list[int] = []
+        self.__alive = [True] * len(self.__words)
+        self.__alive_count = len(self.__words)
+
+        for i, data in enumerate(self.__words):
+            bigrams = self._create_bigrams(data.lower().strip())
+            unique = set(bigrams)
+
+            self.__ids.setdefault(data, []).append(i)
+            self.__sizes.append(len(bigrams))
+            self.__set_sizes.append(len(unique))
+
+            mask = 0
+
+            for item in unique:
+                self.__index.setdefault(item, []).append(i)
+                mask |= self.__bits.setdefault(item, 1 << len(self.__bits))
+
+            self.__masks.append(mask)
+
     def _create_bigrams(self, string: str) -> list[str]:
         """ create word bigrams from `string` """
         return [string[i] + string[i + 1] for i in range(len(string) - 1)]
 
+    def remove(self, string: str) -> None:
+        """ remove the first `string` of the database (tombstoned, the index is kept) """
+        ids = self.__ids.get(string)
+
+        if not ids:
+            raise ValueError(f'{string!r} not in database')
+
+        self.__alive[ids.pop(0)] = False
+        self.__alive_count -= 1
+        self.__database = None
+
     def get_similarity_ratio(self, string1: str, string2: str) -> float:
 
         """ get the similarity ratio of the two word `string` """
@@ -56,10 +120,68 @@ class Correction:
                         common += 1
 
                 return common / max(len(bigram1), len(bigram2))
-            
+
+            case _:
+                raise TypeError('invalid similarity_ratio_method')
+
+    def _get_candidates_ratio(self, string: str, threshold: float = 0) -> list[tuple[float, int]]:
+
+        """ similarity ratio of the database words sharing at least one bigram with `string` (the others are 0) and reaching `threshold`, sorted by word id """
+
+        bigrams = self._create_bigrams(string.lower().strip())
+        weights: dict[str, int] = {}
+
+        match self.similarity_ratio_method:
+
+            case 'set':
+                for item in bigrams:
+                    weights[item] = 1
+                size, sizes = len(weights), self.__set_sizes
+
+            case 'manual':
+                # every bigram of `string` counts once per occurrence in `string`, like the list scan
+                for item in bigrams:
+                    weights[item] = weights.get(item, 0) + 1
+                size, sizes = len(bigrams), self.__sizes
+
             case _:
                 raise TypeError('invalid similarity_ratio_method')
 
+        # a word sharing none of the rarest bigrams of `string` only shares the `rest`, it's skipped when that cannot
+        # reach the threshold. The others count their shared bigrams with the masks, level n has the bigrams of
+        # `string` weighted n or more
+        rest       = size
+        candidates : set[int] = set()
+        levels     : list[int] = []
+
+        for item, weight in weights.items():
+            bit = self.__bits.get(item, 0)
+            for level in range(weight):
+                if level == len(levels):
+                    levels.append(0)
+                levels[level] |= bit
+
+        for item in sorted(weights, key=lambda item : len(self.__index.get(item, ()))):
+            if rest / size < threshold:
+                break
+            candidates.update(self.__index.get(item, ()))
+            rest -= weights[item]
+
+        ratios = []
+
+        for i in candidates:
+            if self.__alive[i]:
+                mask   = self.__masks[i]
+                common = 0
+                for level in levels:
+                    common += (mask & level).bit_count()
+                ratio = common / max(size, sizes[i])
+                if ratio >= threshold:
+                    ratios.append((ratio, i))
+
+        ratios.sort(key=lambda item : item[1])
+        return ratios
+
     def get_most_ratio(self, string: str) -> tuple[float, str | None]:
 
         """ search for string values ​​from the database to be calculated by looking for possible similarities in question.
@@ -68,26 +190,29 @@ class Correction:
         max_similarity = 0.0
         most_similarity_str = ''
 
-        for data in self.database:
-            current_similarity = self.get_similarity_ratio(string, data)
+        for current_similarity, i in self._get_candidates_ratio(string):
 
             if current_similarity > max_similarity:
                 max_similarity = current_similarity
-                most_similarity_str = data
+                most_similarity_str = self.__words[i]
 
         return (max_similarity, (most_similarity_str if max_similarity >= self.similarity_threshold else None))
 
-    def get_list_most_ratio(self, string: str) -> list[tuple[float, str]] | list:
-
-        """ looks for a string value from the database to be calculated by looking for the possibility of similarity above the probability of similarity above `similarity_threshold` """
+    def get_list_most_ratio(self, string: str, limit: int | None = None) -> list[tuple[float, str]] | list:
 
-        most_similarity = []
+        """ looks for a string value from the database to be calculated by looking for the possibility of similarity above the probability of similarity above `similarity_threshold`.
+        `limit` only keeps the `limit` most similar (top-k), otherwise every one of them in the database order """
 
-        for data in self.database:
-            current_similarity = self.get_similarity_ratio(string, data)
+        if self.similarity_threshold <= 0:
+            # words without a common bigram pass a zero threshold too
+            most_similarity = [(self.get_similarity_ratio(string, data), data) for data in self]
+        else:
+            most_similarity = [(ratio, self.__words[i]) for ratio, i in self._get_candidates_ratio(string, self.similarity_threshold)]
 
-            if current_similarity >= self.similarity_threshold:
-                most_similarity.append((current_similarity, data))
+        if limit is not None:
+            # the most similar first, the earliest in the database on the same ratio
+            order = _nlargest(limit, range(len(most_similarity)), key=lambda i : (most_similarity[i][0], -i))
+            return [most_similarity[i] for i in order]
 
         return most_similarity
 
@@ -95,7 +220,7 @@ class Correction:
         """ this is the same as the `get_most_ratio` method, the difference is that it only gets the similarity string """
         return self.get_most_ratio(string)[1]
 
-    def get_list_correct(self, string: str) -> list[str] | list:
+    def get_list_correct(self, string: str, limit: int | None = None) -> list[str] | list:
         """ this is the same as the `d` method, the difference is that it only gets a list of similar strings """
-        list_ratio = self.get_list_most_ratio(string)
-        return [item[1] for item in list_ratio]
\ No newline at end of file
+        list_ratio = self.get_list_most_ratio(string, limit)
+        return [item[1] for item in list_ratio]
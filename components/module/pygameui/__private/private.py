@@ -1,5 +1,6 @@
 import pygame as pygame
 import typing as typing
+from collections import OrderedDict
 from . import const
 
 
@@ -14,6 +15,8 @@ class Private:
         """
 
         self.init_rect = pygame.Rect(0, 0, 0, 0)
+        self.srect_cache_size = 256
+        self.__srect_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
 
     def asserting(self, condition: bool, raise_exception: Exception) -> None:
 
@@ -107,6 +110,7 @@ class Private:
 
         """
         Draws a rectangle with various customizable properties such as transparency (alpha), border radius, and other styling.
+        An opaque rectangle is drawn directly, the transparent rectangle surfaces are reused from an LRU cache.
 
         Parameters:
             :param `surface`: screen surface, `pygame.display.set_mode((x, y))` or `pygame.Surface`.
@@ -134,11 +138,50 @@ class Private:
             pos = (rect[0], rect[1])
             size = (rect[2], rect[3])
 
-        surf = pygame.Surface(size, pygame.SRCALPHA)
-        pygame.draw.rect(surf, color, (0, 0, *size), width, border_radius, border_top_left_radius, border_top_right_radius, border_bottom_left_radius, border_bottom_right_radius)
-        surf.set_alpha(alpha)
+        borders = (border_radius, border_top_left_radius, border_top_right_radius, border_bottom_left_radius, border_bottom_right_radius)
+        color = pygame.Color(color)
+
+        # an opaque rectangle inside of the surface looks the same drawn straight on it, clipped like the rectangle
+        # surface (the rounded corners of pygame.draw.rect can go 1 pixel outside of the rectangle)
+        if alpha >= 255 and color.a == 255:
+            rect = pygame.Rect(pos, size)
+            clip = surface.get_clip()
+
+            if clip.contains(rect):
+                surface.set_clip(rect)
+                pygame.draw.rect(surface, color, rect, width, *borders)
+                surface.set_clip(clip)
+                return
+
+        size = (int(size[0]), int(size[1]))
+        key = (size, tuple(color), alpha, width, borders)
+        cache = self.__srect_cache
+        surf = cache.get(key)
+
+        if surf is None:
+            surf = cache[key] = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, (0, 0, *size), width, *borders)
+            surf.set_alpha(alpha)
+
+            if len(cache) > self.srect_cache_size:
+                cache.popitem(last=False)
+
+        else:
+            cache.move_to_end(key)
+
         surface.blit(surf, pos)
 
+    def clear_srect_cache(self) -> None:
+
+        """
+        Clears the cached surfaces of `draw_srect`.
+
+        Returns:
+            `None`
+        """
+
+        self.__srect_cache.clear()
+
 
 # Private Initialization
 prvt = Private()
\ No newline at end of file
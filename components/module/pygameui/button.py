@@ -24,6 +24,9 @@ from .__private.event import (
 from .__private.decorator import (
     ButtonInterface
 )
+from .textcache import (
+    render_text as _render_text
+)
 
 
 class border_radius:
@@ -253,8 +256,7 @@ class Button(ButtonInterface):
                     self.__surface_screen.blit(self.__scaled_image, self.__scaled_image.get_rect(**self.__get_rect_image_kwargs))
 
             if self.__text:
-                text_surface = self.__font.render(self.__text, self.__antialias_text, self.__text_color.active_color)
-                text_surface.set_alpha(self.__alpha_transparency)
+                text_surface = _render_text(self.__font, self.__text, self.__antialias_text, self.__text_color.active_color, alpha=self.__alpha_transparency)
 
                 if self.__get_rect_text_kwargs is None:
                     text_rect = text_surface.get_rect(center=self.__rect.center)
@@ -314,8 +316,7 @@ class Button(ButtonInterface):
                     self.__surface_screen.blit(self.__scaled_image, self.__scaled_image.get_rect(**self.__get_rect_image_kwargs))
 
             if self.__text:
-                text_surface = self.font.render(self.__text, self.__antialias_text, (self.__text_color.hover_color if (self.__text_color.hover_color is not None) and ismousehover else self.__text_color.inactive_color))
-                text_surface.set_alpha(self.__alpha_transparency)
+                text_surface = _render_text(self.font, self.__text, self.__antialias_text, (self.__text_color.hover_color if (self.__text_color.hover_color is not None) and ismousehover else self.__text_color.inactive_color), alpha=self.__alpha_transparency)
 
                 if self.__get_rect_text_kwargs is None:
                     text_rect = text_surface.get_rect(center=self.rect.center)
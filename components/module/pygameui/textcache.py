@@ -0,0 +1,107 @@
+from collections import OrderedDict as _OrderedDict
+from .__private.private import (
+    pygame,
+    typing,
+    prvt as _prvt
+)
+from .__private.const import (
+    PygameColorValue as _PygameColorValue
+)
+
+
+class TextCache:
+
+    """ TextCache - LRU cache of the rendered text surfaces. The surfaces are shared, don't edit them (pass `alpha` for a transparent text) """
+
+    def __init__(self, maxsize: int = 512) -> None:
+
+        """
+        Parameters:
+            :param `maxsize`: maximum cached surfaces, the least recently used are dropped.
+        """
+
+        _prvt.asserting(isinstance(maxsize, int), TypeError(f'maxsize: must be int not {_prvt.get_type(maxsize)}'))
+        _prvt.asserting(maxsize > 0, ValueError(f'maxsize: illegal below 1 -> {maxsize}'))
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__surfaces: _OrderedDict[tuple, pygame.Surface] = _OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color: _PygameColorValue, background: _PygameColorValue | None = None, alpha: int | None = None) -> pygame.Surface:
+
+        """
+        Renders the text like `font.render`, the surface of the same (font, text, antialias, color, background, alpha) is reused.
+
+        Parameters:
+            :param `font`: font text.
+            :param `text`: text to render.
+            :param `antialias`: antialias text.
+            :param `color`: text color.
+            :param `background`: background color, None for a transparent background.
+            :param `alpha`: alpha of the surface (`set_alpha`), None or 255 for an opaque text.
+
+        Returns:
+            `pygame.Surface`
+        """
+
+        if alpha == 255:
+            alpha = None
+
+        # the font itself is in the key (not the id), a new font never reuses the surfaces of a collected one
+        key = (font, text, bool(antialias), self.__color_key(color), self.__color_key(background), alpha)
+        surfaces = self.__surfaces
+
+        surface = surfaces.get(key)
+
+        if surface is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+
+        if alpha is None:
+            surface = font.render(text, antialias, color, background)
+        else:
+            # a copy of the opaque surface, the opaque one is shared by the other draws
+            surface = self.render(font, text, antialias, color, background).copy()
+            surface.set_alpha(alpha)
+
+        surfaces[key] = surface
+
+        if len(surfaces) > self.maxsize:
+            surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self, font: pygame.font.Font | None = None) -> None:
+
+        """
+        Clears the cached surfaces (only the surfaces of `font` if it's given). Used when the fonts are created again.
+
+        Parameters:
+            :param `font`: font of the surfaces to clear.
+
+        Returns:
+            `None`
+        """
+
+        if font is None:
+            self.__surfaces.clear()
+        else:
+            for key in [key for key in self.__surfaces if key[0] is font]:
+                del self.__surfaces[key]
+
+    def __color_key(self, color: typing.Any) -> typing.Hashable:
+        # the theme colors are lists and pygame.Color is not hashable
+        if isinstance(color, (list, pygame.Color)):
+            return tuple(color)
+        return color
+
+
+text_cache = TextCache()
+render_text = text_cache.render
@@ -12,28 +12,68 @@ from .__private.decorator import (
 from PIL import (
     Image as _Image
 )
+from collections import (
+    OrderedDict as _OrderedDict
+)
+from threading import (
+    Condition as _Condition,
+    Lock as _Lock,
+    Thread as _Thread
+)
 
 
 class GIF(ElementInterface):
 
     """ GIF - Load a gif image and converting it to surface pygame """
 
-    def __init__(self, gif_path: _Path, rect: pygame.Rect, frame_delay: int = 50) -> None:
+    def __init__(
+
+            self,
+            gif_path: _Path,
+            rect: pygame.Rect,
+            frame_delay: int = 50,
+            lazy: bool = False,
+            max_frames: int | None = None,
+            max_bytes: int | None = None,
+            prefetch: int = 0
+
+        ) -> None:
 
         """
         Parameters:
             :param `gif_path`: gift path.
             :param `rect`: rect gif.
             :param `frame_delay`: delay per frame.
+            :param `lazy`: decodes and scales a frame when it's shown first instead of every frame up front. The frames are
+                           decoded again in the size of the rect when it changes.
+            :param `max_frames`: (lazy) maximum cached frames, the least recently shown are dropped. None for no limit.
+            :param `max_bytes`: (lazy) maximum bytes of the cached frames. None for no limit.
+            :param `prefetch`: (lazy) frames decoded ahead of the shown frame on a worker thread, the last frame stays on the
+                               screen while the next isn't decoded yet. 0 decodes a frame when it's shown.
         """
 
         self.frame_delay = frame_delay
+        self.lazy = lazy
+        self.max_frames = max_frames
+        self.max_bytes = max_bytes
+        self.prefetch = prefetch
 
         self.__rect = rect
         self.__gif_path = gif_path
         self.__gif = _Image.open(self.gif_path)
+        self.__n_frames: int = self.__gif.n_frames
         self.__frames: list[pygame.Surface] = []
 
+        self.__frame: pygame.Surface | None = None
+        self.__cache: _OrderedDict[int, pygame.Surface] = _OrderedDict()
+        self.__cache_size: tuple[int, int] | None = None
+        self.__cache_bytes: int = 0
+        self.__cache_lock = _Lock()
+        self.__image_lock = _Lock()
+        self.__prefetch_queue: list[int] = []
+        self.__prefetch_condition = _Condition()
+        self.__prefetch_thread: _Thread | None = None
+
         self.convert_gif()
 
         self.__last_update_time: int = pygame.time.get_ticks()
@@ -62,6 +102,22 @@ class GIF(ElementInterface):
     @property
     def frame_delay(self) -> int:
         return self.__frame_delay
+
+    @property
+    def lazy(self) -> bool:
+        return self.__lazy
+
+    @property
+    def max_frames(self) -> int | None:
+        return self.__max_frames
+
+    @property
+    def max_bytes(self) -> int | None:
+        return self.__max_bytes
+
+    @property
+    def prefetch(self) -> int:
+        return self.__prefetch
     
     @rect.setter
     def rect(self, rect: pygame.Rect) -> None:
@@ -74,6 +130,28 @@ class GIF(ElementInterface):
         _prvt.asserting(delay >= 0, ValueError(f'frame_delay -> delay (setter): illegal below 0 -> {delay}'))
         self.__frame_delay = delay
 
+    @lazy.setter
+    def lazy(self, boolean: bool) -> None:
+        self.__lazy = bool(boolean)
+
+    @max_frames.setter
+    def max_frames(self, frames: int | None) -> None:
+        _prvt.asserting(isinstance(frames, int | None), TypeError(f'max_frames -> frames (setter): must be int or None not {_prvt.get_type(frames)}'))
+        _prvt.asserting(frames is None or frames > 0, ValueError(f'max_frames -> frames (setter): illegal below 1 -> {frames}'))
+        self.__max_frames = frames
+
+    @max_bytes.setter
+    def max_bytes(self, size: int | None) -> None:
+        _prvt.asserting(isinstance(size, int | None), TypeError(f'max_bytes -> size (setter): must be int or None not {_prvt.get_type(size)}'))
+        _prvt.asserting(size is None or size > 0, ValueError(f'max_bytes -> size (setter): illegal below 1 -> {size}'))
+        self.__max_bytes = size
+
+    @prefetch.setter
+    def prefetch(self, frames: int) -> None:
+        _prvt.asserting(isinstance(frames, int), TypeError(f'prefetch -> frames (setter): must be int not {_prvt.get_type(frames)}'))
+        _prvt.asserting(frames >= 0, ValueError(f'prefetch -> frames (setter): illegal below 0 -> {frames}'))
+        self.__prefetch = frames
+
     def copy(self, **kwargs) -> 'GIF':
 
         """
@@ -118,20 +196,52 @@ class GIF(ElementInterface):
         return {
             'gif_path': self.__gif_path,
             'rect': self.__rect,
-            'frame_delay': self.__frame_delay
+            'frame_delay': self.__frame_delay,
+            'lazy': self.__lazy,
+            'max_frames': self.__max_frames,
+            'max_bytes': self.__max_bytes,
+            'prefetch': self.__prefetch
         }
 
     def get_frames(self) -> list[pygame.Surface]:
 
         """
-        Get a list surfaces.
+        Get a list surfaces. (Only the cached frames in order if lazy).
 
         Returns:
             `list[pygame.Surface]`
         """
 
+        if self.__lazy:
+            with self.__cache_lock:
+                return [self.__cache[frame] for frame in sorted(self.__cache)]
+
         return self.__frames
 
+    def get_frame(self, frame: int) -> pygame.Surface:
+
+        """
+        Get a frame surface, a lazy gif decodes it if it's not cached.
+
+        Parameters:
+            :param `frame`: frame index.
+
+        Returns:
+            `pygame.Surface`
+        """
+
+        if not self.__lazy:
+            return self.__frames[frame]
+
+        size = self.__frame_size()
+        surface = self.__get_cached(frame, size)
+
+        if surface is None:
+            surface = self.__decode(frame, size)
+            self.__put_cached(frame, size, surface)
+
+        return surface
+
     def get_Image(self):
 
         """
@@ -146,7 +256,7 @@ class GIF(ElementInterface):
     def convert_gif(self) -> None:
 
         """
-        Reads frame data to frame surface pygame.
+        Reads frame data to frame surface pygame. (Clears the cached frames if lazy, they're decoded when shown).
         
         Returns:
             `None`
@@ -155,29 +265,175 @@ class GIF(ElementInterface):
         self.__frames.clear()
         self.__frame_index = 0
 
-        for frame in range(self.__gif.n_frames):
+        if self.__lazy:
+            self.clear_cache()
+            return
+
+        size = self.__frame_size()
+
+        for frame in range(self.__n_frames):
+            self.__frames.append(self.__decode(frame, size))
+
+    def clear_cache(self) -> None:
+
+        """
+        Clears the cached frames of a lazy gif.
+
+        Returns:
+            `None`
+        """
+
+        with self.__cache_lock:
+            self.__cache.clear()
+            self.__cache_size = None
+            self.__cache_bytes = 0
+
+        self.__frame = None
+
+    def __frame_size(self) -> tuple[int, int]:
+
+        """
+        Private method. Size of the frames for the current rect.
+
+        Returns:
+            `tuple[int, int]`
+        """
+
+        if self.rect.width <= 0 and self.rect.height <= 0:
+            return self.__gif.size
+        elif self.rect.width <= 0:
+            return (self.__gif.size[0], self.rect.height)
+        elif self.rect.height <= 0:
+            return (self.rect.width, self.__gif.size[1])
+
+        return self.rect.size
+
+    def __decode(self, frame: int, size: tuple[int, int]) -> pygame.Surface:
+
+        """
+        Private method. Decodes and scales a frame to a surface.
+
+        Parameters:
+            :param `frame`: frame index.
+            :param `size`: frame size.
+
+        Returns:
+            `pygame.Surface`
+        """
+
+        # the image is shared by the render and the prefetch thread, only one can seek it
+        with self.__image_lock:
             self.__gif.seek(frame)
             frame_image = self.__gif.convert('RGBA')
 
-            if self.rect.width <= 0 and self.rect.height <= 0:
-                pass
+        if frame_image.size != size:
+            frame_image = frame_image.resize(size)
+
+        return pygame.image.fromstring(
+            frame_image.tobytes(),
+            frame_image.size,
+            frame_image.mode
+        )
+
+    def __get_cached(self, frame: int, size: tuple[int, int]) -> pygame.Surface | None:
+
+        """
+        Private method. Gets a cached frame, the cache is cleared if the frames have another size.
+
+        Parameters:
+            :param `frame`: frame index.
+            :param `size`: frame size.
+
+        Returns:
+            `pygame.Surface` or `None`
+        """
+
+        with self.__cache_lock:
+            if self.__cache_size != size:
+                self.__cache.clear()
+                self.__cache_size = size
+                self.__cache_bytes = 0
+                return None
+
+            surface = self.__cache.get(frame)
+
+            if surface is not None:
+                self.__cache.move_to_end(frame)
+
+            return surface
+
+    def __put_cached(self, frame: int, size: tuple[int, int], surface: pygame.Surface) -> None:
+
+        """
+        Private method. Caches a frame, the least recently shown frames are dropped over the limits.
+
+        Parameters:
+            :param `frame`: frame index.
+            :param `size`: frame size.
+            :param `surface`: frame surface.
+
+        Returns:
+            `None`
+        """
+
+        with self.__cache_lock:
+            if self.__cache_size != size or frame in self.__cache:
+                return
+
+            self.__cache[frame] = surface
+            self.__cache_bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+            while len(self.__cache) > 1 and (
+                (self.__max_frames is not None and len(self.__cache) > self.__max_frames) or
+                (self.__max_bytes is not None and self.__cache_bytes > self.__max_bytes)
+            ):
+                _, dropped = self.__cache.popitem(last=False)
+                self.__cache_bytes -= dropped.get_width() * dropped.get_height() * dropped.get_bytesize()
+
+    def __request_prefetch(self, frame: int) -> None:
+
+        """
+        Private method. Queues the frames from `frame` to be decoded on the prefetch thread.
+
+        Parameters:
+            :param `frame`: first frame index.
 
-            elif self.rect.width <= 0:
-                frame_image = frame_image.resize((self.__gif.size[0], self.rect.height))
+        Returns:
+            `None`
+        """
 
-            elif self.rect.height <= 0:
-                frame_image = frame_image.resize((self.rect.width, self.__gif.size[1]))
+        if not self.__lazy or self.__prefetch <= 0:
+            return
 
-            else:
-                frame_image = frame_image.resize((self.rect.width, self.rect.height))
+        with self.__prefetch_condition:
+            self.__prefetch_queue = [(frame + i) % self.__n_frames for i in range(min(self.__prefetch + 1, self.__n_frames))]
 
-            self.__frames.append(
-                pygame.image.fromstring(
-                    frame_image.tobytes(),
-                    frame_image.size,
-                    frame_image.mode
-                )
-            )
+            if self.__prefetch_thread is None:
+                self.__prefetch_thread = _Thread(target=self.__run_prefetch, name='pygameui-gif-prefetch', daemon=True)
+                self.__prefetch_thread.start()
+
+            self.__prefetch_condition.notify()
+
+    def __run_prefetch(self) -> None:
+
+        """
+        Private method. Prefetch thread, decodes the queued frames that aren't cached.
+
+        Returns:
+            `None`
+        """
+
+        while True:
+            with self.__prefetch_condition:
+                while not self.__prefetch_queue:
+                    self.__prefetch_condition.wait()
+
+                frame = self.__prefetch_queue.pop(0)
+
+            size = self.__frame_size()
+
+            if self.__get_cached(frame, size) is None:
+                self.__put_cached(frame, size, self.__decode(frame, size))
 
     def reset_frame(self) -> None:
 
@@ -192,6 +448,8 @@ class GIF(ElementInterface):
         self.__last_update_time = pygame.time.get_ticks()
         self.__time_played = None
 
+        self.__request_prefetch(0)
+
     def draw_and_update(self, surface_screen: typing.Optional[pygame.Surface]) -> pygame.Surface:
 
         """
@@ -212,10 +470,25 @@ class GIF(ElementInterface):
             self.__time_played = current_time
 
         if current_time - self.__last_update_time > self.frame_delay:
-            self.__frame_index = ((current_time - self.__time_played) // self.frame_delay) % len(self.__frames)
+            self.__frame_index = ((current_time - self.__time_played) // self.frame_delay) % (self.__n_frames if self.__lazy else len(self.__frames))
             self.__last_update_time = current_time
 
-        frame = self.__frames[self.__frame_index]
+        if self.__lazy:
+            size = self.__frame_size()
+            frame = self.__get_cached(self.__frame_index, size)
+
+            if frame is None:
+                # the prefetch thread is behind, the last frame stays until the frame is decoded
+                if self.__prefetch > 0 and self.__frame is not None and self.__frame.get_size() == size:
+                    frame = self.__frame
+                else:
+                    frame = self.get_frame(self.__frame_index)
+
+            self.__frame = frame
+            self.__request_prefetch(self.__frame_index)
+
+        else:
+            frame = self.__frames[self.__frame_index]
 
         if surface_screen is not None:
             surface_screen.blit(frame, self.rect.topleft)
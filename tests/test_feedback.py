@@ -0,0 +1,65 @@
+import random
+from components.katla_components.feedback import COLORS, Feedback, decode_colors, encode_colors, score
+from components.katla_components.patterns import score_block, words_to_array
+
+SHORT = {'r': 'red', 'y': 'yellow', 'g': 'green'}
+
+def reference_score(guess: str, answer: str) -> int:
+    """ the usual two-pass scorer: greens first, then yellows from the letters the greens left """
+    colors    = ['red'] * len(guess)
+    remaining = list(answer)
+
+    for i, (guess_char, answer_char) in enumerate(zip(guess, answer)):
+        if guess_char == answer_char:
+            colors[i]    = 'green'
+            remaining[i] = None
+
+    for i, guess_char in enumerate(guess):
+        if colors[i] != 'green' and guess_char in remaining:
+            colors[i] = 'yellow'
+            remaining[remaining.index(guess_char)] = None
+
+    return encode_colors(colors)
+
+def random_words(rng: random.Random, count: int, word_length: int, letters: str) -> list[str]:
+    return [''.join(rng.choice(letters) for _ in range(word_length)) for _ in range(count)]
+
+def test_duplicate_letters():
+    cases = [
+        ('SPEED', 'ABIDE', 'rryry'), # the second E has no E left
+        ('EERIE', 'THEME', 'yrrrg'), # the green E takes one E, the first E takes the other
+        ('LLAMA', 'HALLO', 'yyyrr'),
+        ('ABBEY', 'BABES', 'yyggr'),
+        ('AAAAA', 'ABACA', 'grgrg'),
+        ('ALLEY', 'LLAMA', 'ygyrr'),
+        ('KATLA', 'KATLA', 'ggggg')
+    ]
+
+    for guess, answer, expected in cases:
+        colors = tuple(SHORT[char] for char in expected)
+        assert decode_colors(score(guess, answer), len(guess)) == colors, (guess, answer)
+        assert decode_colors(reference_score(guess, answer), len(guess)) == colors, (guess, answer)
+
+def test_encode_decode():
+    for code in range(3 ** 5):
+        assert encode_colors(decode_colors(code, 5)) == code
+
+    feedback = Feedback.from_guess('SPEED', 'ABIDE')
+    assert list(feedback) == [('S', 'red'), ('P', 'red'), ('E', 'yellow'), ('E', 'red'), ('D', 'yellow')]
+    assert feedback == Feedback.from_colors('SPEED', feedback.colors)
+    assert set(feedback.colors) <= set(COLORS)
+
+def test_score_matches_score_block():
+    rng = random.Random(0)
+
+    # a small alphabet makes most pairs share (and repeat) letters
+    for word_length in range(4, 7):
+        guesses = random_words(rng, 150, word_length, 'ABCDE')
+        answers = random_words(rng, 150, word_length, 'ABCDE')
+        block   = score_block(words_to_array(guesses, word_length), words_to_array(answers, word_length))
+
+        for i, guess in enumerate(guesses):
+            for j, answer in enumerate(answers):
+                code = score(guess, answer)
+                assert code == reference_score(guess, answer), (guess, answer)
+                assert code == block[i, j], (guess, answer)